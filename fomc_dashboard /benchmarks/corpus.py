@@ -0,0 +1,168 @@
+import os
+
+import numpy as np
+
+from fomc_dashboard.modules.sentiment import dovish_terms, hawkish_terms
+
+# Vocabulary of the synthetic FOMC-like text
+SUBJECTS = np.array([
+    "The Committee", "Participants", "Several participants", "The staff", "Members", "Most participants",
+    "A few participants", "The Board", "Policymakers", "The Chair",
+])
+VERBS = np.array([
+    "noted that", "judged that", "observed that", "agreed that", "expected that", "emphasized that",
+    "anticipated that", "indicated that", "remarked that", "assessed that",
+])
+TOPICS = np.array([
+    "economic activity", "household spending", "the labor market", "financial conditions", "business investment",
+    "energy prices", "longer-term yields", "consumer price inflation", "the housing sector", "credit conditions",
+    "core PCE inflation", "payroll gains", "the unemployment rate", "global growth", "the federal funds rate",
+])
+OUTCOMES = np.array([
+    "had moderated", "remained solid", "had softened", "was expanding at a moderate pace", "remained elevated",
+    "had eased somewhat", "was consistent with the Committee's objectives", "warranted careful monitoring",
+    "had stabilized", "had strengthened", "posed risks to the outlook", "was likely to persist",
+])
+
+# Share of sentences that carry a hawkish or dovish lexicon term
+LEXICON_SHARE = 0.3
+
+EMBEDDING_DIMENSION = 384
+EMBEDDING_BLOCK = 100_000
+
+
+def synthetic_chunks(n_chunks, sentences_per_chunk=3, seed=0):
+    """
+    Generate FOMC-like text chunks (one retrievable passage each).
+
+    Args:
+        n_chunks (int): Number of chunks.
+        sentences_per_chunk (int, optional): Sentences per chunk. Defaults to 3.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        list: Chunk texts; the same arguments always give the same corpus.
+    """
+    rng = np.random.default_rng(seed)
+    lexicon = np.array(list(hawkish_terms) + list(dovish_terms))
+    n_sentences = n_chunks * sentences_per_chunk
+
+    topics = rng.choice(TOPICS, n_sentences).astype(object)
+    with_term = rng.random(n_sentences) < LEXICON_SHARE
+    topics[with_term] = rng.choice(lexicon, int(with_term.sum()))
+    sentences = (
+        rng.choice(SUBJECTS, n_sentences).astype(object) + " "
+        + rng.choice(VERBS, n_sentences).astype(object) + " "
+        + topics + " "
+        + rng.choice(OUTCOMES, n_sentences).astype(object) + "."
+    )
+    return [" ".join(row) for row in sentences.reshape(n_chunks, sentences_per_chunk)]
+
+
+def synthetic_embeddings(n_vectors, dimension=EMBEDDING_DIMENSION, seed=0):
+    """
+    Generate unit-length random embeddings, block by block to bound peak memory.
+
+    Args:
+        n_vectors (int): Number of vectors.
+        dimension (int, optional): Embedding size. Defaults to EMBEDDING_DIMENSION.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        numpy.ndarray: float32 array of shape (n_vectors, dimension).
+    """
+    rng = np.random.default_rng(seed)
+    embeddings = np.empty((n_vectors, dimension), dtype=np.float32)
+    for start in range(0, n_vectors, EMBEDDING_BLOCK):
+        block = rng.standard_normal((min(EMBEDDING_BLOCK, n_vectors - start), dimension), dtype=np.float32)
+        block /= np.linalg.norm(block, axis=1, keepdims=True)
+        embeddings[start:start + len(block)] = block
+    return embeddings
+
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _wrap(text, width=90):
+    lines, line = [], ""
+    for word in text.split():
+        if line and len(line) + 1 + len(word) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def write_pdf(path, pages, lines_per_page=55):
+    """
+    Write a plain-text PDF (Helvetica, US Letter) without external libraries.
+
+    Args:
+        path (str): Output file.
+        pages (list): Text of each page; long text is wrapped and cut at ``lines_per_page``.
+        lines_per_page (int, optional): Lines kept per page. Defaults to 55.
+    """
+    objects = []
+    page_ids = []
+    # Objects 1-3 are the catalog, the page tree and the font; pages follow in pairs (page, content)
+    for i, text in enumerate(pages):
+        lines = _wrap(text)[:lines_per_page]
+        stream = "BT /F1 10 Tf 12 TL 50 750 Td " + " ".join(f"({_pdf_escape(line)}) '" for line in lines) + " ET"
+        page_id, content_id = 4 + 2 * i, 5 + 2 * i
+        page_ids.append(page_id)
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ] + objects
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+
+    with open(path, "wb") as f:
+        f.write(body)
+
+
+def generate_pdfs(directory, n_documents, pages_per_document=10, seed=0):
+    """
+    Write synthetic FOMC-like PDF documents.
+
+    Args:
+        directory (str): Output directory (created if missing).
+        n_documents (int): Number of PDFs.
+        pages_per_document (int, optional): Pages per PDF. Defaults to 10.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        list: Paths of the written PDFs.
+    """
+    os.makedirs(directory, exist_ok=True)
+    # Six three-sentence chunks fill most of a page
+    chunks = synthetic_chunks(n_documents * pages_per_document * 6, seed=seed)
+    paths = []
+    for document in range(n_documents):
+        pages = [
+            " ".join(chunks[(document * pages_per_document + page) * 6:(document * pages_per_document + page + 1) * 6])
+            for page in range(pages_per_document)
+        ]
+        path = os.path.join(directory, f"synthetic_{document:04d}.pdf")
+        write_pdf(path, pages)
+        paths.append(path)
+    return paths
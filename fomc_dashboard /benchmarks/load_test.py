@@ -0,0 +1,190 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+import numpy as np
+
+# Questions cycled through when no question file is given
+DEFAULT_QUESTIONS = [
+    "What did the FOMC decide about interest rates?",
+    "How has the Committee's view on inflation changed?",
+    "What is the outlook for GDP growth?",
+    "What did the Fed say about the labor market?",
+    "Is the Committee expecting further rate cuts?",
+    "How did the FOMC describe financial conditions?",
+    "What are the risks to the economic outlook?",
+    "What was the vote on the policy decision?",
+]
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def free_port():
+    """Return a TCP port that is free on localhost."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def summarize(latencies, statuses, elapsed):
+    """
+    Summarize a load-test run.
+
+    Args:
+        latencies (list): Per-request latency in seconds (successful requests only).
+        statuses (list): HTTP status per request (0 for connection errors).
+        elapsed (float): Wall-clock duration in seconds.
+
+    Returns:
+        dict: Request counts, throughput and latency percentiles in milliseconds.
+    """
+    latencies_ms = np.asarray(latencies) * 1000
+    statuses = np.asarray(statuses)
+    summary = {
+        "requests": int(len(statuses)),
+        "succeeded": int(np.sum(statuses == 200)),
+        "errors": int(np.sum(statuses != 200)),
+        "status_counts": {str(code): int(count) for code, count in zip(*np.unique(statuses, return_counts=True))},
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(np.sum(statuses == 200) / elapsed, 2) if elapsed else 0.0,
+    }
+    if len(latencies_ms):
+        summary["latency_ms"] = {f"p{p}": round(float(np.percentile(latencies_ms, p)), 2) for p in PERCENTILES}
+        summary["latency_ms"]["mean"] = round(float(latencies_ms.mean()), 2)
+        summary["latency_ms"]["max"] = round(float(latencies_ms.max()), 2)
+    return summary
+
+
+async def run_load(url, questions, n_requests, concurrency, timeout=60):
+    """
+    Send ``n_requests`` questions with ``concurrency`` requests in flight.
+
+    Returns:
+        dict: See ``summarize``.
+    """
+    latencies, statuses = [], []
+    counter = iter(range(n_requests))
+
+    async def worker(session):
+        for i in counter:
+            payload = {"question": questions[i % len(questions)]}
+            start = time.perf_counter()
+            try:
+                async with session.post(url, json=payload) as response:
+                    await response.read()
+                    status = response.status
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                status = 0
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            statuses.append(status)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return summarize(latencies, statuses, elapsed)
+
+
+async def wait_until_healthy(base_url, timeout=180):
+    """Poll ``/readyz`` until the server is warm or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(f"{base_url}/readyz") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.25)
+    raise TimeoutError(f"{base_url} did not become healthy within {timeout}s")
+
+
+def spawn_servers(args):
+    """
+    Start the mock LLM and the answer API as subprocesses on free ports.
+
+    Returns:
+        tuple: (API base URL, list of Popen handles).
+    """
+    llm_port, api_port = free_port(), free_port()
+    env = dict(os.environ, AZURE_OPENAI_API_KEY="local")
+    if args.no_semantic_cache:
+        # Cycled questions would otherwise be answered from the cache after the first round
+        env["FOMC_SEMANTIC_CACHE"] = "0"
+    mock = subprocess.Popen(
+        [sys.executable, "-m", "fomc_dashboard.benchmarks.mock_llm", "--port", str(llm_port),
+         "--latency-ms", str(args.mock_latency_ms), "--seed", "0"],
+        env=env,
+    )
+    api = subprocess.Popen(
+        [sys.executable, "-m", "fomc_dashboard.modules.qa_api", "--port", str(api_port),
+         "--llm-endpoint", f"http://127.0.0.1:{llm_port}",
+         "--index-file", args.index_file, "--metadata-file", args.metadata_file],
+        env=env,
+    )
+    return f"http://127.0.0.1:{api_port}", [mock, api]
+
+
+def print_summary(summary):
+    print(f"Requests:    {summary['requests']} ({summary['errors']} errors, statuses {summary['status_counts']})")
+    print(f"Elapsed:     {summary['elapsed_s']:.2f} s")
+    print(f"Throughput:  {summary['throughput_rps']:.2f} req/s")
+    if "latency_ms" in summary:
+        latency = summary["latency_ms"]
+        print("Latency ms:  " + "  ".join(f"{key} {value:.1f}" for key, value in latency.items()))
+
+
+async def main(args):
+    questions = DEFAULT_QUESTIONS
+    if args.questions:
+        with open(args.questions, "r", encoding="utf-8") as f:
+            questions = [line.strip() for line in f if line.strip()]
+
+    processes = []
+    base_url = args.url
+    if args.spawn:
+        base_url, processes = spawn_servers(args)
+    try:
+        await wait_until_healthy(base_url)
+        url = f"{base_url}/v1/{args.endpoint}"
+        if args.warmup:
+            await run_load(url, questions, args.warmup, min(args.concurrency, args.warmup))
+        summary = await run_load(url, questions, args.requests, args.concurrency)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+    summary.update(endpoint=args.endpoint, concurrency=args.concurrency)
+    print_summary(summary)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return summary
+
+
+# Example usage: python -m fomc_dashboard.benchmarks.load_test --spawn --requests 500 --concurrency 32
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test for the FOMC answer API")
+    parser.add_argument("--url", default="http://127.0.0.1:8600", help="API base URL (ignored with --spawn)")
+    parser.add_argument("--spawn", action="store_true", help="Start the mock LLM and the API locally")
+    parser.add_argument("--endpoint", choices=["answer", "retrieve"], default="answer")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=10, help="Requests sent before measuring")
+    parser.add_argument("--questions", help="File with one question per line")
+    parser.add_argument("--mock-latency-ms", type=float, default=800)
+    parser.add_argument("--no-semantic-cache", action="store_true", help="Disable the API's semantic answer cache")
+    parser.add_argument("--index-file", default="faiss_index")
+    parser.add_argument("--metadata-file", default="metadata.pkl")
+    parser.add_argument("--json", help="Write the summary to this JSON file")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import random
+import time
+
+from aiohttp import web
+
+# Default simulated completion latency (lognormal around the median)
+MEDIAN_LATENCY_MS = 800
+LATENCY_SIGMA = 0.35
+
+
+def create_app(median_latency_ms=MEDIAN_LATENCY_MS, sigma=LATENCY_SIGMA, error_rate=0.0, throttle_rate=0.0, seed=None):
+    """
+    Build a stand-in for the Azure OpenAI chat completions endpoint.
+
+    Responses arrive after a lognormal delay and echo the start of the
+    question, with token usage estimated at four characters per token.
+
+    Args:
+        median_latency_ms (float, optional): Median completion latency. Defaults to MEDIAN_LATENCY_MS.
+        sigma (float, optional): Lognormal spread. Defaults to LATENCY_SIGMA.
+        error_rate (float, optional): Fraction of requests answered with HTTP 500.
+        throttle_rate (float, optional): Fraction of requests answered with HTTP 429.
+        seed (int, optional): Random seed.
+
+    Returns:
+        aiohttp.web.Application: The application.
+    """
+    rng = random.Random(seed)
+    app = web.Application()
+    app["requests"] = 0
+
+    async def chat_completions(request):
+        body = await request.json()
+        app["requests"] += 1
+        await asyncio.sleep(median_latency_ms / 1000 * rng.lognormvariate(0, sigma))
+
+        draw = rng.random()
+        if draw < throttle_rate:
+            return web.json_response(
+                {"error": {"code": "429", "message": "Rate limit exceeded"}}, status=429, headers={"Retry-After": "1"}
+            )
+        if draw < throttle_rate + error_rate:
+            return web.json_response({"error": {"code": "500", "message": "Internal error"}}, status=500)
+
+        prompt = "\n".join(message["content"] for message in body["messages"])
+        question = body["messages"][-1]["content"].split("Question:")[-1].strip()
+        answer = f"(mock) {question[:200]}"
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(answer) // 4
+        return web.json_response({
+            "id": f"mock-{app['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.match_info["deployment"],
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": answer},
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    app.router.add_post("/openai/deployments/{deployment}/chat/completions", chat_completions)
+    return app
+
+
+# Example usage: python -m fomc_dashboard.benchmarks.mock_llm --port 8700 --latency-ms 800
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for Azure OpenAI chat completions")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--latency-ms", type=float, default=MEDIAN_LATENCY_MS)
+    parser.add_argument("--sigma", type=float, default=LATENCY_SIGMA)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    web.run_app(
+        create_app(args.latency_ms, args.sigma, args.error_rate, args.throttle_rate, args.seed),
+        host=args.host,
+        port=args.port,
+        print=None,
+    )
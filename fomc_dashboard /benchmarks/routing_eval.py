@@ -0,0 +1,206 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import faiss
+import numpy as np
+
+from fomc_dashboard.benchmarks.corpus import synthetic_chunks, synthetic_embeddings
+from fomc_dashboard.benchmarks.run_benchmarks import time_calls
+from fomc_dashboard.modules.index_shards import ShardedIndex, build_shards
+from fomc_dashboard.modules.meeting_calendar import get_calendar
+from fomc_dashboard.modules.query_parser import parse_query
+
+QUESTIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "routing_questions.jsonl")
+
+# Reference date of the labels ("the latest meeting" is the last one before it)
+EVAL_TODAY = "2024-12-31"
+
+# Synthetic corpus: minutes chunks per meeting, plus a quarter as many SEP chunks at SEP meetings
+CHUNKS_PER_MEETING = 2000
+SEP_SHARE = 0.25
+
+
+def load_questions(path=QUESTIONS_FILE):
+    """
+    Read the labelled questions, one JSON object per line.
+
+    Each has ``question``, ``route`` ("meeting", "years" or "global"),
+    ``meeting`` or ``years`` for routed questions, and ``doc_types``.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def synthetic_records(meetings, sep_meetings, chunks_per_meeting=CHUNKS_PER_MEETING, seed=0):
+    """
+    Build a dated synthetic corpus covering the given meetings.
+
+    Returns:
+        tuple: (records, embeddings), records sorted by meeting and document type.
+    """
+    counts = [
+        (str(meeting), doc_type, n)
+        for meeting in meetings
+        for doc_type, n in (("minutes", chunks_per_meeting), ("sep", int(chunks_per_meeting * SEP_SHARE)))
+        if doc_type == "minutes" or meeting in sep_meetings
+    ]
+    texts = synthetic_chunks(sum(n for _, _, n in counts), seed=seed)
+    records, position = [], 0
+    for meeting, doc_type, n in counts:
+        records += [{"text": text, "meeting": meeting, "doc_type": doc_type} for text in texts[position:position + n]]
+        position += n
+    return records, synthetic_embeddings(len(records), seed=seed)
+
+
+def is_correct(label, route):
+    """Return True if a route matches its label (kind, plus the meeting or years)."""
+    if route["kind"] != label["route"]:
+        return False
+    if label["route"] == "meeting":
+        return route["meeting"] == label["meeting"]
+    if label["route"] == "years":
+        return route["years"] == label["years"]
+    return True
+
+
+def evaluate_routing(questions, shards, today=EVAL_TODAY):
+    """
+    Parse and route every labelled question.
+
+    Returns:
+        list: Per question: ``question``, ``expected``, ``routed`` (kind plus meeting or years),
+        ``correct``, ``doc_types_correct``, ``route`` and ``route_us`` (parse plus route time).
+    """
+    rows = []
+    for label in questions:
+        start = time.perf_counter()
+        parsed = parse_query(label["question"], today)
+        route = shards.route(parsed, today)
+        elapsed = time.perf_counter() - start
+        detail = route["meeting"] or ",".join(map(str, route["years"]))
+        expected = label.get("meeting") or ",".join(map(str, label.get("years", [])))
+        rows.append({
+            "question": label["question"],
+            "expected": f"{label['route']}:{expected}" if expected else label["route"],
+            "routed": f"{route['kind']}:{detail}" if detail else route["kind"],
+            "correct": is_correct(label, route),
+            "doc_types_correct": parsed["doc_types"] == sorted(label.get("doc_types", [])),
+            "route": route,
+            "route_us": elapsed * 1e6,
+        })
+    return rows
+
+
+def bench_search(rows, shards, full_index, records, top_k=5, repeat=20, seed=1):
+    """
+    Compare routed shard searches with searching the full index, per route kind.
+
+    Query vectors are random (routing depends only on the question text), so
+    the latencies and the share of full-index results that fall outside the
+    routed meeting or years are what matters, not the passages themselves.
+
+    Returns:
+        dict: Per route kind: ``questions``, ``full_p50_ms``, ``routed_p50_ms``, ``speedup`` and
+        ``full_on_target`` (share of full-index results inside the routed meeting or years).
+    """
+    routed = [row["route"] for row in rows if row["route"]["kind"] != "global"]
+    queries = synthetic_embeddings(len(routed), seed=seed)
+    meetings = np.array([record["meeting"] for record in records])
+    results = {}
+    for kind in ("meeting", "years"):
+        positions = [i for i, route in enumerate(routed) if route["kind"] == kind]
+        if not positions:
+            continue
+
+        def full_search(i, positions=positions):
+            full_index.search(queries[positions[i % len(positions)]].reshape(1, -1), top_k)
+
+        def routed_search(i, positions=positions):
+            position = positions[i % len(positions)]
+            shards.search(queries[position], routed[position], top_k)
+
+        on_target = []
+        for position in positions:
+            route = routed[position]
+            _, rows_found = full_index.search(queries[position].reshape(1, -1), top_k)
+            found = meetings[rows_found[0]]
+            if kind == "meeting":
+                on_target.append(np.mean(found == route["meeting"]))
+            else:
+                on_target.append(np.mean([int(meeting[:4]) in route["years"] for meeting in found]))
+
+        full = time_calls(full_search, repeat * len(positions))
+        routed_timing = time_calls(routed_search, repeat * len(positions))
+        results[kind] = {
+            "questions": len(positions),
+            "full_p50_ms": full["p50_ms"],
+            "routed_p50_ms": routed_timing["p50_ms"],
+            "speedup": full["p50_ms"] / routed_timing["p50_ms"] if routed_timing["p50_ms"] else None,
+            "full_on_target": float(np.mean(on_target)),
+        }
+    return results
+
+
+def run_eval(questions, chunks_per_meeting=CHUNKS_PER_MEETING, repeat=20, today=EVAL_TODAY):
+    """
+    Build synthetic shards for every calendar meeting before ``today`` and evaluate routing on them.
+
+    Returns:
+        dict: ``accuracy``, ``doc_type_accuracy``, ``route_us`` (p50 and p95), ``search`` (see
+        ``bench_search``), ``vectors`` and the per-question ``rows``.
+    """
+    calendar = get_calendar()
+    meetings = calendar.previous(today=np.datetime64(today, "D") + 1)
+    records, embeddings = synthetic_records(meetings, set(calendar.sep_dates), chunks_per_meeting)
+    with tempfile.TemporaryDirectory() as shard_dir:
+        build_shards(records, shard_dir, embeddings)
+        shards = ShardedIndex(shard_dir)
+        full_index = faiss.IndexFlatL2(embeddings.shape[1])
+        full_index.add(embeddings)
+
+        # First pass warms the parser's regexes and the shard loads
+        evaluate_routing(questions, shards, today)
+        rows = evaluate_routing(questions, shards, today)
+        search = bench_search(rows, shards, full_index, records, repeat=repeat)
+
+    route_us = np.array([row["route_us"] for row in rows])
+    return {
+        "questions": len(rows),
+        "accuracy": float(np.mean([row["correct"] for row in rows])),
+        "doc_type_accuracy": float(np.mean([row["doc_types_correct"] for row in rows])),
+        "route_us": {"p50": float(np.percentile(route_us, 50)), "p95": float(np.percentile(route_us, 95))},
+        "search": search,
+        "vectors": len(records),
+        "rows": rows,
+    }
+
+
+# Run: python -m fomc_dashboard.benchmarks.routing_eval [--chunks-per-meeting 2000]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Routing accuracy and latency on the labelled question set")
+    parser.add_argument("--questions", default=QUESTIONS_FILE)
+    parser.add_argument("--chunks-per-meeting", type=int, default=CHUNKS_PER_MEETING)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    result = run_eval(load_questions(args.questions), args.chunks_per_meeting, args.repeat)
+    print(f"Routing accuracy:  {result['accuracy']:.1%} of {result['questions']} questions")
+    print(f"Doc type accuracy: {result['doc_type_accuracy']:.1%}")
+    print(f"Parse + route:     p50 {result['route_us']['p50']:.0f} µs, p95 {result['route_us']['p95']:.0f} µs")
+    print(f"Search ({result['vectors']:,} vectors, top 5):")
+    for kind, stats in result["search"].items():
+        print(
+            f"  {kind:<8} {stats['questions']:>3} questions: full {stats['full_p50_ms']:.2f} ms, "
+            f"routed {stats['routed_p50_ms']:.3f} ms ({stats['speedup']:.0f}x); "
+            f"full-index results on target {stats['full_on_target']:.0%}"
+        )
+    for row in result["rows"]:
+        if not row["correct"] or not row["doc_types_correct"]:
+            print(f"  MISROUTED: {row['question']!r}: expected {row['expected']}, got {row['routed']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({key: value for key, value in result.items() if key != "rows"}, f, indent=2)
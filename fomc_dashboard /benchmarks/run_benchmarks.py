@@ -0,0 +1,349 @@
+import argparse
+import asyncio
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import faiss
+import numpy as np
+from aiohttp import web
+
+from fomc_dashboard.benchmarks.corpus import generate_pdfs, synthetic_chunks, synthetic_embeddings
+from fomc_dashboard.benchmarks.load_test import DEFAULT_QUESTIONS, free_port
+from fomc_dashboard.benchmarks.mock_llm import create_app as create_mock_llm
+from fomc_dashboard.modules import sentence_transformer
+from fomc_dashboard.modules.ai_responder import AzureOpenAIHelper
+from fomc_dashboard.modules.document_reader import extract_text_from_pdf
+from fomc_dashboard.modules.qa_pipeline import generate_answer, retrieve
+from fomc_dashboard.modules.resources import release_resource
+from fomc_dashboard.modules.sentence_transformer import query_faiss, store_in_faiss
+from fomc_dashboard.modules.sentiment import analyze_chunks, classify_sentiment, score_documents
+
+# Corpus sizes in chunks (1m needs about 2 GB of memory for the flat index)
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SIZES = "1k,100k"
+
+# Ingestion embeds every chunk with the real model, so it is capped separately
+MAX_INGEST_CHUNKS = 10_000
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# A metric more than this factor worse than the baseline is a regression
+REGRESSION_THRESHOLD = 1.25
+
+
+def time_calls(fn, repeat, warmup=1):
+    """
+    Time repeated calls of ``fn``.
+
+    Args:
+        fn (callable): Called with the call number (0, 1, ...), e.g. to vary the question.
+        repeat (int): Measured calls.
+        warmup (int, optional): Unmeasured calls first. Defaults to 1.
+
+    Returns:
+        dict: ``p50_ms``, ``p95_ms`` and ``mean_ms``.
+    """
+    for i in range(warmup):
+        fn(i)
+    latencies = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(warmup + i)
+        latencies.append(time.perf_counter() - start)
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 4),
+        "p95_ms": round(float(np.percentile(latencies_ms, 95)), 4),
+        "mean_ms": round(float(latencies_ms.mean()), 4),
+    }
+
+
+def build_index_files(chunks, directory):
+    """
+    Write a flat FAISS index of synthetic embeddings and the chunk metadata.
+
+    Random unit vectors stand in for real embeddings, so a 1M-chunk index is
+    built in seconds; search cost depends only on the vector count and size.
+
+    Returns:
+        tuple: (index file without the ".index" suffix, metadata file).
+    """
+    index = faiss.IndexFlatL2(sentence_transformer.dimension)
+    index.add(synthetic_embeddings(len(chunks)))
+    index_file = os.path.join(directory, f"index_{len(chunks)}")
+    metadata_file = os.path.join(directory, f"metadata_{len(chunks)}.pkl")
+    faiss.write_index(index, f"{index_file}.index")
+    with open(metadata_file, "wb") as f:
+        pickle.dump(chunks, f)
+    return index_file, metadata_file
+
+
+def bench_query_faiss(chunks, directory, repeat):
+    """Index load time and per-query latency of ``query_faiss``."""
+    index_file, metadata_file = build_index_files(chunks, directory)
+    questions = DEFAULT_QUESTIONS
+
+    start = time.perf_counter()
+    query_faiss(questions[0], metadata_file=metadata_file, index_file=index_file)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    result = time_calls(
+        lambda i: query_faiss(questions[i % len(questions)], metadata_file=metadata_file, index_file=index_file),
+        repeat,
+    )
+    result["load_ms"] = round(load_ms, 2)
+    release_resource("faiss_retriever")
+    return result
+
+
+def bench_store_in_faiss(chunks, directory):
+    """Embedding and indexing throughput of ``store_in_faiss``."""
+    # store_in_faiss appends to the module-level index, so start from an empty one
+    sentence_transformer.index = faiss.IndexFlatL2(sentence_transformer.dimension)
+    sentence_transformer.metadata = []
+    start = time.perf_counter()
+    store_in_faiss(
+        chunks, metadata_file=os.path.join(directory, "ingest.pkl"), index_file=os.path.join(directory, "ingest")
+    )
+    elapsed = time.perf_counter() - start
+    return {"chunks": len(chunks), "elapsed_ms": round(elapsed * 1000, 2), "chunks_per_s": round(len(chunks) / elapsed, 1)}
+
+
+def bench_sentiment(chunks):
+    """Throughput of document-level, passage-level and streaming sentiment scoring."""
+    start = time.perf_counter()
+    for chunk in chunks:
+        classify_sentiment(chunk)
+    classify_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score_documents(chunks)
+    score_elapsed = time.perf_counter() - start
+
+    text = "\n\n".join(chunks)
+    start = time.perf_counter()
+    analyze_chunks(text[i:i + 1024 * 1024] for i in range(0, len(text), 1024 * 1024))
+    stream_elapsed = time.perf_counter() - start
+
+    return {
+        "classify_sentiment_chunks_per_s": round(len(chunks) / classify_elapsed, 1),
+        "score_documents_chunks_per_s": round(len(chunks) / score_elapsed, 1),
+        "analyze_chunks_mb_per_s": round(len(text) / 1e6 / stream_elapsed, 3),
+    }
+
+
+def bench_pdf(directory, n_documents, pages_per_document):
+    """Text extraction throughput of ``extract_text_from_pdf`` on generated PDFs."""
+    paths = generate_pdfs(os.path.join(directory, "pdfs"), n_documents, pages_per_document)
+    start = time.perf_counter()
+    for path in paths:
+        extract_text_from_pdf(path)
+    elapsed = time.perf_counter() - start
+    pages = n_documents * pages_per_document
+    return {"pages": pages, "ms_per_page": round(elapsed * 1000 / pages, 3), "pages_per_s": round(pages / elapsed, 1)}
+
+
+@contextmanager
+def mock_llm_server(latency_ms):
+    """Run the mock LLM on a background event loop; yields its base URL."""
+    loop = asyncio.new_event_loop()
+    port = free_port()
+    runner = web.AppRunner(create_mock_llm(median_latency_ms=latency_ms, sigma=0.0, seed=0))
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+    thread = threading.Thread(target=loop.run_forever, name="mock-llm", daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
+
+
+def bench_answer(chunks, directory, repeat, mock_latency_ms):
+    """End-to-end answer latency against the mock LLM (retrieval, prompt, HTTP round trip)."""
+    index_file, metadata_file = build_index_files(chunks, directory)
+    questions = DEFAULT_QUESTIONS
+    with mock_llm_server(mock_latency_ms) as url:
+        ai_helper = AzureOpenAIHelper(api_key="local", azure_endpoint=url)
+
+        def answer(i):
+            question = f"{questions[i % len(questions)]} ({i})"
+            sources = retrieve(question, index_file=index_file, metadata_file=metadata_file)
+            if generate_answer(question, sources, ai_helper) is None:
+                raise RuntimeError("Mock LLM request failed")
+
+        result = time_calls(answer, repeat, warmup=2)
+    result["mock_latency_ms"] = mock_latency_ms
+    release_resource("faiss_retriever")
+    return result
+
+
+def environment():
+    """Describe the machine and code version the results were measured on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "faiss": getattr(faiss, "__version__", None),
+    }
+
+
+def run_suite(sizes, repeat=50, max_ingest=MAX_INGEST_CHUNKS, pdf_documents=20, pdf_pages=10,
+              mock_latency_ms=0.0, only=None):
+    """
+    Run the benchmark suite.
+
+    Args:
+        sizes (list): Keys of SIZES to run.
+        repeat (int, optional): Measured calls per latency benchmark. Defaults to 50.
+        max_ingest (int, optional): Cap on chunks embedded by the ingestion benchmark.
+        pdf_documents (int, optional): Generated PDFs. Defaults to 20.
+        pdf_pages (int, optional): Pages per PDF. Defaults to 10.
+        mock_latency_ms (float, optional): Mock LLM latency. Defaults to 0 (pipeline overhead only).
+        only (set, optional): Benchmark names to run (retrieval, ingest, sentiment, pdf, answer). Defaults to all.
+
+    Returns:
+        dict: ``environment`` and ``results``, a flat mapping of "benchmark[size]" to metrics.
+    """
+    def selected(name):
+        return only is None or name in only
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="fomc-bench-") as directory:
+        for size in sizes:
+            chunks = synthetic_chunks(SIZES[size])
+            if selected("retrieval"):
+                print(f"query_faiss [{size}] ...", flush=True)
+                results[f"query_faiss[{size}]"] = bench_query_faiss(chunks, directory, repeat)
+            if selected("ingest") and SIZES[size] <= max_ingest:
+                print(f"store_in_faiss [{size}] ...", flush=True)
+                results[f"store_in_faiss[{size}]"] = bench_store_in_faiss(chunks, directory)
+            if selected("sentiment"):
+                print(f"sentiment [{size}] ...", flush=True)
+                results[f"sentiment[{size}]"] = bench_sentiment(chunks)
+        if selected("pdf"):
+            print("extract_text_from_pdf ...", flush=True)
+            results["extract_text_from_pdf"] = bench_pdf(directory, pdf_documents, pdf_pages)
+        if selected("answer"):
+            print("answer (mock LLM) ...", flush=True)
+            results["answer[1k]"] = bench_answer(synthetic_chunks(SIZES["1k"]), directory, repeat, mock_latency_ms)
+    return {"environment": environment(), "results": results}
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare results with a baseline.
+
+    Metrics ending in ``_ms`` are better when lower; ``_per_s`` metrics are
+    better when higher. Other metrics (counts, settings) are not compared.
+
+    Args:
+        results (dict): ``results`` of the current run.
+        baseline (dict): ``results`` of the baseline run.
+        threshold (float, optional): Worsening factor counted as a regression. Defaults to REGRESSION_THRESHOLD.
+
+    Returns:
+        list: Dicts with ``benchmark``, ``metric``, ``baseline``, ``current``, ``change`` (worsening
+        factor, above 1 is slower) and ``regression``.
+    """
+    rows = []
+    for benchmark, metrics in sorted(results.items()):
+        for metric, current in sorted(metrics.items()):
+            previous = baseline.get(benchmark, {}).get(metric)
+            if previous is None or not current or not previous:
+                continue
+            if metric.endswith("_ms"):
+                change = current / previous
+            elif metric.endswith("_per_s"):
+                change = previous / current
+            else:
+                continue
+            rows.append({
+                "benchmark": benchmark,
+                "metric": metric,
+                "baseline": previous,
+                "current": current,
+                "change": round(change, 3),
+                "regression": change > threshold,
+            })
+    return rows
+
+
+def print_comparison(rows):
+    print(f"{'benchmark':<26} {'metric':<34} {'baseline':>12} {'current':>12} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['benchmark']:<26} {row['metric']:<34} {row['baseline']:>12.3f} {row['current']:>12.3f} "
+            f"{row['change']:>7.2f}x{flag}"
+        )
+
+
+# Example usage:
+#   python -m fomc_dashboard.benchmarks.run_benchmarks --save-baseline        (on the reference commit)
+#   python -m fomc_dashboard.benchmarks.run_benchmarks --output results.json  (exit code 1 on regression)
+#   python -m fomc_dashboard.benchmarks.run_benchmarks --sizes 1k,100k,1m     (full scale)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FOMC dashboard benchmark suite")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Comma-separated corpus sizes from {list(SIZES)}")
+    parser.add_argument("--only", help="Comma-separated subset of: retrieval, ingest, sentiment, pdf, answer")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--max-ingest", type=int, default=MAX_INGEST_CHUNKS)
+    parser.add_argument("--pdf-documents", type=int, default=20)
+    parser.add_argument("--pdf-pages", type=int, default=10)
+    parser.add_argument("--mock-latency-ms", type=float, default=0.0)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    sizes = [size.strip().lower() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes {unknown}; choose from {list(SIZES)}")
+    only = {name.strip() for name in args.only.split(",")} if args.only else None
+
+    run = run_suite(sizes, args.repeat, args.max_ingest, args.pdf_documents, args.pdf_pages,
+                    args.mock_latency_ms, only)
+    print(json.dumps(run["results"], indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(run["results"], baseline["results"], args.threshold)
+        print(f"\nCompared with the baseline from {baseline['environment'].get('commit')} "
+              f"({baseline['environment'].get('timestamp')}):")
+        print_comparison(rows)
+        if any(row["regression"] for row in rows):
+            sys.exit(1)
+    else:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
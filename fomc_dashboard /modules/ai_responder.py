@@ -1,5 +1,17 @@
+import hashlib
+import time
+
 from openai import AzureOpenAI
 
+from fomc_dashboard.modules.metrics import metrics
+from fomc_dashboard.modules.tracing import span
+
+LLM_LATENCY = metrics.summary("fomc_llm_request_seconds", "Chat completion latency.", labels=("model",))
+LLM_REQUESTS = metrics.counter(
+    "fomc_llm_requests_total", "Chat completions by outcome (ok, throttled, error).", labels=("model", "status")
+)
+LLM_TOKENS = metrics.counter("fomc_llm_tokens_total", "Tokens used by chat completions.", labels=("model", "kind"))
+
 
 class AzureOpenAIHelper:
     """
@@ -11,18 +23,22 @@ class AzureOpenAIHelper:
     API_VERSION = "2024-06-01"  # API version
     DEFAULT_MODEL = "gpt-4o-mini"  # Default model to use
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, azure_endpoint=None):
         """
         Initialize the AzureOpenAIHelper instance.
 
         Args:
             api_key (str): Your Azure OpenAI API key.
+            azure_endpoint (str, optional): Endpoint override, e.g. a local stand-in. Defaults to AZURE_ENDPOINT.
         """
+        azure_endpoint = azure_endpoint or self.AZURE_ENDPOINT
         self.client = AzureOpenAI(
-            azure_endpoint=self.AZURE_ENDPOINT,
+            azure_endpoint=azure_endpoint,
             api_version=self.API_VERSION,
             api_key=api_key
         )
+        # Endpoint and key fingerprint; requests sharing work must come from the same credentials
+        self.identity = hashlib.sha256(f"{azure_endpoint}\n{api_key}".encode("utf-8")).hexdigest()
 
     def get_response(self, message, instruction, model=None, temperature=1.0):
         """
@@ -39,23 +55,39 @@ class AzureOpenAIHelper:
         """
         model = model or self.DEFAULT_MODEL
 
-        try:
-            response = self.client.chat.completions.create(
-                model=model,
-                temperature=temperature,
-                messages=[
-                    {"role": "system", "content": instruction},
-                    {"role": "user", "content": message}
-                ]
-            )
-            # Print token usage
-            print(f"Token Usage: {response.usage}")
-            # Return the response content
-            return response.choices[0].message.content
-
-        except Exception as e:
-            print(f"Error during API call: {e}")
-            return None
+        with span("llm_call", model=model, prompt_chars=len(message)) as stage:
+            start = time.perf_counter()
+            try:
+                response = self.client.chat.completions.create(
+                    model=model,
+                    temperature=temperature,
+                    messages=[
+                        {"role": "system", "content": instruction},
+                        {"role": "user", "content": message}
+                    ]
+                )
+                LLM_LATENCY.observe(time.perf_counter() - start, model=model)
+                LLM_REQUESTS.inc(model=model, status="ok")
+                # Token usage goes on the trace and the token counters
+                if response.usage is not None:
+                    stage.set(
+                        prompt_tokens=response.usage.prompt_tokens,
+                        completion_tokens=response.usage.completion_tokens,
+                        total_tokens=response.usage.total_tokens,
+                    )
+                    LLM_TOKENS.inc(response.usage.prompt_tokens, model=model, kind="prompt")
+                    LLM_TOKENS.inc(response.usage.completion_tokens, model=model, kind="completion")
+                # Return the response content
+                return response.choices[0].message.content
+
+            except Exception as e:
+                LLM_LATENCY.observe(time.perf_counter() - start, model=model)
+                # HTTP 429 means the deployment's rate limit was hit
+                throttled = getattr(e, "status_code", None) == 429
+                LLM_REQUESTS.inc(model=model, status="throttled" if throttled else "error")
+                stage.set(error=type(e).__name__)
+                print(f"Error during API call: {e}")
+                return None
 
 
 # Example usage
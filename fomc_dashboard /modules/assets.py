@@ -0,0 +1,265 @@
+import base64
+import glob
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+
+import streamlit as st
+from PIL import Image
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from fomc_dashboard.modules.file_server import PUBLIC_BASE_URL, file_url, register_directory, start_file_server
+from fomc_dashboard.modules.paths import ASSETS_DIR, DATA_DIR
+from fomc_dashboard.modules.resources import get_resource
+
+# Optimized copies, named by content hash so browsers can cache them forever
+ASSET_CACHE_DIR = os.path.join(DATA_DIR, "static")
+SERVE_PREFIX = "static"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Folder Streamlit serves at app/static/ (next to the main script) when server.enableStaticServing is on
+STREAMLIT_STATIC_FOLDER = "static"
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# Widths built at startup: content images and full-page backgrounds
+CONTENT_WIDTH = 1000
+BACKGROUND_WIDTH = 1920
+JPEG_QUALITY = 80
+
+
+def optimize_image(source_path, max_width):
+    """
+    Downscale and recompress an image.
+
+    Photos become progressive JPEGs; images with transparency stay PNG.
+
+    Args:
+        source_path (str): Image file.
+        max_width (int): Maximum width in pixels; smaller images keep their size.
+
+    Returns:
+        tuple: (encoded bytes, file extension, (width, height)).
+    """
+    with Image.open(source_path) as image:
+        image.load()
+        if image.width > max_width:
+            height = round(image.height * max_width / image.width)
+            image = image.resize((max_width, height), Image.LANCZOS)
+
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        buffer = io.BytesIO()
+        if has_alpha:
+            image.save(buffer, format="PNG", optimize=True)
+            extension = ".png"
+        else:
+            image.convert("RGB").save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+            extension = ".jpg"
+        return buffer.getvalue(), extension, image.size
+
+
+class AssetPipeline:
+    """
+    Optimized, content-hashed copies of the dashboard images.
+
+    Each (image, width) variant is built once and recorded in a manifest with
+    the source's mtime and size, so restarts reuse existing files and only an
+    edited image is rebuilt (under a new name, leaving old URLs valid).
+    """
+
+    def __init__(self, assets_dir=ASSETS_DIR, cache_dir=ASSET_CACHE_DIR, widths=(CONTENT_WIDTH, BACKGROUND_WIDTH)):
+        """
+        Initialize the AssetPipeline instance and build every variant.
+
+        Args:
+            assets_dir (str, optional): Source images. Defaults to ASSETS_DIR.
+            cache_dir (str, optional): Output directory. Defaults to ASSET_CACHE_DIR.
+            widths (tuple, optional): Widths built at startup. Defaults to content and background widths.
+        """
+        self.assets_dir = assets_dir
+        self.cache_dir = cache_dir
+        self.manifest_file = os.path.join(cache_dir, "manifest.json")
+        self._lock = threading.Lock()
+        self._data_uris = {}
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except FileNotFoundError:
+            self.manifest = {}
+        self.build(widths)
+
+    def build(self, widths):
+        """
+        Build every source image at the given widths.
+
+        Returns:
+            int: Number of variants (re)built.
+        """
+        built = 0
+        for path in sorted(glob.glob(os.path.join(self.assets_dir, "*"))):
+            if path.lower().endswith(IMAGE_EXTENSIONS):
+                for width in widths:
+                    built += self._ensure(path, width)[1]
+        return built
+
+    def _source_path(self, name):
+        # Absolute paths are used as-is; anything else is looked up in the assets folder
+        return name if os.path.isabs(name) else os.path.join(self.assets_dir, name)
+
+    def _ensure(self, source_path, max_width):
+        stat = os.stat(source_path)
+        key = f"{os.path.abspath(source_path)}@{max_width}"
+        entry = self.manifest.get(key)
+        if (
+            entry is not None
+            and entry["source_mtime"] == stat.st_mtime
+            and entry["source_size"] == stat.st_size
+            and os.path.exists(os.path.join(self.cache_dir, entry["file"]))
+        ):
+            return entry, False
+
+        with self._lock:
+            data, extension, (width, height) = optimize_image(source_path, max_width)
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            stem = os.path.splitext(os.path.basename(source_path))[0]
+            file_name = f"{stem}-{width}w.{digest}{extension}"
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            target = os.path.join(self.cache_dir, file_name)
+            if not os.path.exists(target):
+                with open(target + ".tmp", "wb") as f:
+                    f.write(data)
+                os.replace(target + ".tmp", target)
+
+            entry = {
+                "file": file_name,
+                "width": width,
+                "height": height,
+                "bytes": len(data),
+                "source_mtime": stat.st_mtime,
+                "source_size": stat.st_size,
+            }
+            self.manifest[key] = entry
+            with open(self.manifest_file + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, indent=2, sort_keys=True)
+            os.replace(self.manifest_file + ".tmp", self.manifest_file)
+        return entry, True
+
+    def resolve(self, name, max_width=CONTENT_WIDTH):
+        """
+        Return the manifest entry of an image variant, building it if needed.
+
+        Args:
+            name (str): File name in the assets folder, or an absolute image path.
+            max_width (int, optional): Maximum width. Defaults to CONTENT_WIDTH.
+
+        Returns:
+            dict: ``file``, ``width``, ``height`` and ``bytes`` of the optimized copy.
+
+        Raises:
+            FileNotFoundError: If the source image does not exist.
+        """
+        return self._ensure(self._source_path(name), max_width)[0]
+
+    def path(self, name, max_width=CONTENT_WIDTH):
+        """Return the local path of an optimized image."""
+        return os.path.join(self.cache_dir, self.resolve(name, max_width)["file"])
+
+    def url(self, name, max_width=CONTENT_WIDTH):
+        """
+        Return a URL of an optimized image that the browser can load from the dashboard's origin.
+
+        In order of preference: the local file server when FOMC_FILE_BASE_URL
+        opts in to it; Streamlit's own static serving (``app/static/``) when
+        ``server.enableStaticServing`` is on and the app has a static folder;
+        otherwise a data URI of the optimized copy, encoded once per process.
+        """
+        file_name = self.resolve(name, max_width)["file"]
+        if PUBLIC_BASE_URL:
+            return file_url(SERVE_PREFIX, file_name)
+        static_dir = _streamlit_static_dir()
+        if static_dir is not None:
+            target = os.path.join(static_dir, file_name)
+            if not os.path.exists(target):
+                shutil.copyfile(os.path.join(self.cache_dir, file_name), target + ".tmp")
+                os.replace(target + ".tmp", target)
+            # Relative, so it also works under a server.baseUrlPath
+            return f"app/static/{file_name}"
+        return self._data_uri(file_name)
+
+    def _data_uri(self, file_name):
+        uri = self._data_uris.get(file_name)
+        if uri is None:
+            with open(os.path.join(self.cache_dir, file_name), "rb") as f:
+                encoded = base64.b64encode(f.read()).decode("ascii")
+            mime = "image/png" if file_name.endswith(".png") else "image/jpeg"
+            uri = self._data_uris[file_name] = f"data:{mime};base64,{encoded}"
+        return uri
+
+
+def _streamlit_static_dir():
+    """Return the running app's static folder, or None if Streamlit does not serve one."""
+    if not st.get_option("server.enableStaticServing"):
+        return None
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    static_dir = os.path.join(str(ctx.main_script_parent), STREAMLIT_STATIC_FOLDER)
+    return static_dir if os.path.isdir(static_dir) else None
+
+
+def load_asset_pipeline():
+    """
+    Build the optimized assets; serve them from the local file server only if FOMC_FILE_BASE_URL is set.
+
+    Returns:
+        AssetPipeline: Pipeline resolving image paths and URLs.
+    """
+    pipeline = AssetPipeline()
+    if PUBLIC_BASE_URL:
+        register_directory(SERVE_PREFIX, pipeline.cache_dir, cache_control=IMMUTABLE_CACHE_CONTROL)
+        start_file_server()
+    return pipeline
+
+
+def asset_path(name, max_width=CONTENT_WIDTH):
+    """
+    Return the local path of the optimized copy of a dashboard image, for ``st.image``.
+
+    Streamlit serves the file from its own origin, so it loads wherever the dashboard does.
+
+    Args:
+        name (str): File name in the assets folder (e.g. "powell.jpg") or an absolute image path.
+        max_width (int, optional): Maximum width in pixels. Defaults to CONTENT_WIDTH.
+
+    Returns:
+        str: Path of the resized, content-hashed copy.
+    """
+    return get_resource("static_assets").path(name, max_width)
+
+
+def asset_url(name, max_width=CONTENT_WIDTH):
+    """
+    Return a URL of a dashboard image for use in CSS (see ``AssetPipeline.url``).
+
+    Args:
+        name (str): File name in the assets folder (e.g. "powell.jpg") or an absolute image path.
+        max_width (int, optional): Maximum width in pixels. Defaults to CONTENT_WIDTH.
+
+    Returns:
+        str: URL of the resized, content-hashed copy.
+    """
+    return get_resource("static_assets").url(name, max_width)
+
+
+# Example usage: prebuild the optimized assets and report the savings
+if __name__ == "__main__":
+    pipeline = AssetPipeline()
+    for key, entry in sorted(pipeline.manifest.items()):
+        print(
+            f"{os.path.basename(key):>22} -> {entry['file']:<34} "
+            f"{entry['source_size'] / 1024:7.1f} KB -> {entry['bytes'] / 1024:7.1f} KB"
+        )
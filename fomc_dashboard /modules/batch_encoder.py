@@ -0,0 +1,168 @@
+import os
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+
+import numpy as np
+
+# A batch is sent when it holds this many texts or its oldest request has waited this long
+MAX_BATCH_SIZE = int(os.environ.get("FOMC_ENCODE_BATCH_SIZE", "32"))
+MAX_WAIT_MS = float(os.environ.get("FOMC_ENCODE_WAIT_MS", "5"))
+
+# Recent queueing delays kept for percentiles
+DELAY_SAMPLES = 2048
+
+
+class BatchEncoder:
+    """
+    Shared encoder that merges concurrent ``encode`` calls into batched forward passes.
+
+    Callers block on a future while a single worker thread collects requests
+    for up to ``max_wait_ms`` (or until ``max_batch_size`` texts are queued),
+    encodes the unique texts in one call and fans the rows back out.
+    """
+
+    def __init__(self, model, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS):
+        """
+        Initialize the BatchEncoder instance and start its worker thread.
+
+        Args:
+            model: Object with an ``encode(list_of_texts)`` method, e.g. a SentenceTransformer.
+            max_batch_size (int, optional): Texts per forward pass. Defaults to MAX_BATCH_SIZE.
+            max_wait_ms (float, optional): Longest wait for more requests. Defaults to MAX_WAIT_MS.
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self._delays = deque(maxlen=DELAY_SAMPLES)
+        self._totals = {"requests": 0, "texts": 0, "unique_texts": 0, "batches": 0, "encode_seconds": 0.0}
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="batch-encoder", daemon=True)
+        self._worker.start()
+
+    def encode(self, texts):
+        """
+        Encode texts through the shared batch.
+
+        Args:
+            texts (list): Texts to encode.
+
+        Returns:
+            numpy.ndarray: One embedding row per text.
+
+        Raises:
+            RuntimeError: If the encoder has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("BatchEncoder is closed")
+        future = Future()
+        self._queue.put((list(texts), time.perf_counter(), future))
+        return future.result()
+
+    def _collect(self):
+        # Block for the first request, then gather more until the batch is full or the wait is over
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch, n_texts = [first], len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while n_texts < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+            n_texts += len(item[0])
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            started = time.perf_counter()
+            texts = [text for item in batch for text in item[0]]
+            # Identical texts (e.g. the same question from several sessions) are encoded once
+            unique, inverse = np.unique(np.array(texts, dtype=object), return_inverse=True)
+            try:
+                embeddings = np.asarray(self.model.encode(list(unique)))[inverse]
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - started
+
+            offset = 0
+            for item_texts, _, future in batch:
+                future.set_result(embeddings[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+            with self._lock:
+                self._batch_sizes[len(texts)] += 1
+                self._delays.extend(started - enqueued for _, enqueued, _ in batch)
+                totals = self._totals
+                totals["requests"] += len(batch)
+                totals["texts"] += len(texts)
+                totals["unique_texts"] += len(unique)
+                totals["batches"] += 1
+                totals["encode_seconds"] += elapsed
+
+    def stats(self):
+        """
+        Return batching metrics.
+
+        Returns:
+            dict: Request, text and batch totals, mean batch size, the batch size
+            histogram, queueing delay percentiles in milliseconds and encode time.
+        """
+        with self._lock:
+            totals = dict(self._totals)
+            sizes = dict(sorted(self._batch_sizes.items()))
+            delays = np.array(self._delays) * 1000
+        batches = totals["batches"]
+        return {
+            **totals,
+            "mean_batch_size": totals["texts"] / batches if batches else 0.0,
+            "batch_size_histogram": sizes,
+            "queue_delay_ms": {
+                f"p{p}": float(np.percentile(delays, p)) if len(delays) else 0.0 for p in (50, 95, 99)
+            },
+            "mean_encode_ms": totals["encode_seconds"] * 1000 / batches if batches else 0.0,
+        }
+
+    def close(self):
+        """Stop the worker thread once queued requests are served."""
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+
+
+# Example usage: concurrent single-query encodes, direct vs micro-batched
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    from fomc_dashboard.modules.resources import get_resource
+
+    model = get_resource("embedding_model")
+    encoder = BatchEncoder(model)
+    queries = [f"What did the FOMC say about inflation in meeting {i}?" for i in range(512)]
+    for name, encode in [("direct", model.encode), ("batched", encoder.encode)]:
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            start = time.perf_counter()
+            list(pool.map(lambda q: encode([q]), queries))
+            elapsed = time.perf_counter() - start
+        print(f"{name:>8}: {len(queries) / elapsed:8.1f} queries/s")
+
+    stats = encoder.stats()
+    print(f"Mean batch size {stats['mean_batch_size']:.1f}, queue delay p95 {stats['queue_delay_ms']['p95']:.2f} ms")
@@ -1,7 +1,10 @@
+import os
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+from fomc_dashboard.modules.meeting_calendar import CRAWLED_FILE
+
 # Define the base URL for FOMC minutes
 BASE_URL = "https://www.federalreserve.gov/monetarypolicy/files/"
 
@@ -55,13 +58,24 @@ def save_urls_to_file(urls, filename):
         file.write("\n".join(urls))
 
 
-# Fetch meeting dates from Wikipedia
-meeting_dates = get_fomc_meeting_dates(WIKI_URL)
+def save_meeting_dates(meeting_dates, filename=CRAWLED_FILE):
+    """Save the meeting dates for the meeting calendar, one ISO date per line."""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as file:
+        file.write("\n".join(sorted({date.strftime("%Y-%m-%d") for date in meeting_dates})))
+
+
+if __name__ == "__main__":
+    # Fetch meeting dates from Wikipedia
+    meeting_dates = get_fomc_meeting_dates(WIKI_URL)
+
+    # Save meeting dates for the meeting calendar
+    save_meeting_dates(meeting_dates)
 
-# Generate URLs for FOMC minutes
-fomc_urls = generate_fomc_minutes_urls(meeting_dates)
+    # Generate URLs for FOMC minutes
+    fomc_urls = generate_fomc_minutes_urls(meeting_dates)
 
-# Save URLs to a file
-save_urls_to_file(fomc_urls, "fomc_minutes_urls.txt")
+    # Save URLs to a file
+    save_urls_to_file(fomc_urls, "fomc_minutes_urls.txt")
 
-print(f"Generated {len(fomc_urls)} FOMC minutes URLs and saved to 'fomc_minutes_urls.txt'.")
+    print(f"Generated {len(fomc_urls)} FOMC minutes URLs and saved to 'fomc_minutes_urls.txt'.")
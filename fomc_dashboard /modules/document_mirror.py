@@ -0,0 +1,370 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+
+import numpy as np
+import requests
+
+from fomc_dashboard.modules.data_fetcher import BASE_URL, generate_fomc_minutes_urls
+from fomc_dashboard.modules.file_server import PUBLIC_BASE_URL, file_url, register_directory, start_file_server
+from fomc_dashboard.modules.meeting_calendar import get_calendar
+from fomc_dashboard.modules.sep_store import SEP_BASE_URL, SEP_LIBRARY, SEP_PDF_DIR
+
+# Mirror root: one sub-directory per document kind (sep/ is where sep_store.py reads PDFs from)
+MIRROR_DIR = os.path.dirname(SEP_PDF_DIR)
+MINUTES_DIR = os.path.join(MIRROR_DIR, "minutes")
+STATEMENTS_DIR = os.path.join(MIRROR_DIR, "statement")
+
+# Policy statement press releases (PDF), published at 2:00 p.m. on the day of each decision
+STATEMENT_FILE_NAME = "monetary{:%Y%m%d}a1.pdf"
+
+# Downloads in flight at once; kept low to be polite to federalreserve.gov
+MAX_CONCURRENT_DOWNLOADS = int(os.environ.get("FOMC_MIRROR_CONCURRENCY", "4"))
+REQUEST_TIMEOUT = 30
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Minutes are published about three weeks after each meeting
+MINUTES_RELEASE_LAG_DAYS = 21
+
+# A failed download is retried after an hour, doubling per failure up to a week (404s for crawled
+# dates without documents, minutes not published yet)
+RETRY_BASE_SECONDS = 3600
+RETRY_MAX_SECONDS = 7 * 86400
+
+# Background runs started by page renders are at least this far apart
+PREFETCH_INTERVAL_SECONDS = int(os.environ.get("FOMC_MIRROR_INTERVAL", str(6 * 3600)))
+
+# URL prefix used by the local file server
+SERVE_PREFIX = "documents"
+
+HEADERS = {"User-Agent": "fomc-dashboard document mirror"}
+
+
+def document_catalog(today=None):
+    """
+    List every SEP, minutes and policy statement PDF the mirror should hold.
+
+    SEP files come from the library list plus every past SEP meeting in the
+    calendar; minutes from every past meeting old enough to have them;
+    statements from every meeting up to and including today, since they are
+    released the day of the decision.
+
+    Args:
+        today (datetime.date, optional): Reference date. Defaults to today.
+
+    Returns:
+        list: Dicts with ``kind`` ("sep", "minutes" or "statement"), ``name`` and ``url``.
+    """
+    today = today or date.today()
+    calendar = get_calendar()
+
+    sep_names = [entry["File Name"] for entry in SEP_LIBRARY]
+    for meeting in calendar.sep_dates[calendar.sep_dates < np.datetime64(today, "D")]:
+        name = f"fomcprojtabl{meeting.astype(object):%Y%m%d}.pdf"
+        if name not in sep_names:
+            sep_names.append(name)
+    catalog = [{"kind": "sep", "name": name, "url": SEP_BASE_URL + name} for name in sep_names]
+
+    released = calendar.previous(today=today - timedelta(days=MINUTES_RELEASE_LAG_DAYS))
+    for url in generate_fomc_minutes_urls(released.astype(object)):
+        catalog.append({"kind": "minutes", "name": url[len(BASE_URL):], "url": url})
+
+    # Not yet released on the afternoon of a decision: the failure backoff retries it within the hour
+    for meeting in calendar.previous(today=today + timedelta(days=1)).astype(object):
+        name = STATEMENT_FILE_NAME.format(meeting)
+        catalog.append({"kind": "statement", "name": name, "url": BASE_URL + name})
+    return catalog
+
+
+def file_sha256(path):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download_document(document, directory, session=None):
+    """
+    Stream one document to disk, hashing it as it arrives.
+
+    The file is written under a temporary name and moved into place only once
+    it is complete, so readers never see a partial PDF.
+
+    Args:
+        document (dict): Catalog entry.
+        directory (str): Target directory.
+        session (requests.Session, optional): Session to reuse connections.
+
+    Returns:
+        dict: Manifest entry with ``url``, ``sha256``, ``size`` and ``fetched``.
+
+    Raises:
+        requests.RequestException: On HTTP or network errors.
+        ValueError: If the body is truncated or is not a PDF.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, document["name"])
+    tmp_path = path + ".part"
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with (session or requests).get(document["url"], headers=HEADERS, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            expected = response.headers.get("Content-Length")
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    if size == 0 and not chunk.startswith(b"%PDF"):
+                        raise ValueError(f"{document['name']} is not a PDF")
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+        if expected is not None and int(expected) != size and "Content-Encoding" not in response.headers:
+            raise ValueError(f"{document['name']} truncated: {size} of {expected} bytes")
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return {"url": document["url"], "sha256": digest.hexdigest(), "size": size, "fetched": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+class DocumentMirror:
+    """
+    Local copies of SEP, minutes and policy statement PDFs, tracked in a checksum manifest.
+
+    ``prefetch`` downloads whatever is missing with a bounded thread pool;
+    ``verify`` re-hashes the files on disk and drops any that no longer match
+    so the next prefetch replaces them. Failed downloads are recorded with a
+    retry time (exponential backoff) and skipped until it passes.
+    """
+
+    def __init__(self, mirror_dir=MIRROR_DIR, max_workers=MAX_CONCURRENT_DOWNLOADS):
+        """
+        Initialize the DocumentMirror instance.
+
+        Args:
+            mirror_dir (str, optional): Mirror root. Defaults to MIRROR_DIR.
+            max_workers (int, optional): Concurrent downloads. Defaults to MAX_CONCURRENT_DOWNLOADS.
+        """
+        self.mirror_dir = mirror_dir
+        self.manifest_file = os.path.join(mirror_dir, "manifest.json")
+        self.failures_file = os.path.join(mirror_dir, "failures.json")
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._thread = None
+        self._last_start = None
+        self.manifest = self._read_json(self.manifest_file)
+        # key -> {"error", "attempts", "retry_after" (epoch seconds)}
+        self.failures = self._read_json(self.failures_file)
+        self.progress = {"total": 0, "done": 0, "failed": {}, "running": False, "verified": False}
+
+    @staticmethod
+    def _read_json(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write_json(self, path, data):
+        # Called with the lock held
+        os.makedirs(self.mirror_dir, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _write_manifest(self):
+        self._write_json(self.manifest_file, self.manifest)
+
+    def _record_failure(self, key, error):
+        # Called with the lock held
+        attempts = self.failures.get(key, {}).get("attempts", 0) + 1
+        delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+        self.failures[key] = {"error": error, "attempts": attempts, "retry_after": time.time() + delay}
+        self._write_json(self.failures_file, self.failures)
+
+    @staticmethod
+    def _key(kind, name):
+        return f"{kind}/{name}"
+
+    def local_path(self, kind, name):
+        """
+        Return the path of a mirrored document.
+
+        Args:
+            kind (str): "sep", "minutes" or "statement".
+            name (str): File name.
+
+        Returns:
+            str: Path on disk, or None if the document is not (or no longer) mirrored.
+        """
+        entry = self.manifest.get(self._key(kind, name))
+        path = os.path.join(self.mirror_dir, kind, name)
+        if entry is None or not os.path.exists(path) or os.path.getsize(path) != entry["size"]:
+            return None
+        return path
+
+    def verify(self):
+        """
+        Re-hash every mirrored file against the manifest.
+
+        Returns:
+            list: Keys of documents that were missing or corrupt and have been dropped.
+        """
+        dropped = []
+        for key, entry in list(self.manifest.items()):
+            path = os.path.join(self.mirror_dir, key)
+            if not os.path.exists(path) or file_sha256(path) != entry["sha256"]:
+                dropped.append(key)
+        with self._lock:
+            for key in dropped:
+                self.manifest.pop(key, None)
+                path = os.path.join(self.mirror_dir, key)
+                if os.path.exists(path):
+                    os.remove(path)
+            if dropped:
+                self._write_manifest()
+            self.progress["verified"] = True
+        return dropped
+
+    def missing(self, catalog, now=None):
+        """Return the catalog entries that are not mirrored yet and not waiting to be retried."""
+        now = time.time() if now is None else now
+        return [
+            doc for doc in catalog
+            if self.local_path(doc["kind"], doc["name"]) is None
+            and self.failures.get(self._key(doc["kind"], doc["name"]), {}).get("retry_after", 0) <= now
+        ]
+
+    def prefetch(self, catalog=None):
+        """
+        Download every missing document with at most ``max_workers`` in flight.
+
+        Documents whose last download failed are skipped until their retry
+        time; each new failure doubles the wait.
+
+        Args:
+            catalog (list, optional): Documents to mirror. Defaults to ``document_catalog()``.
+
+        Returns:
+            dict: Progress counters (``total``, ``done``, ``failed``).
+        """
+        catalog = document_catalog() if catalog is None else catalog
+        pending = self.missing(catalog)
+        with self._lock:
+            mirrored = sum(self.local_path(doc["kind"], doc["name"]) is not None for doc in catalog)
+            keys = {self._key(doc["kind"], doc["name"]) for doc in catalog}
+            failed = {key: failure["error"] for key, failure in self.failures.items() if key in keys}
+            self.progress.update(total=len(catalog), done=mirrored, failed=failed)
+
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(download_document, doc, os.path.join(self.mirror_dir, doc["kind"]), session): doc
+                for doc in pending
+            }
+            for future in as_completed(futures):
+                doc = futures[future]
+                key = self._key(doc["kind"], doc["name"])
+                try:
+                    entry = future.result()
+                except (requests.RequestException, ValueError, OSError) as e:
+                    with self._lock:
+                        self.progress["failed"][key] = str(e)
+                        self._record_failure(key, str(e))
+                    continue
+                with self._lock:
+                    self.manifest[key] = entry
+                    self._write_manifest()
+                    self.progress["done"] += 1
+                    self.progress["failed"].pop(key, None)
+                    if self.failures.pop(key, None) is not None:
+                        self._write_json(self.failures_file, self.failures)
+        return self.status()
+
+    def start_prefetch(self, interval=PREFETCH_INTERVAL_SECONDS):
+        """
+        Verify and prefetch on a daemon thread, at most once per ``interval``.
+
+        Page renders call this freely: nothing starts while a run is in
+        progress or less than ``interval`` seconds after the last one started.
+
+        Args:
+            interval (float, optional): Minimum seconds between runs. Defaults to PREFETCH_INTERVAL_SECONDS.
+
+        Returns:
+            dict: Current progress counters.
+        """
+        with self._lock:
+            idle = self._thread is None or not self._thread.is_alive()
+            due = self._last_start is None or time.monotonic() - self._last_start >= interval
+            if idle and due:
+                self._last_start = time.monotonic()
+                self.progress["running"] = True
+                self._thread = threading.Thread(target=self._run, name="document-mirror", daemon=True)
+                self._thread.start()
+        return self.status()
+
+    def _run(self):
+        try:
+            if not self.progress["verified"]:
+                self.verify()
+            self.prefetch()
+        finally:
+            with self._lock:
+                self.progress["running"] = False
+
+    def status(self):
+        """Return a snapshot of the progress counters."""
+        with self._lock:
+            return dict(self.progress, failed=dict(self.progress["failed"]))
+
+    def url(self, kind, name):
+        """Return the local file server URL of a mirrored document, or None if not mirrored or not served."""
+        if self.local_path(kind, name) is None:
+            return None
+        return file_url(SERVE_PREFIX, f"{kind}/{name}")
+
+
+_mirror = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror():
+    """
+    Return the process-wide document mirror.
+
+    Its files are linked from the local file server only when
+    FOMC_FILE_BASE_URL opts in; otherwise pages hand them out through
+    Streamlit (see ``local_path``).
+
+    Returns:
+        DocumentMirror: Shared mirror instance.
+    """
+    global _mirror
+    if _mirror is None:
+        with _mirror_lock:
+            if _mirror is None:
+                mirror = DocumentMirror()
+                if PUBLIC_BASE_URL:
+                    register_directory(SERVE_PREFIX, mirror.mirror_dir, cache_control="public, max-age=86400")
+                    start_file_server()
+                _mirror = mirror
+    return _mirror
+
+
+# Example usage: mirror everything in the foreground and report failures
+if __name__ == "__main__":
+    mirror = DocumentMirror()
+    print(f"Dropped {len(mirror.verify())} corrupt or missing files")
+    result = mirror.prefetch()
+    print(f"Mirrored {result['done']} of {result['total']} documents into '{mirror.mirror_dir}'")
+    for key, error in result["failed"].items():
+        print(f"  failed: {key}: {error}")
@@ -0,0 +1,107 @@
+import codecs
+import os
+
+import PyPDF2
+
+from fomc_dashboard.modules.metrics import metrics
+
+# Read uploads in 1 MiB chunks
+CHUNK_SIZE = 1024 * 1024
+
+# Upload size cap in megabytes (override with the FOMC_MAX_UPLOAD_MB environment variable)
+MAX_UPLOAD_BYTES = int(float(os.environ.get("FOMC_MAX_UPLOAD_MB", "200")) * 1024 * 1024)
+
+PDF_PAGE_LATENCY = metrics.summary("fomc_pdf_page_seconds", "Text extraction time per PDF page.")
+PDF_PAGES = metrics.counter("fomc_pdf_pages_total", "PDF pages extracted.")
+
+
+def check_upload_size(size, max_bytes=MAX_UPLOAD_BYTES):
+    """
+    Reject uploads larger than the configured cap.
+
+    Args:
+        size (int): Size of the upload in bytes.
+        max_bytes (int, optional): Size cap in bytes. Defaults to MAX_UPLOAD_BYTES.
+
+    Raises:
+        ValueError: If ``size`` exceeds ``max_bytes``.
+    """
+    if max_bytes and size > max_bytes:
+        raise ValueError(
+            f"File is {size / 1024 / 1024:.1f} MB, above the {max_bytes / 1024 / 1024:.0f} MB upload limit."
+        )
+
+
+def iter_text_chunks(file, chunk_size=CHUNK_SIZE, max_bytes=MAX_UPLOAD_BYTES, progress_callback=None):
+    """
+    Read a UTF-8 text file in chunks, decoding incrementally.
+
+    Multi-byte characters split across chunk boundaries are handled by the
+    incremental decoder, so only one chunk is held in memory at a time.
+
+    Args:
+        file (file-like): Binary file object (e.g. a Streamlit UploadedFile).
+        chunk_size (int, optional): Bytes per read. Defaults to CHUNK_SIZE.
+        max_bytes (int, optional): Size cap in bytes. Defaults to MAX_UPLOAD_BYTES.
+        progress_callback (callable, optional): Called as ``progress_callback(bytes_read, total_bytes)``
+            after every chunk; ``total_bytes`` is None when the size is unknown.
+
+    Yields:
+        str: Decoded text chunks.
+    """
+    total_bytes = getattr(file, "size", None)
+    if total_bytes is not None:
+        check_upload_size(total_bytes, max_bytes)
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    bytes_read = 0
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        bytes_read += len(chunk)
+        check_upload_size(bytes_read, max_bytes)
+
+        text = decoder.decode(chunk)
+        if progress_callback:
+            progress_callback(bytes_read, total_bytes)
+        if text:
+            yield text
+
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def iter_pdf_pages(pdf_file, max_bytes=MAX_UPLOAD_BYTES, progress_callback=None):
+    """
+    Extract text from a PDF one page at a time.
+
+    Args:
+        pdf_file (str or file-like): Path or binary file object.
+        max_bytes (int, optional): Size cap in bytes. Defaults to MAX_UPLOAD_BYTES.
+        progress_callback (callable, optional): Called as ``progress_callback(pages_done, total_pages)``.
+
+    Yields:
+        str: Text of each page.
+    """
+    size = getattr(pdf_file, "size", None)
+    if size is None and isinstance(pdf_file, (str, os.PathLike)):
+        size = os.path.getsize(pdf_file)
+    if size is not None:
+        check_upload_size(size, max_bytes)
+
+    pdf_reader = PyPDF2.PdfReader(pdf_file)
+    total_pages = len(pdf_reader.pages)
+    for page_number, page in enumerate(pdf_reader.pages, start=1):
+        with PDF_PAGE_LATENCY.time():
+            text = page.extract_text() or ""
+        PDF_PAGES.inc()
+        if progress_callback:
+            progress_callback(page_number, total_pages)
+        yield text
+
+
+# Extract text from PDF
+def extract_text_from_pdf(pdf_file):
+    return "".join(iter_pdf_pages(pdf_file, max_bytes=None))
@@ -0,0 +1,173 @@
+import time
+
+import numpy as np
+
+# Default number of points sent to a chart: roughly its width in pixels
+CHART_WIDTH_PX = 1200
+
+
+def _as_float(x):
+    """Convert dates (or any numeric x values) to float64 for area computations."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype("datetime64[D]").astype(np.int64)
+    return x.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks, troughs and steps.
+
+    Args:
+        x (numpy.ndarray): Sorted x values (numbers or datetime64).
+        y (numpy.ndarray): y values.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        numpy.ndarray: Sorted indices of the kept points.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = _as_float(x)
+    y = np.asarray(y, dtype=np.float64)
+
+    # n_out - 2 interior buckets over points 1 .. n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    bucket_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    bucket_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    # The bucket after the last interior one is the final point itself
+    next_x = np.append(bucket_x[1:], x[-1])
+    next_y = np.append(bucket_y[1:], y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - next_x[i]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y[i] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def step_change_indices(values, threshold=0.2, smooth=5):
+    """
+    Find the points on both sides of every step change in a rate series.
+
+    A rolling median removes one-day spikes (e.g. month-end pressure on the
+    effective rate) so only sustained moves of at least ``threshold`` count.
+
+    Args:
+        values (numpy.ndarray): Daily values.
+        threshold (float, optional): Minimum move, in percentage points. Defaults to 0.2.
+        smooth (int, optional): Rolling median window in observations. Defaults to 5.
+
+    Returns:
+        numpy.ndarray: Sorted unique indices.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= smooth:
+        return np.arange(len(values))
+    median = np.median(np.lib.stride_tricks.sliding_window_view(values, smooth), axis=1)
+    jumps = np.flatnonzero(np.abs(np.diff(median)) >= threshold) + smooth // 2
+    return np.unique(np.concatenate([jumps, jumps + 1]))
+
+
+def event_indices(dates, event_dates, after=1):
+    """
+    Return the last observation before each event and the ones just after it.
+
+    Args:
+        dates (numpy.ndarray): Sorted datetime64 observation dates.
+        event_dates (array-like): Event dates, e.g. policy decisions.
+        after (int, optional): Observations kept from the event onwards. Defaults to 1.
+
+    Returns:
+        numpy.ndarray: Sorted unique indices within ``dates``.
+    """
+    if not len(dates):
+        return np.empty(0, dtype=np.int64)
+    positions = np.searchsorted(dates, np.asarray(event_dates, dtype="datetime64[D]"))
+    indices = np.concatenate([positions - 1] + [positions + k for k in range(after)])
+    return np.unique(indices[(indices >= 0) & (indices < len(dates))])
+
+
+def downsample(x, y, n_out=CHART_WIDTH_PX, keep=None):
+    """
+    Downsample a series for display, always keeping the given points.
+
+    Args:
+        x (numpy.ndarray): Sorted x values (numbers or datetime64).
+        y (numpy.ndarray): y values.
+        n_out (int, optional): Target number of points. Defaults to CHART_WIDTH_PX.
+        keep (numpy.ndarray, optional): Indices that must survive, e.g. step changes.
+
+    Returns:
+        numpy.ndarray: Sorted indices of the points to plot.
+    """
+    keep = np.empty(0, dtype=np.int64) if keep is None else np.asarray(keep, dtype=np.int64)
+    budget = max(n_out - len(keep), 3)
+    return np.union1d(lttb_indices(x, y, budget), keep)
+
+
+def resample_mean(dates, values, unit="M"):
+    """
+    Average a sorted daily series per calendar month ("M") or year ("Y").
+
+    Args:
+        dates (numpy.ndarray): Sorted datetime64 dates.
+        values (numpy.ndarray): Values.
+        unit (str, optional): "M" or "Y". Defaults to "M".
+
+    Returns:
+        tuple: (period start dates as datetime64[D], mean values).
+    """
+    if not len(dates):
+        return np.empty(0, dtype="datetime64[D]"), np.empty(0, dtype=np.float64)
+    periods = np.asarray(dates).astype(f"datetime64[{unit}]")
+    starts = np.concatenate([[0], np.flatnonzero(periods[1:] != periods[:-1]) + 1])
+    counts = np.diff(np.append(starts, len(periods)))
+    means = np.add.reduceat(np.asarray(values, dtype=np.float64), starts) / counts
+    return periods[starts].astype("datetime64[D]"), means
+
+
+# Example usage: payload size and serialization time of raw vs reduced rate charts
+if __name__ == "__main__":
+    import plotly.express as px
+
+    rng = np.random.default_rng(0)
+    dates = np.arange("1954-07-01", "2024-12-31", dtype="datetime64[D]")
+    steps = np.cumsum(rng.choice([0.0, 0.25, -0.25], size=len(dates), p=[0.995, 0.0025, 0.0025]))
+    rates = np.clip(5 + steps + rng.normal(0, 0.03, size=len(dates)), 0, None)
+
+    def build_chart(x, y):
+        return px.line(x=x.astype("datetime64[ns]"), y=y, template="plotly_white")
+
+    monthly = resample_mean(dates, rates, "M")
+    annual = resample_mean(dates, rates, "Y")
+    start = time.perf_counter()
+    indices = downsample(dates, rates, keep=step_change_indices(rates))
+    lttb_seconds = time.perf_counter() - start
+
+    variants = {
+        "raw daily": (dates, rates),
+        "LTTB + steps": (dates[indices], rates[indices]),
+        "monthly mean": monthly,
+        "annual mean": annual,
+    }
+    print(f"LTTB selection over {len(dates):,} points took {lttb_seconds * 1000:.1f} ms")
+    for name, (x, y) in variants.items():
+        start = time.perf_counter()
+        payload = build_chart(x, y).to_json()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>14}: {len(x):>6} points | {len(payload) / 1024:8.1f} KB | build + serialize {elapsed * 1000:7.1f} ms")
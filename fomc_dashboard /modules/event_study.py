@@ -0,0 +1,249 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.paths import DATA_DIR
+
+# Daily price files: one CSV per instrument named <symbol>.csv (Yahoo or FRED export layout)
+MARKET_DIR = os.path.join(DATA_DIR, "market")
+
+# Instruments: file symbol -> (display name, kind). Prices are measured in log returns (%),
+# yields in changes (basis points).
+INSTRUMENTS = {
+    "SPX": ("S&P 500", "price"),
+    "DJI": ("Dow Jones", "price"),
+    "IXIC": ("NASDAQ", "price"),
+    "DGS2": ("2Y Treasury Yield", "yield"),
+    "DGS10": ("10Y Treasury Yield", "yield"),
+}
+
+# Event windows in trading days relative to the first trading day on or after the meeting date
+DEFAULT_WINDOWS = [(0, 0), (-1, 1), (0, 1), (0, 5), (-5, 5)]
+
+# Trading days used to estimate each instrument's normal daily return before a meeting
+ESTIMATION_WINDOW = (-250, -11)
+
+# Days either side of the event kept for abnormal-return paths
+PATH_HALF_WIDTH = 10
+
+
+def market_files_signature(market_dir=MARKET_DIR):
+    """
+    Return a cheap fingerprint of the price files, used as a cache key.
+
+    Args:
+        market_dir (str, optional): Price file directory. Defaults to MARKET_DIR.
+
+    Returns:
+        tuple: (file name, mtime, size) for every CSV in the directory.
+    """
+    signature = []
+    for path in sorted(glob.glob(os.path.join(market_dir, "*.csv"))):
+        stat = os.stat(path)
+        signature.append((os.path.basename(path), stat.st_mtime, stat.st_size))
+    return tuple(signature)
+
+
+def read_price_csv(path):
+    """
+    Read one instrument's daily closes.
+
+    Uses "Adj Close" or "Close" when present (Yahoo layout), otherwise the
+    second column (FRED layout, where "." marks a missing observation).
+
+    Args:
+        path (str): CSV file path.
+
+    Returns:
+        pandas.Series: Closing levels indexed by date.
+    """
+    df = pd.read_csv(path, na_values=["."])
+    column = next((c for c in ("Adj Close", "Close") if c in df.columns), df.columns[1])
+    series = pd.Series(df[column].to_numpy(dtype=np.float64), index=pd.to_datetime(df.iloc[:, 0]))
+    return series.dropna().sort_index()
+
+
+def load_market_levels(market_dir=MARKET_DIR, instruments=INSTRUMENTS):
+    """
+    Load all available instruments into one date-aligned level matrix.
+
+    Dates are the union of every file's dates; an instrument with no
+    observation on a date carries its previous level forward. Each
+    instrument keeps its own history: before its first observation its
+    level is NaN, so a short file does not truncate the others.
+
+    Args:
+        market_dir (str, optional): Price file directory. Defaults to MARKET_DIR.
+        instruments (dict, optional): Symbol -> (name, kind). Defaults to INSTRUMENTS.
+
+    Returns:
+        tuple: (dates as datetime64[D], levels (n_dates, n_instruments), names, kinds);
+        None if no price files are available.
+    """
+    columns = {}
+    for symbol in instruments:
+        path = os.path.join(market_dir, f"{symbol}.csv")
+        if os.path.exists(path):
+            columns[symbol] = read_price_csv(path)
+    if not columns:
+        return None
+
+    levels = pd.concat(columns, axis=1).sort_index().ffill()
+    names = [instruments[symbol][0] for symbol in levels.columns]
+    kinds = [instruments[symbol][1] for symbol in levels.columns]
+    return levels.index.to_numpy().astype("datetime64[D]"), levels.to_numpy(), names, kinds
+
+
+class EventStudy:
+    """
+    Mean-adjusted event study over every meeting and instrument at once.
+
+    Daily returns are turned into a cumulative-sum matrix once, so any
+    window's cumulative return for all meetings and instruments is a single
+    fancy-indexed difference.
+    """
+
+    def __init__(self, dates, levels, names, kinds, estimation_window=ESTIMATION_WINDOW):
+        """
+        Initialize the EventStudy instance.
+
+        Args:
+            dates (numpy.ndarray): Sorted trading dates (datetime64[D]).
+            levels (numpy.ndarray): (n_dates, n_instruments) closing levels, NaN where an instrument has no history.
+            names (list): Instrument display names.
+            kinds (list): "price" or "yield" per instrument.
+            estimation_window (tuple, optional): Normal-return estimation window. Defaults to ESTIMATION_WINDOW.
+        """
+        self.dates = dates
+        self.names = list(names)
+        self.kinds = np.array(kinds)
+        self.estimation_window = estimation_window
+
+        # Daily returns: log returns in percent for prices, basis-point changes for yields;
+        # NaN on the first date and wherever an instrument has no history yet
+        returns = np.full(levels.shape, np.nan)
+        is_yield = self.kinds == "yield"
+        returns[1:, ~is_yield] = np.diff(np.log(levels[:, ~is_yield]), axis=0) * 100
+        returns[1:, is_yield] = np.diff(levels[:, is_yield], axis=0) * 100
+        self.returns = returns
+        # cumulative[t] = sum of returns[0:t]; missing[t] = number of missing returns in [0, t)
+        zeros = np.zeros((1, returns.shape[1]))
+        self.cumulative = np.vstack([zeros, np.cumsum(np.nan_to_num(returns), axis=0)])
+        self.missing = np.vstack([zeros, np.cumsum(np.isnan(returns), axis=0)])
+
+    def event_indices(self, event_dates):
+        """Return the first trading-day index on or after each event date."""
+        return np.searchsorted(self.dates, np.asarray(event_dates, dtype="datetime64[D]"), side="left")
+
+    def run(self, event_dates, windows=DEFAULT_WINDOWS, half_width=PATH_HALF_WIDTH):
+        """
+        Compute raw and abnormal returns for every event, window and instrument.
+
+        Args:
+            event_dates (array-like): Meeting (decision) dates.
+            windows (list, optional): (start, end) offsets in trading days. Defaults to DEFAULT_WINDOWS.
+            half_width (int, optional): Days either side kept for daily paths. Defaults to PATH_HALF_WIDTH.
+
+        Returns:
+            dict: ``events`` (datetime64[D]), ``covered`` (n_events, n_instruments) whether the
+            instrument's history spans the event, ``valid`` (bool per event, any instrument covered),
+            ``windows``, ``raw`` and ``abnormal`` (n_events, n_windows, n_instruments) cumulative
+            returns, ``offsets`` and ``abnormal_path`` (n_events, n_offsets, n_instruments) cumulative
+            abnormal returns from the start of the path, plus ``names`` and ``kinds``. Results of
+            instruments that do not cover an event are NaN.
+        """
+        events = np.asarray(event_dates, dtype="datetime64[D]")
+        e = self.event_indices(events)
+        starts = np.array([w[0] for w in windows])
+        ends = np.array([w[1] for w in windows])
+        est_start, est_end = self.estimation_window
+        n_dates, n_instruments = self.returns.shape
+        offsets = np.arange(-half_width, half_width + 1)
+
+        raw = np.full((len(events), len(windows), n_instruments), np.nan)
+        abnormal = np.full_like(raw, np.nan)
+        abnormal_path = np.full((len(events), len(offsets), n_instruments), np.nan)
+        covered = np.zeros((len(events), n_instruments), dtype=bool)
+
+        # Only events whose whole span lies inside the price history are gathered
+        lowest = min(est_start, starts.min(), -half_width)
+        highest = max(ends.max(), half_width)
+        inside = np.flatnonzero((e + lowest >= 0) & (e + highest < n_dates))
+        if len(inside):
+            e = e[inside]
+            covered[inside] = self.missing[e + highest + 1] == self.missing[e + lowest]
+
+            # Normal daily return per event and instrument: mean over the estimation window
+            normal = (self.cumulative[e + est_end + 1] - self.cumulative[e + est_start]) / (est_end - est_start + 1)
+
+            # Cumulative raw returns for every (event, window) pair in one gather
+            gathered = self.cumulative[e[:, None] + ends[None, :] + 1] - self.cumulative[e[:, None] + starts[None, :]]
+            raw[inside] = gathered
+            abnormal[inside] = gathered - normal[:, None, :] * (ends - starts + 1)[None, :, None]
+
+            daily_abnormal = self.returns[e[:, None] + offsets[None, :]] - normal[:, None, :]
+            abnormal_path[inside] = np.cumsum(daily_abnormal, axis=1)
+
+        # An instrument whose history starts inside an event's span has no result for it
+        raw = np.where(covered[:, None, :], raw, np.nan)
+        abnormal = np.where(covered[:, None, :], abnormal, np.nan)
+        abnormal_path = np.where(covered[:, None, :], abnormal_path, np.nan)
+        return {
+            "events": events,
+            "covered": covered,
+            "valid": covered.any(axis=1),
+            "windows": list(windows),
+            "raw": raw,
+            "abnormal": abnormal,
+            "offsets": offsets,
+            "abnormal_path": abnormal_path,
+            "names": self.names,
+            "kinds": self.kinds.tolist(),
+        }
+
+
+def window_label(window):
+    """Format a (start, end) window as e.g. "[-1, +1]"."""
+    return f"[{window[0]:+d}, {window[1]:+d}]".replace("+0", "0")
+
+
+def event_table(result, event_index):
+    """
+    Tabulate one event's raw and abnormal returns by instrument and window.
+
+    Args:
+        result (dict): Output of ``EventStudy.run``.
+        event_index (int): Position of the event in ``result["events"]``.
+
+    Returns:
+        pandas.DataFrame: One row per instrument, a raw and an abnormal column per window.
+    """
+    columns = {}
+    for w, window in enumerate(result["windows"]):
+        label = window_label(window)
+        columns[f"Return {label}"] = result["raw"][event_index, w]
+        columns[f"Abnormal {label}"] = result["abnormal"][event_index, w]
+    units = ["%" if kind == "price" else "bps" for kind in result["kinds"]]
+    table = pd.DataFrame(columns, index=result["names"]).round(2)
+    table.insert(0, "Unit", units)
+    return table
+
+
+def run_event_study(event_dates, market_dir=MARKET_DIR, windows=DEFAULT_WINDOWS):
+    """
+    Load the local price files and run the event study for all meetings.
+
+    Args:
+        event_dates (array-like): Meeting (decision) dates.
+        market_dir (str, optional): Price file directory. Defaults to MARKET_DIR.
+        windows (list, optional): (start, end) offsets in trading days. Defaults to DEFAULT_WINDOWS.
+
+    Returns:
+        dict: See ``EventStudy.run``; None if no price files are available.
+    """
+    loaded = load_market_levels(market_dir)
+    if loaded is None:
+        return None
+    return EventStudy(*loaded).run(event_dates, windows=windows)
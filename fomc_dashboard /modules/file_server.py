@@ -0,0 +1,268 @@
+import json
+import os
+import re
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+# Local file server running next to Streamlit (Streamlit itself cannot serve byte ranges of arbitrary files)
+FILE_SERVER_HOST = os.environ.get("FOMC_FILE_HOST", "127.0.0.1")
+FILE_SERVER_PORT = int(os.environ.get("FOMC_FILE_PORT", "8502"))
+
+# Base URL browsers use to reach the server, e.g. "http://localhost:8502" on a single machine or an
+# HTTPS path proxied to it. Unset by default: pages then serve files through Streamlit's own origin,
+# and links to this server are opt-in because a browser elsewhere cannot reach it.
+PUBLIC_BASE_URL = os.environ.get("FOMC_FILE_BASE_URL", "").rstrip("/")
+
+COPY_CHUNK_SIZE = 64 * 1024
+
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".txt": "text/plain; charset=utf-8",
+    ".json": "application/json",
+    ".csv": "text/csv; charset=utf-8",
+}
+
+# URL prefix -> (directory, Cache-Control header)
+_routes = {}
+
+# Exact path -> callable returning (HTTP status, JSON-serializable payload)
+_endpoints = {}
+
+
+def register_directory(prefix, directory, cache_control="public, max-age=3600"):
+    """
+    Serve the files of a directory under ``/<prefix>/``.
+
+    Args:
+        prefix (str): First URL path segment, e.g. "documents".
+        directory (str): Directory to serve.
+        cache_control (str, optional): Cache-Control header for its files. Defaults to one hour.
+    """
+    _routes[prefix.strip("/")] = (os.path.realpath(directory), cache_control)
+
+
+def register_endpoint(path, handler):
+    """
+    Answer ``GET <path>`` with JSON, e.g. health checks.
+
+    Args:
+        path (str): Exact URL path, e.g. "/readyz".
+        handler (callable): Called without arguments; returns (status, payload).
+    """
+    _endpoints["/" + path.strip("/")] = handler
+
+
+def file_url(prefix, relative_path):
+    """Return the browser URL of a file served under ``prefix``, or None if no PUBLIC_BASE_URL is set."""
+    if not PUBLIC_BASE_URL:
+        return None
+    return f"{PUBLIC_BASE_URL}/{prefix.strip('/')}/{relative_path.replace(os.sep, '/')}"
+
+
+def parse_range(header, size):
+    """
+    Parse a single-range ``Range: bytes=...`` header.
+
+    Args:
+        header (str): Header value.
+        size (int): File size in bytes.
+
+    Returns:
+        tuple: (start, end) inclusive byte positions; None if the range cannot be satisfied.
+    """
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header)
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return None
+    return start, end
+
+
+class FileRequestHandler(BaseHTTPRequestHandler):
+    """Serve registered directories with ETag revalidation and byte-range support."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def log_message(self, format, *args):
+        # Keep the Streamlit console readable
+        pass
+
+    def _resolve(self):
+        path = unquote(urlsplit(self.path).path).lstrip("/")
+        prefix, _, relative = path.partition("/")
+        if prefix not in _routes or not relative:
+            return None, None
+        directory, cache_control = _routes[prefix]
+        full_path = os.path.realpath(os.path.join(directory, relative))
+        # Reject anything that escapes the registered directory (e.g. "..")
+        if os.path.commonpath([directory, full_path]) != directory or not os.path.isfile(full_path):
+            return None, None
+        return full_path, cache_control
+
+    def _serve_endpoint(self, handler, send_body):
+        status, payload = handler()
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _serve(self, send_body):
+        handler = _endpoints.get(urlsplit(self.path).path.rstrip("/") or "/")
+        if handler is not None:
+            self._serve_endpoint(handler, send_body)
+            return
+
+        full_path, cache_control = self._resolve()
+        if full_path is None:
+            self._send_empty(404)
+            return
+
+        stat = os.stat(full_path)
+        size = stat.st_size
+        etag = f'"{int(stat.st_mtime_ns):x}-{size:x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send_empty(304, etag=etag, cache_control=cache_control)
+            return
+
+        start, end, status = 0, size - 1, 200
+        range_header = self.headers.get("Range")
+        # If-Range: only honour the range when the client's copy is still current
+        if range_header and self.headers.get("If-Range", etag) == etag:
+            byte_range = parse_range(range_header, size)
+            if byte_range is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = byte_range
+            status = 206
+
+        length = end - start + 1 if size else 0
+        self.send_response(status)
+        self.send_header("Content-Type", CONTENT_TYPES.get(os.path.splitext(full_path)[1].lower(), "application/octet-stream"))
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(stat.st_mtime, usegmt=True))
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+
+        if send_body and length:
+            with open(full_path, "rb") as f:
+                f.seek(start)
+                remaining = length
+                while remaining:
+                    chunk = f.read(min(COPY_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+    def _send_empty(self, status, etag=None, cache_control=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if cache_control:
+            self.send_header("Cache-Control", cache_control)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class EndpointRequestHandler(FileRequestHandler):
+    """Serve only the registered endpoints, never files: safe to expose beyond localhost."""
+
+    def _resolve(self):
+        return None, None
+
+
+def serve_endpoints(host, port):
+    """
+    Start a dedicated server for the registered endpoints on a daemon thread.
+
+    Unlike ``start_file_server`` it never falls back to a server another
+    process runs on the port: health probes must describe this process.
+
+    Args:
+        host (str): Bind address, e.g. "0.0.0.0" to be reachable from a load balancer.
+        port (int): Port; 0 picks a free one (see ``server_address`` of the result).
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+
+    Raises:
+        OSError: If the address cannot be bound.
+    """
+    server = ThreadingHTTPServer((host, port), EndpointRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="endpoint-server", daemon=True).start()
+    return server
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_file_server(host=FILE_SERVER_HOST, port=FILE_SERVER_PORT):
+    """
+    Start the process-wide file server on a daemon thread (once).
+
+    If the port is already taken, e.g. by another dashboard process serving
+    the same data directory, that server is used instead.
+
+    Args:
+        host (str, optional): Bind address. Defaults to FILE_SERVER_HOST.
+        port (int, optional): Port. Defaults to FILE_SERVER_PORT.
+
+    Returns:
+        ThreadingHTTPServer: The running server, or None if the port was unavailable.
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), FileRequestHandler)
+            except OSError as e:
+                print(f"File server not started on {host}:{port}: {e}")
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="file-server", daemon=True).start()
+    return _server
+
+
+# Example usage: python -m fomc_dashboard.modules.file_server <directory>  ->  http://localhost:8502/files/<name>
+if __name__ == "__main__":
+    import sys
+
+    register_directory("files", sys.argv[1] if len(sys.argv) > 1 else os.getcwd())
+    server = ThreadingHTTPServer((FILE_SERVER_HOST, FILE_SERVER_PORT), FileRequestHandler)
+    print(f"Serving on {PUBLIC_BASE_URL or f'http://localhost:{FILE_SERVER_PORT}'}/files/")
+    server.serve_forever()
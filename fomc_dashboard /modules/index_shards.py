@@ -0,0 +1,319 @@
+import argparse
+import glob
+import json
+import os
+import pickle
+import re
+import threading
+
+import faiss
+import numpy as np
+
+from fomc_dashboard.modules.document_mirror import MIRROR_DIR
+from fomc_dashboard.modules.document_reader import extract_text_from_pdf
+from fomc_dashboard.modules.meeting_calendar import get_calendar
+from fomc_dashboard.modules.paths import DATA_DIR
+from fomc_dashboard.modules.query_parser import resolve_meeting
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.sentiment import sentence_windows
+
+# Per-year shard indexes and their manifest
+SHARD_DIR = os.path.join(DATA_DIR, "shards")
+
+# Route dated questions to shards (set FOMC_SHARD_ROUTING=0 to always search the full index)
+ROUTING_ENABLED = os.environ.get("FOMC_SHARD_ROUTING", "1") != "0"
+
+CHUNK_SENTENCES = 3
+ENCODE_BATCH_SIZE = 256
+
+# Mirrored file name prefixes and the document type of their chunks
+MIRROR_DOC_TYPES = {"fomcminutes": "minutes", "fomcprojtabl": "sep"}
+MIRROR_FILE_PATTERN = re.compile(r"(fomcminutes|fomcprojtabl)(\d{4})(\d{2})(\d{2})\.pdf$")
+
+
+def mirror_records(mirror_dir=MIRROR_DIR):
+    """
+    Chunk every mirrored minutes and SEP PDF, tagged with its meeting and document type.
+
+    Args:
+        mirror_dir (str, optional): Mirror root. Defaults to MIRROR_DIR.
+
+    Returns:
+        list: Dicts with ``text``, ``meeting`` (ISO date) and ``doc_type``.
+    """
+    records = []
+    for path in sorted(glob.glob(os.path.join(mirror_dir, "*", "*.pdf"))):
+        match = MIRROR_FILE_PATTERN.search(os.path.basename(path))
+        if match is None:
+            continue
+        prefix, year, month, day = match.groups()
+        text = re.sub(r"\s+", " ", extract_text_from_pdf(path))
+        records += [
+            {"text": chunk, "meeting": f"{year}-{month}-{day}", "doc_type": MIRROR_DOC_TYPES[prefix]}
+            for chunk in sentence_windows(text, CHUNK_SENTENCES)
+        ]
+    return records
+
+
+def _read_manifest(shard_dir):
+    try:
+        with open(os.path.join(shard_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"version": 0, "dimension": None, "index": None, "shards": {}}
+
+
+def index_identity(index_path):
+    """Return the identity the manifest records for a full FAISS index file (its resolved path)."""
+    return os.path.realpath(index_path)
+
+
+def shard_records(shard_dir=SHARD_DIR):
+    """
+    Yield the chunk records of every year shard, without loading the FAISS indexes.
+
+    Args:
+        shard_dir (str, optional): Shard directory. Defaults to SHARD_DIR.
+
+    Yields:
+        tuple: (year, records), records ordered by meeting and document type.
+    """
+    for year, shard in sorted(_read_manifest(shard_dir)["shards"].items()):
+        with open(os.path.join(shard_dir, f"{shard['name']}.pkl"), "rb") as f:
+            yield int(year), pickle.load(f)
+
+
+def build_shards(records, shard_dir=SHARD_DIR, embeddings=None, index_path="faiss_index.index"):
+    """
+    Write one flat FAISS index per year, rows ordered by (meeting, document type).
+
+    Because of that order every meeting, and every document type within a
+    meeting, is a contiguous row range of its year's shard; the manifest
+    records those ranges so a search can be limited to them without a
+    separate index per meeting. Files are versioned like the rate store, so
+    a rebuild never overwrites a shard a running reader has loaded.
+
+    The shards split the documents of one full index, recorded in the
+    manifest; questions against any other index are never routed to them.
+
+    Args:
+        records (list): Dicts with ``text``, ``meeting`` (ISO date) and ``doc_type``.
+        shard_dir (str, optional): Output directory. Defaults to SHARD_DIR.
+        embeddings (numpy.ndarray, optional): Embeddings aligned with ``records``; encoded with the
+            shared model when omitted.
+        index_path (str, optional): Full FAISS index the shards split. Defaults to "faiss_index.index".
+
+    Returns:
+        dict: The new manifest.
+    """
+    order = sorted(range(len(records)), key=lambda i: (records[i]["meeting"], records[i]["doc_type"]))
+    records = [records[i] for i in order]
+    if embeddings is None:
+        embeddings = get_resource("embedding_model").encode(
+            [record["text"] for record in records], batch_size=ENCODE_BATCH_SIZE
+        )
+    else:
+        embeddings = np.asarray(embeddings)[order]
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    os.makedirs(shard_dir, exist_ok=True)
+    old_manifest = _read_manifest(shard_dir)
+    version = old_manifest["version"] + 1
+    manifest = {
+        "version": version, "dimension": int(embeddings.shape[1]), "index": index_identity(index_path), "shards": {},
+    }
+    years = np.array([int(record["meeting"][:4]) for record in records], dtype=np.int64)
+
+    for year in np.unique(years):
+        start, end = np.searchsorted(years, year, side="left"), np.searchsorted(years, year, side="right")
+        name = f"{year}-{version}"
+        index = faiss.IndexFlatL2(embeddings.shape[1])
+        index.add(embeddings[start:end])
+        faiss.write_index(index, os.path.join(shard_dir, f"{name}.index"))
+        shard_records = records[start:end]
+        with open(os.path.join(shard_dir, f"{name}.pkl"), "wb") as f:
+            pickle.dump(shard_records, f)
+
+        ranges = []
+        for row, record in enumerate(shard_records):
+            key = [record["meeting"], record["doc_type"]]
+            if ranges and ranges[-1][:2] == key:
+                ranges[-1][3] = row + 1
+            else:
+                ranges.append(key + [row, row + 1])
+        manifest["shards"][str(year)] = {"name": name, "vectors": int(end - start), "ranges": ranges}
+
+    tmp_path = os.path.join(shard_dir, "manifest.json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, os.path.join(shard_dir, "manifest.json"))
+
+    for shard in old_manifest["shards"].values():
+        for suffix in (".index", ".pkl"):
+            try:
+                os.remove(os.path.join(shard_dir, shard["name"] + suffix))
+            except OSError:
+                pass  # Still open in a reader on Windows; an orphaned old version is harmless
+    return manifest
+
+
+class ShardedIndex:
+    """
+    Per-year FAISS shards searched only where a question points.
+
+    ``route`` turns a parsed question (see ``query_parser.parse_query``) into
+    the row ranges to search: one meeting, a set of years, optionally limited
+    to some document types, or "global" when the question names no date the
+    shards cover. Shards are loaded on first use.
+    """
+
+    def __init__(self, shard_dir=SHARD_DIR):
+        """
+        Initialize the ShardedIndex instance from the shard manifest.
+
+        Args:
+            shard_dir (str, optional): Shard directory. Defaults to SHARD_DIR.
+        """
+        self.shard_dir = shard_dir
+        self.manifest = _read_manifest(shard_dir)
+        self._lock = threading.Lock()
+        self._shards = {}
+        self.ranges = [
+            (int(year), np.datetime64(meeting, "D"), doc_type, start, end)
+            for year, shard in self.manifest["shards"].items()
+            for meeting, doc_type, start, end in shard["ranges"]
+        ]
+        self.meetings = np.unique(np.array([r[1] for r in self.ranges], dtype="datetime64[D]"))
+
+    @property
+    def available(self):
+        """True if any shard has been built."""
+        return bool(self.manifest["shards"])
+
+    def serves(self, index_path):
+        """True if the shards were built from the given full index (see ``build_shards``)."""
+        return self.available and self.manifest.get("index") == index_identity(index_path)
+
+    def _shard(self, year):
+        shard = self._shards.get(year)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.get(year)
+                if shard is None:
+                    name = self.manifest["shards"][str(year)]["name"]
+                    index = faiss.read_index(os.path.join(self.shard_dir, f"{name}.index"))
+                    with open(os.path.join(self.shard_dir, f"{name}.pkl"), "rb") as f:
+                        records = pickle.load(f)
+                    # Zero-copy view of the stored vectors, for searches limited to a row range
+                    vectors = faiss.rev_swig_ptr(index.get_xb(), index.ntotal * index.d).reshape(index.ntotal, index.d)
+                    shard = self._shards[year] = (index, vectors, records)
+        return shard
+
+    def route(self, parsed, today=None):
+        """
+        Decide which shard rows a question should search.
+
+        A meeting reference is resolved against the meeting calendar, not
+        just the meetings with shard rows: a meeting whose minutes are not
+        out yet (the latest one, for about three weeks) routes globally
+        rather than to the previous meeting or to its whole year.
+
+        Args:
+            parsed (dict): Output of ``query_parser.parse_query``.
+            today (date-like, optional): Reference date for "latest meeting". Defaults to today.
+
+        Returns:
+            dict: ``kind`` ("meeting", "years" or "global"), ``meeting`` (ISO date or None), ``years``,
+            ``doc_types`` and ``ranges`` as (year, start, end) row ranges, adjacent ranges merged.
+        """
+        reference = parsed["meeting"]
+        meeting = None
+        if reference:
+            meeting = resolve_meeting(reference, get_calendar().dates, today)
+            if meeting is None:
+                # Not a calendar meeting (or no calendar): try the meetings the shards hold
+                meeting = resolve_meeting(reference, self.meetings, today)
+        years = set(parsed["years"])
+        if meeting is not None and meeting not in self.meetings:
+            # A known meeting without indexed documents: answering from another meeting would be wrong
+            return self._global_route()
+        if meeting is None and reference and reference["year"]:
+            # A date that is no known meeting: fall back to its year
+            years.add(reference["year"])
+
+        if meeting is not None:
+            kind, selected = "meeting", [r for r in self.ranges if r[1] == meeting]
+        elif years:
+            kind, selected = "years", [r for r in self.ranges if r[0] in years]
+        else:
+            kind, selected = "global", []
+        if parsed["doc_types"]:
+            # Ignore a document type the selected meetings or years do not have
+            selected = [r for r in selected if r[2] in parsed["doc_types"]] or selected
+        if not selected:
+            return self._global_route()
+
+        ranges = []
+        for year, _, _, start, end in sorted(selected, key=lambda r: (r[0], r[3])):
+            if ranges and ranges[-1][0] == year and ranges[-1][2] == start:
+                ranges[-1][2] = end
+            else:
+                ranges.append([year, start, end])
+        return {
+            "kind": kind,
+            "meeting": str(meeting) if meeting is not None else None,
+            "years": sorted({r[0] for r in selected}),
+            "doc_types": sorted({r[2] for r in selected}),
+            "ranges": [tuple(r) for r in ranges],
+        }
+
+    @staticmethod
+    def _global_route():
+        return {"kind": "global", "meeting": None, "years": [], "doc_types": [], "ranges": []}
+
+    def search(self, query_embedding, route, top_k=5):
+        """
+        Search the row ranges of a route.
+
+        A single range is returned as searched; results of several ranges are
+        merged by distance.
+
+        Args:
+            query_embedding (numpy.ndarray): Query embedding.
+            route (dict): Output of ``route`` (not "global").
+            top_k (int, optional): Number of results. Defaults to 5.
+
+        Returns:
+            list: Dicts with ``text``, ``distance``, ``meeting`` and ``doc_type``, closest first.
+        """
+        query = np.ascontiguousarray(query_embedding, dtype=np.float32).reshape(1, -1)
+        found = []
+        for year, start, end in route["ranges"]:
+            index, vectors, records = self._shard(year)
+            k = min(top_k, end - start)
+            if start == 0 and end == index.ntotal:
+                distances, rows = index.search(query, k)
+            else:
+                distances, rows = faiss.knn(query, vectors[start:end], k)
+                rows = rows + start
+            found += [(float(d), records[row]) for d, row in zip(distances[0], rows[0]) if row >= 0]
+        if len(route["ranges"]) > 1:
+            found = sorted(found, key=lambda item: item[0])[:top_k]
+        return [
+            {"text": record["text"], "distance": distance, "meeting": record["meeting"], "doc_type": record["doc_type"]}
+            for distance, record in found
+        ]
+
+
+# Offline build from the document mirror: python -m fomc_dashboard.modules.index_shards [--index-file faiss_index]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build per-year shards of a FAISS index from the document mirror.")
+    parser.add_argument("--index-file", default="faiss_index", help="Full index the shards split, without \".index\".")
+    args = parser.parse_args()
+
+    records = mirror_records()
+    if not records:
+        print(f"No minutes or SEP PDFs under '{MIRROR_DIR}'; run the document mirror first.")
+    else:
+        manifest = build_shards(records, index_path=f"{args.index_file}.index")
+        print(f"Wrote {len(manifest['shards'])} year shards ({len(records)} chunks) to '{SHARD_DIR}'.")
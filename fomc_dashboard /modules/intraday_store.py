@@ -0,0 +1,269 @@
+import glob
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.paths import DATA_DIR
+
+# Store location; raw minute/tick drops go in incoming/<SYMBOL>*.csv (or .parquet)
+INTRADAY_DIR = os.path.join(DATA_DIR, "intraday")
+
+# Statement release time and the window kept around it
+ANNOUNCEMENT_TIME = "14:00"
+MARKET_TZ = "America/New_York"
+WINDOW_MINUTES = 60
+
+COLUMNS = ("ts", "price", "volume")
+
+
+def _utc_nanoseconds(timestamps):
+    """Convert a tz-aware DatetimeIndex to int64 UTC epoch nanoseconds, whatever its resolution."""
+    return timestamps.tz_convert("UTC").tz_localize(None).to_numpy().astype("datetime64[ns]").astype(np.int64)
+
+
+def announcement_times(meeting_dates, announcement_time=ANNOUNCEMENT_TIME):
+    """
+    Return the UTC statement release time of each meeting as int64 nanoseconds.
+
+    Args:
+        meeting_dates (array-like): Meeting (decision) dates.
+        announcement_time (str, optional): Local release time. Defaults to ANNOUNCEMENT_TIME.
+
+    Returns:
+        numpy.ndarray: int64 epoch nanoseconds.
+    """
+    local = pd.DatetimeIndex(pd.to_datetime(np.asarray(meeting_dates, dtype="datetime64[D]")))
+    local = local + pd.Timedelta(f"{announcement_time}:00")
+    return _utc_nanoseconds(local.tz_localize(MARKET_TZ))
+
+
+def read_tick_file(path, source_tz=MARKET_TZ):
+    """
+    Read one drop file with a timestamp column, a price column and an optional volume column.
+
+    Naive timestamps are interpreted in ``source_tz``.
+
+    Args:
+        path (str): CSV or Parquet file path (Parquet needs pyarrow or fastparquet).
+        source_tz (str, optional): Time zone of naive timestamps. Defaults to MARKET_TZ.
+
+    Returns:
+        pandas.DataFrame: Columns ``ts`` (int64 UTC ns), ``price`` and ``volume``.
+    """
+    df = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    df.columns = [c.lower() for c in df.columns]
+    ts_column = next(c for c in ("timestamp", "datetime", "time", "date") if c in df.columns)
+    price_column = next(c for c in ("price", "close", "last") if c in df.columns)
+
+    timestamps = pd.DatetimeIndex(pd.to_datetime(df[ts_column]))
+    if timestamps.tz is None:
+        timestamps = timestamps.tz_localize(source_tz)
+    return pd.DataFrame({
+        "ts": _utc_nanoseconds(timestamps),
+        "price": df[price_column].to_numpy(dtype=np.float64),
+        "volume": df["volume"].to_numpy(dtype=np.float64) if "volume" in df.columns else np.zeros(len(df)),
+    })
+
+
+def build_offset_table(ts, meeting_dates, minutes=WINDOW_MINUTES):
+    """
+    Locate each meeting's announcement window in a sorted timestamp column.
+
+    Args:
+        ts (numpy.ndarray): Sorted int64 UTC nanosecond timestamps.
+        meeting_dates (array-like): Meeting (decision) dates.
+        minutes (int, optional): Minutes kept either side of the release. Defaults to WINDOW_MINUTES.
+
+    Returns:
+        numpy.ndarray: (n_meetings, 2) start/end row offsets; empty windows have start == end.
+    """
+    centers = announcement_times(meeting_dates)
+    half_width = np.int64(minutes) * 60 * 10**9
+    starts = np.searchsorted(ts, centers - half_width, side="left")
+    ends = np.searchsorted(ts, centers + half_width, side="right")
+    return np.stack([starts, ends], axis=1).astype(np.int64)
+
+
+def build_intraday_store(meeting_dates, store_dir=INTRADAY_DIR, minutes=WINDOW_MINUTES):
+    """
+    Build columnar arrays and the per-meeting offset table from the drop folder.
+
+    Each symbol's drops are merged, sorted and de-duplicated by timestamp,
+    then written as a new version directory of .npy columns; the manifest is
+    switched to it last so running dashboards keep reading a complete version.
+
+    Args:
+        meeting_dates (array-like): Meeting (decision) dates to index.
+        store_dir (str, optional): Store directory. Defaults to INTRADAY_DIR.
+        minutes (int, optional): Minutes kept either side of the release. Defaults to WINDOW_MINUTES.
+
+    Returns:
+        dict: Symbol -> number of rows written.
+    """
+    drops = {}
+    for path in sorted(glob.glob(os.path.join(store_dir, "incoming", "*"))):
+        if path.endswith((".csv", ".parquet")):
+            symbol = os.path.basename(path).split(".")[0].split("_")[0].upper()
+            drops.setdefault(symbol, []).append(path)
+
+    meetings = np.unique(np.asarray(meeting_dates, dtype="datetime64[D]"))
+    manifest = read_manifest(store_dir)
+    version = time.strftime("%Y%m%d%H%M%S")
+    rows = {}
+    for symbol, paths in drops.items():
+        df = pd.concat([read_tick_file(path) for path in paths], ignore_index=True)
+        df = df.sort_values("ts", kind="stable").drop_duplicates("ts", keep="last")
+
+        symbol_dir = os.path.join(store_dir, f"{symbol}-{version}")
+        os.makedirs(symbol_dir, exist_ok=True)
+        for column in COLUMNS:
+            np.save(os.path.join(symbol_dir, f"{column}.npy"), df[column].to_numpy())
+        np.save(os.path.join(symbol_dir, "offsets.npy"), build_offset_table(df["ts"].to_numpy(), meetings, minutes))
+        np.save(os.path.join(symbol_dir, "meetings.npy"), meetings)
+
+        manifest["symbols"][symbol] = os.path.basename(symbol_dir)
+        rows[symbol] = len(df)
+
+    manifest["window_minutes"] = minutes
+    tmp_path = os.path.join(store_dir, "manifest.json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(store_dir, "manifest.json"))
+    return rows
+
+
+def read_manifest(store_dir=INTRADAY_DIR):
+    try:
+        with open(os.path.join(store_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"symbols": {}, "window_minutes": WINDOW_MINUTES}
+
+
+class IntradayStore:
+    """
+    Read side of the intraday store: memory-mapped columns plus an offset table.
+
+    Announcement windows are returned as slices of the mapped arrays, so no
+    data is copied until a window is resampled.
+    """
+
+    def __init__(self, store_dir=INTRADAY_DIR):
+        """
+        Initialize the IntradayStore instance.
+
+        Args:
+            store_dir (str, optional): Store directory. Defaults to INTRADAY_DIR.
+        """
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        self._manifest_mtime = None
+        self._symbols = {}
+        self.window_minutes = WINDOW_MINUTES
+        self.refresh()
+
+    def refresh(self):
+        """Re-map the columns if the builder has published a new version."""
+        path = os.path.join(self.store_dir, "manifest.json")
+        mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        if mtime == self._manifest_mtime:
+            return
+        with self._lock:
+            manifest = read_manifest(self.store_dir)
+            symbols = {}
+            for symbol, directory in manifest["symbols"].items():
+                symbol_dir = os.path.join(self.store_dir, directory)
+                symbols[symbol] = {
+                    name: np.load(os.path.join(symbol_dir, f"{name}.npy"), mmap_mode="r")
+                    for name in COLUMNS + ("offsets", "meetings")
+                }
+            self._symbols = symbols
+            self.window_minutes = manifest["window_minutes"]
+            self._manifest_mtime = mtime
+
+    def symbols(self):
+        """Return the available symbols."""
+        return sorted(self._symbols)
+
+    def meetings(self, symbol):
+        """Return the indexed meetings that have data in their window, as datetime64[D]."""
+        columns = self._symbols[symbol]
+        offsets = columns["offsets"]
+        return columns["meetings"][offsets[:, 1] > offsets[:, 0]]
+
+    def window(self, symbol, meeting_date, minutes=None):
+        """
+        Return the rows around a meeting's announcement as zero-copy views.
+
+        Args:
+            symbol (str): Symbol to read.
+            meeting_date (date-like): Meeting (decision) date.
+            minutes (int, optional): Minutes either side. Defaults to the indexed window.
+
+        Returns:
+            dict: ``ts``, ``price`` and ``volume`` array views, plus ``center`` (release time, UTC ns).
+        """
+        columns = self._symbols[symbol]
+        meeting = np.datetime64(meeting_date, "D")
+        center = announcement_times([meeting])[0]
+
+        position = np.searchsorted(columns["meetings"], meeting)
+        indexed = position < len(columns["meetings"]) and columns["meetings"][position] == meeting
+        if indexed and minutes in (None, self.window_minutes):
+            start, end = columns["offsets"][position]
+        else:
+            half_width = np.int64(minutes or self.window_minutes) * 60 * 10**9
+            start = np.searchsorted(columns["ts"], center - half_width, side="left")
+            end = np.searchsorted(columns["ts"], center + half_width, side="right")
+
+        window = {name: columns[name][start:end] for name in COLUMNS}
+        window["center"] = center
+        return window
+
+
+def resample_window(window, minutes=1):
+    """
+    Aggregate a window into OHLC bars with summed volume.
+
+    Args:
+        window (dict): Output of ``IntradayStore.window``.
+        minutes (int, optional): Bar size in minutes. Defaults to 1.
+
+    Returns:
+        pandas.DataFrame: ``Time`` (US/Eastern), ``Minutes From Release``, ``Open``, ``High``,
+        ``Low``, ``Close`` and ``Volume``, one row per non-empty bar.
+    """
+    ts, price, volume = window["ts"], window["price"], window["volume"]
+    if not len(ts):
+        return pd.DataFrame(columns=["Time", "Minutes From Release", "Open", "High", "Low", "Close", "Volume"])
+
+    step = np.int64(minutes) * 60 * 10**9
+    # Bars aligned so that one starts exactly at the release time
+    buckets = (ts - window["center"]) // step
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(buckets)) + 1])
+    ends = np.append(starts[1:], len(ts)) - 1
+
+    bar_times = window["center"] + buckets[starts] * step
+    return pd.DataFrame({
+        "Time": pd.to_datetime(bar_times, utc=True).tz_convert(MARKET_TZ),
+        "Minutes From Release": buckets[starts] * minutes,
+        "Open": price[starts],
+        "High": np.maximum.reduceat(price, starts),
+        "Low": np.minimum.reduceat(price, starts),
+        "Close": price[ends],
+        "Volume": np.add.reduceat(volume, starts),
+    })
+
+
+# Offline build: python -m fomc_dashboard.modules.intraday_store [2024-11-07 2024-12-18 ...] (defaults to every past meeting)
+if __name__ == "__main__":
+    from fomc_dashboard.modules.meeting_calendar import get_calendar
+
+    built = build_intraday_store(sys.argv[1:] or get_calendar().previous())
+    for symbol, count in built.items():
+        print(f"{symbol}: {count:,} rows")
@@ -0,0 +1,28 @@
+import sys
+
+from streamlit.web import cli as stcli
+
+from fomc_dashboard.modules.warmup import get_warmup
+
+
+def main(argv=None):
+    """
+    Start the warm-up and the health probes, then run the dashboard in this process.
+
+    Streamlit only imports page code when the first session renders, so a
+    worker started with ``streamlit run`` would report "not ready" on
+    ``/readyz`` until someone opened a page, and a readiness-gated load
+    balancer never sends anyone. Launched this way, the probes answer and
+    the warm-up runs from the moment the server starts.
+
+    Args:
+        argv (list, optional): ``streamlit run`` arguments (script path first). Defaults to ``sys.argv[1:]``.
+    """
+    get_warmup()
+    sys.argv = ["streamlit", "run", *(sys.argv[1:] if argv is None else argv)]
+    stcli.main()
+
+
+# Run: [FOMC_PROBE_PORT=8503] python -m fomc_dashboard.modules.launcher app.py [--server.port 8501 ...]
+if __name__ == "__main__":
+    main()
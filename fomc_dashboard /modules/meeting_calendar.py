@@ -0,0 +1,159 @@
+import os
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.paths import DATA_DIR
+
+# Maintained schedule (past and announced future decision dates)
+SCHEDULE_FILE = os.path.join(DATA_DIR, "fomc_schedule.csv")
+
+# Meeting dates saved by data_fetcher.py, one ISO date per line
+CRAWLED_FILE = os.path.join(DATA_DIR, "fomc_meeting_dates.txt")
+
+
+def _read_schedule(path):
+    if not os.path.exists(path):
+        return np.empty(0, dtype="datetime64[D]"), np.empty(0, dtype="datetime64[D]")
+    df = pd.read_csv(path)
+    dates = pd.to_datetime(df["date"]).to_numpy().astype("datetime64[D]")
+    sep = df["sep"].astype(bool).to_numpy() if "sep" in df.columns else np.zeros(len(df), dtype=bool)
+    return dates, dates[sep]
+
+
+def _read_crawled(path):
+    if not os.path.exists(path):
+        return np.empty(0, dtype="datetime64[D]")
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    return np.array(lines, dtype="datetime64[D]")
+
+
+class MeetingCalendar:
+    """
+    FOMC decision dates held as one sorted datetime64 array.
+
+    Built from the schedule file plus the crawled meeting dates; every lookup
+    is a binary search, and ``refresh`` rebuilds the array when either file
+    changes on disk.
+    """
+
+    def __init__(self, schedule_file=SCHEDULE_FILE, crawled_file=CRAWLED_FILE):
+        """
+        Initialize the MeetingCalendar instance.
+
+        Args:
+            schedule_file (str, optional): Schedule CSV path. Defaults to SCHEDULE_FILE.
+            crawled_file (str, optional): Crawled dates file path. Defaults to CRAWLED_FILE.
+        """
+        self.sources = [schedule_file, crawled_file]
+        self._lock = threading.Lock()
+        self._signature = None
+        self.dates = np.empty(0, dtype="datetime64[D]")
+        self.sep_dates = np.empty(0, dtype="datetime64[D]")
+        self.refresh()
+
+    def refresh(self):
+        """
+        Rebuild the calendar if a source file was added, removed or modified.
+
+        Returns:
+            bool: True if the calendar was rebuilt.
+        """
+        signature = tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in self.sources)
+        if signature == self._signature:
+            return False
+        with self._lock:
+            scheduled, sep_dates = _read_schedule(self.sources[0])
+            crawled = _read_crawled(self.sources[1])
+            # Swap in new arrays; readers holding the old ones are unaffected
+            self.dates = np.unique(np.concatenate([scheduled, crawled]))
+            self.sep_dates = np.unique(sep_dates)
+            self._signature = signature
+        return True
+
+    def next_meeting(self, today=None):
+        """
+        Return the first meeting on or after ``today``.
+
+        Args:
+            today (date-like, optional): Reference date. Defaults to today.
+
+        Returns:
+            datetime.date: Next meeting, or None if none is scheduled.
+        """
+        dates = self.dates
+        i = np.searchsorted(dates, np.datetime64(today or date.today(), "D"), side="left")
+        return dates[i].astype(object) if i < len(dates) else None
+
+    def previous(self, n=None, today=None):
+        """
+        Return the last ``n`` meetings strictly before ``today``, oldest first.
+
+        Args:
+            n (int, optional): Number of meetings. Defaults to all past meetings.
+            today (date-like, optional): Reference date. Defaults to today.
+
+        Returns:
+            numpy.ndarray: datetime64[D] meeting dates.
+        """
+        dates = self.dates
+        i = np.searchsorted(dates, np.datetime64(today or date.today(), "D"), side="left")
+        return dates[:i] if n is None else dates[max(i - n, 0):i]
+
+    def between(self, start, end):
+        """
+        Return the meetings between two dates (inclusive).
+
+        Args:
+            start (date-like): First date.
+            end (date-like): Last date.
+
+        Returns:
+            numpy.ndarray: datetime64[D] meeting dates.
+        """
+        dates = self.dates
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+        return dates[lo:hi]
+
+    def nearest(self, day):
+        """
+        Return the meeting closest to ``day``.
+
+        Args:
+            day (date-like): Reference date.
+
+        Returns:
+            datetime.date: Closest meeting, or None if the calendar is empty.
+        """
+        dates = self.dates
+        if not len(dates):
+            return None
+        day = np.datetime64(day, "D")
+        i = np.searchsorted(dates, day)
+        candidates = dates[max(i - 1, 0):i + 1]
+        return candidates[np.argmin(np.abs(candidates - day))].astype(object)
+
+
+_calendar = None
+_calendar_lock = threading.Lock()
+
+
+def get_calendar():
+    """
+    Return the process-wide meeting calendar, refreshed from disk if its sources changed.
+
+    Returns:
+        MeetingCalendar: Shared calendar instance.
+    """
+    global _calendar
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                _calendar = MeetingCalendar()
+                return _calendar
+    _calendar.refresh()
+    return _calendar
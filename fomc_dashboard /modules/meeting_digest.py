@@ -0,0 +1,506 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.document_mirror import MINUTES_DIR
+from fomc_dashboard.modules.document_reader import extract_text_from_pdf
+from fomc_dashboard.modules.meeting_calendar import get_calendar
+from fomc_dashboard.modules.paths import DATA_DIR
+from fomc_dashboard.modules.query_parser import parse_meeting_reference, resolve_meeting
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.sentiment import sentence_windows
+from fomc_dashboard.modules.statement_diff import align_sentences, policy_roll_call, policy_statement
+
+# SQLite store, one row per meeting; minutes are read from the document mirror
+DIGEST_DB = os.path.join(DATA_DIR, "digests", "digests.sqlite")
+
+# Answer meeting questions from digests (set FOMC_DIGESTS=0 to always use retrieval)
+DIGESTS_ENABLED = os.environ.get("FOMC_DIGESTS", "1") != "0"
+
+# Bump when the digest format or extraction changes, so the next build redoes every meeting
+DIGEST_VERSION = 5
+
+# Passages ranked against this query when picking a meeting's top passages
+DIGEST_QUERY = "What did the Committee decide about the federal funds rate and why?"
+TOP_PASSAGES = 3
+PASSAGE_SENTENCES = 3
+MAX_STATEMENT_CHANGES = 5
+
+# A day reference matches a meeting up to this many days away (meetings span two days)
+MEETING_DAY_TOLERANCE = 3
+
+# Questions about a meeting's decision, vote or outcome; anything else goes to retrieval
+DIGEST_INTENT_PATTERN = re.compile(
+    r"\b(?:happen\w*|decid\w*|decision\w*|outcome|vot\w*|dissent\w*|hike\w*|cut\w*|hold|held|target range|"
+    r"summar\w*|(?:rais\w*|lower\w*)\s+(?:the\s+)?(?:interest\s+|policy\s+|federal\s+funds\s+)?rates?|"
+    r"(?:rate|policy)\s+chang\w*)\b",
+    re.IGNORECASE,
+)
+# A question naming a topic beyond the decision ("...say about the labor market?") needs retrieval
+DIGEST_TOPIC_PATTERN = re.compile(
+    r"\b(?:say|said|says|describ\w*|mention\w*|discuss\w*|assess\w*|view\w*|outlook|inflation|prices|labou?r|"
+    r"employment|unemployment|jobs|wages|growth|economy|economic|financial conditions|balance sheet|risks?)\b",
+    re.IGNORECASE,
+)
+
+# "5-1/4", "1/4", "0", "4.25"
+RATE_PATTERN = r"\d+-\d/\d|\d/\d|\d+(?:\.\d+)?"
+# "...to raise the target range for the federal funds rate to 5-1/4 to 5-1/2 percent", and the recent
+# "...to lower the target range for the federal funds rate by 1/2 percentage point to 4-3/4 to 5 percent"
+DECISION_PATTERN = re.compile(
+    r"(?:decided|voted|agreed)\s+to\s+(raise|increase|lower|reduce|decrease|maintain|keep|leave)\s+the\s+target\s+"
+    r"range\s+for\s+the\s+federal\s+funds\s+rate\s+(?:unchanged\s+)?"
+    rf"(?:by\s+(?:{RATE_PATTERN})\s+(?:percentage\s+points?|basis\s+points?)\s+)?"
+    rf"(?:at|to)\s+({RATE_PATTERN})\s+to\s+({RATE_PATTERN})\s+percent",
+    re.IGNORECASE,
+)
+DECISION_VERBS = {
+    "raise": "hike", "increase": "hike", "lower": "cut", "reduce": "cut", "decrease": "cut",
+    "maintain": "hold", "keep": "hold", "leave": "hold",
+}
+VOTE_PATTERN = re.compile(r"Voting for this action:\s*(.+?)\s*Voting against this action:\s*(.*?[a-z]{2,})\.", re.DOTALL)
+
+
+def parse_rate(token):
+    """Convert a minutes-style rate ("5-1/4", "1/4", "4.25") to a float."""
+    if "/" not in token:
+        return float(token)
+    whole, _, fraction = token.rpartition("-")
+    numerator, denominator = fraction.split("/")
+    return float(whole or 0) + int(numerator) / int(denominator)
+
+
+def parse_decision(text):
+    """
+    Find the policy decision in minutes text.
+
+    Returns:
+        tuple: (decision, range low, range high) with decision "hike", "cut" or "hold", or None.
+
+    Examples:
+        >>> parse_decision("The Committee decided to raise the target range for the federal funds rate "
+        ...                "to 5-1/4 to 5-1/2 percent.")
+        ('hike', 5.25, 5.5)
+        >>> parse_decision("The Committee decided to lower the target range for the federal funds rate "
+        ...                "by 1/2 percentage point to 4-3/4 to 5 percent.")
+        ('cut', 4.75, 5.0)
+        >>> parse_decision("The Committee decided to lower the target range for the federal funds rate "
+        ...                "by 1/4 percentage point to 4-1/2 to 4-3/4 percent.")
+        ('cut', 4.5, 4.75)
+        >>> parse_decision("The Committee decided to maintain the target range for the federal funds rate "
+        ...                "at 5-1/4 to 5-1/2 percent.")
+        ('hold', 5.25, 5.5)
+        >>> parse_decision("The Committee decided to keep the target range for the federal funds rate "
+        ...                "unchanged at 0 to 1/4 percent.")
+        ('hold', 0.0, 0.25)
+        >>> parse_decision("The Committee decided to raise the target range for the federal funds rate "
+        ...                "by 75 basis points to 1-1/2 to 1-3/4 percent.")
+        ('hike', 1.5, 1.75)
+    """
+    match = DECISION_PATTERN.search(text)
+    if match is None:
+        return None
+    verb, low, high = match.groups()
+    return DECISION_VERBS[verb.lower()], parse_rate(low), parse_rate(high)
+
+
+def _names(segment):
+    names = [name.strip(" .") for name in re.split(r",\s*(?:and\s+)?|\s+and\s+", segment)]
+    return [name for name in names if name and name.lower() != "none"]
+
+
+def parse_vote(text):
+    """
+    Read the roll call of the policy action from minutes text.
+
+    The roll call is located with ``statement_diff.policy_roll_call``, since
+    the first one in the minutes is not always the policy vote.
+
+    Returns:
+        dict: ``for`` and ``against`` lists of names, or None if no roll call was found.
+    """
+    position = policy_roll_call(text)
+    if position < 0:
+        return None
+    match = VOTE_PATTERN.match(text, position)
+    if match is None:
+        return None
+    return {"for": _names(match.group(1)), "against": _names(match.group(2))}
+
+
+def statement_changes(previous, current, encoder, limit=MAX_STATEMENT_CHANGES):
+    """
+    List the sentences that changed between two policy statements.
+
+    Args:
+        previous (list): Sentences of the previous statement.
+        current (list): Sentences of this statement.
+        encoder (SentenceTransformer): Embedding model used to align the sentences.
+        limit (int, optional): Maximum changes returned. Defaults to MAX_STATEMENT_CHANGES.
+
+    Returns:
+        list: Rows of ``statement_diff.align_sentences`` other than the unchanged ones.
+    """
+    embeddings = np.asarray(encoder.encode(previous + current), dtype=np.float32)
+    rows = align_sentences(previous, current, embeddings[:len(previous)], embeddings[len(previous):])
+    return [row for row in rows if row["change"] != "unchanged"][:limit]
+
+
+def top_passages(text, encoder, query=DIGEST_QUERY, n=TOP_PASSAGES):
+    """
+    Rank windows of consecutive sentences by embedding distance to a query.
+
+    Args:
+        text (str): Document text.
+        encoder (SentenceTransformer): Embedding model.
+        query (str, optional): Ranking query. Defaults to DIGEST_QUERY.
+        n (int, optional): Passages returned. Defaults to TOP_PASSAGES.
+
+    Returns:
+        list: Dicts with ``text`` and ``distance`` (squared L2, as in FAISS), closest first.
+    """
+    passages = sentence_windows(text, PASSAGE_SENTENCES)
+    if not passages:
+        return []
+    embeddings = np.asarray(encoder.encode([query] + passages), dtype=np.float32)
+    distances = ((embeddings[1:] - embeddings[0]) ** 2).sum(axis=1)
+    order = np.argsort(distances)[:n]
+    return [{"text": passages[i], "distance": float(distances[i])} for i in order]
+
+
+def rate_around(dates, values, meeting):
+    """
+    Return the rate before and after a decision from a date-sorted series.
+
+    Returns:
+        tuple: (rate the day before, rate the day after); either is None when the series does not cover it.
+    """
+    meeting = np.datetime64(meeting, "D")
+    before = np.searchsorted(dates, meeting, side="left") - 1
+    after = np.searchsorted(dates, meeting + 1, side="right") - 1
+    covered = len(dates) and dates[-1] >= meeting
+    return (
+        float(values[before]) if before >= 0 else None,
+        float(values[after]) if after >= 0 and covered else None,
+    )
+
+
+def build_digest(meeting, minutes_text, previous_statement, rates, encoder=None):
+    """
+    Compute the digest of one meeting.
+
+    Args:
+        meeting (numpy.datetime64): Decision date.
+        minutes_text (str): Minutes text, or None if the minutes are not mirrored.
+        previous_statement (list): Policy statement sentences of the previous meeting.
+        rates (tuple): (rate before, rate after) from ``rate_around``.
+        encoder (SentenceTransformer, optional): Embedding model for the top passages.
+
+    Returns:
+        dict: ``meeting``, ``decision``, ``change_bp``, ``range_low``, ``range_high``, ``vote``,
+        ``statement_changes``, ``passages`` and ``sources``, or None without minutes or rate data.
+    """
+    before, after = rates
+    parsed = parse_decision(minutes_text) if minutes_text else None
+    if parsed is None and after is None:
+        return None
+
+    if before is not None and after is not None:
+        # Round to whole 25bp steps; the effective rate drifts a few basis points within the range
+        change_bp = int(round((after - before) * 4)) * 25
+    else:
+        change_bp = None
+    if parsed is not None:
+        decision, low, high = parsed
+    else:
+        low = np.floor(after * 4) / 4
+        high = low + 0.25
+        decision = None if change_bp is None else "hike" if change_bp > 0 else "cut" if change_bp < 0 else "hold"
+
+    statement = policy_statement(minutes_text) if minutes_text else []
+    return {
+        "meeting": str(meeting),
+        "decision": decision,
+        "change_bp": change_bp,
+        "range_low": float(low),
+        "range_high": float(high),
+        "vote": parse_vote(minutes_text) if minutes_text else None,
+        "statement": statement,
+        "statement_changes": (
+            statement_changes(previous_statement, statement, encoder)
+            if statement and previous_statement and encoder is not None else []
+        ),
+        "passages": top_passages(minutes_text, encoder) if minutes_text and encoder is not None else [],
+        "sources": ["minutes", "rate history"] if minutes_text else ["rate history"],
+    }
+
+
+class DigestStore:
+    """
+    Meeting digests in a local SQLite database, indexed by meeting date and by (year, month).
+
+    Digests are written by the offline builder and read by the assistant;
+    every call opens its own connection, so the store is safe to share
+    across threads and processes.
+    """
+
+    def __init__(self, db_file=DIGEST_DB):
+        """
+        Initialize the DigestStore instance, creating the database if needed.
+
+        Args:
+            db_file (str, optional): Database path. Defaults to DIGEST_DB.
+        """
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS digests ("
+                "meeting TEXT PRIMARY KEY, year INTEGER NOT NULL, month INTEGER NOT NULL, decision TEXT, "
+                "change_bp INTEGER, range_low REAL, range_high REAL, votes_for INTEGER, votes_against INTEGER, "
+                "body TEXT NOT NULL, signature TEXT NOT NULL, built TEXT NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS digests_year_month ON digests (year, month)")
+
+    def _connect(self):
+        return sqlite3.connect(self.db_file, timeout=10)
+
+    def put(self, digest, signature):
+        """Insert or replace a meeting's digest."""
+        vote = digest["vote"] or {}
+        year, month = int(digest["meeting"][:4]), int(digest["meeting"][5:7])
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    digest["meeting"], year, month, digest["decision"], digest["change_bp"], digest["range_low"],
+                    digest["range_high"], len(vote["for"]) if vote else None, len(vote["against"]) if vote else None,
+                    json.dumps(digest), signature, time.strftime("%Y-%m-%dT%H:%M:%S"),
+                ),
+            )
+
+    def signatures(self):
+        """Return {meeting: source signature} of every stored digest."""
+        with closing(self._connect()) as connection:
+            return dict(connection.execute("SELECT meeting, signature FROM digests"))
+
+    def get(self, meeting):
+        """Return the digest of a meeting (ISO date or date-like), or None."""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT body FROM digests WHERE meeting = ?", (str(np.datetime64(meeting, "D")),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find(self, reference, today=None):
+        """
+        Return the digest of the meeting a parsed question refers to.
+
+        The reference is resolved against the meeting calendar first: a
+        meeting without a digest yet (the latest one, until its minutes are
+        out) returns None rather than an older meeting's digest.
+
+        Args:
+            reference (dict): Output of ``query_parser.parse_meeting_reference``.
+            today (date-like, optional): Reference date for "latest meeting". Defaults to today.
+
+        Returns:
+            dict: The digest, or None if no stored meeting matches.
+        """
+        meeting = resolve_meeting(reference, get_calendar().dates, today, MEETING_DAY_TOLERANCE)
+        if meeting is not None:
+            return self.get(meeting)
+        # Not a calendar meeting (or no calendar): match the stored meetings
+        if reference["latest"]:
+            query, params = "SELECT body FROM digests ORDER BY meeting DESC LIMIT 1", ()
+        elif reference["day"] is not None:
+            try:
+                day = np.datetime64(f"{reference['year']:04d}-{reference['month']:02d}-{reference['day']:02d}", "D")
+            except ValueError:
+                return None
+            query = (
+                "SELECT body FROM digests WHERE meeting BETWEEN ? AND ? "
+                "ORDER BY abs(julianday(meeting) - julianday(?)) LIMIT 1"
+            )
+            params = (str(day - MEETING_DAY_TOLERANCE), str(day + MEETING_DAY_TOLERANCE), str(day))
+        else:
+            # Several meetings in one month (e.g. March 2020): the last decision is reported
+            query = "SELECT body FROM digests WHERE year = ? AND month = ? ORDER BY meeting DESC LIMIT 1"
+            params = (reference["year"], reference["month"])
+        with closing(self._connect()) as connection:
+            row = connection.execute(query, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def frame(self):
+        """
+        Return one summary row per stored meeting, most recent first.
+
+        Returns:
+            pandas.DataFrame: ``Meeting``, ``Decision``, ``Change (bp)``, ``Range Low``, ``Range High``,
+            ``Votes For``, ``Votes Against`` and ``Built``.
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT meeting, decision, change_bp, range_low, range_high, votes_for, votes_against, built "
+                "FROM digests ORDER BY meeting DESC"
+            ).fetchall()
+        return pd.DataFrame(rows, columns=[
+            "Meeting", "Decision", "Change (bp)", "Range Low", "Range High", "Votes For", "Votes Against", "Built",
+        ])
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def minutes_path(meeting, minutes_dir=MINUTES_DIR):
+    """Return the mirrored minutes path of a meeting (which may not exist)."""
+    return os.path.join(minutes_dir, f"fomcminutes{meeting.astype(object):%Y%m%d}.pdf")
+
+
+def build_digests(store=None, meetings=None, minutes_dir=MINUTES_DIR, force=False):
+    """
+    Build or refresh the digest of every past meeting.
+
+    A meeting is rebuilt only when its inputs changed: its minutes, the
+    previous meeting's minutes (statement changes are relative to them) or
+    the rates around the decision.
+
+    Args:
+        store (DigestStore, optional): Target store. Defaults to the shared store.
+        meetings (numpy.ndarray, optional): Decision dates. Defaults to every past meeting in the calendar.
+        minutes_dir (str, optional): Directory of mirrored minutes PDFs. Defaults to MINUTES_DIR.
+        force (bool, optional): Rebuild every meeting. Defaults to False.
+
+    Returns:
+        dict: Counts of ``built``, ``unchanged`` and ``skipped`` (no minutes or rate data) meetings.
+    """
+    store = store or get_resource("digest_store")
+    meetings = get_calendar().previous() if meetings is None else np.sort(np.asarray(meetings, dtype="datetime64[D]"))
+    dates, values = get_resource("rate_store").snapshot()
+    existing = {} if force else store.signatures()
+    counts = {"built": 0, "unchanged": 0, "skipped": 0}
+    encoder = None
+
+    previous_path, previous_statement = None, None
+    for meeting in meetings:
+        path = minutes_path(meeting, minutes_dir)
+        rates = rate_around(dates, values, meeting)
+        signature = hashlib.sha1(json.dumps(
+            [DIGEST_VERSION, _file_signature(path), _file_signature(previous_path) if previous_path else None, rates]
+        ).encode("utf-8")).hexdigest()
+
+        # The previous statement is only needed when this meeting is rebuilt
+        current_statement = None
+        if existing.get(str(meeting)) == signature:
+            counts["unchanged"] += 1
+        else:
+            minutes_text = None
+            if os.path.exists(path):
+                minutes_text = re.sub(r"\s+", " ", extract_text_from_pdf(path))
+                if encoder is None:
+                    encoder = get_resource("embedding_model")
+                if previous_statement is None and previous_path and os.path.exists(previous_path):
+                    previous_statement = policy_statement(re.sub(r"\s+", " ", extract_text_from_pdf(previous_path)))
+            digest = build_digest(meeting, minutes_text, previous_statement or [], rates, encoder)
+            if digest is None:
+                counts["skipped"] += 1
+            else:
+                store.put(digest, signature)
+                counts["built"] += 1
+                current_statement = digest["statement"]
+        previous_path, previous_statement = path, current_statement
+    return counts
+
+
+def find_digest(question, store=None):
+    """
+    Return the digest that answers a meeting-specific question.
+
+    Args:
+        question (str): User question.
+        store (DigestStore, optional): Store to search. Defaults to the shared store.
+
+    Returns:
+        dict: The digest, or None when the question is not about a meeting's outcome or the meeting has no digest.
+    """
+    if not DIGESTS_ENABLED or not DIGEST_INTENT_PATTERN.search(question) or DIGEST_TOPIC_PATTERN.search(question):
+        return None
+    reference = parse_meeting_reference(question)
+    if reference is None:
+        return None
+    return (store or get_resource("digest_store")).find(reference)
+
+
+def _percent(value):
+    return f"{value:.2f}%"
+
+
+def format_digest(digest):
+    """
+    Render a digest as the assistant's answer.
+
+    Returns:
+        str: Markdown text.
+    """
+    day = pd.Timestamp(digest["meeting"])
+    target = f"{_percent(digest['range_low'])}–{_percent(digest['range_high'])}"
+    change = abs(digest["change_bp"] or 0)
+    if digest["decision"] == "hike":
+        decision = f"raised the target range for the federal funds rate by {change} bp to {target}"
+    elif digest["decision"] == "cut":
+        decision = f"lowered the target range for the federal funds rate by {change} bp to {target}"
+    else:
+        decision = f"kept the target range for the federal funds rate at {target}"
+    lines = [f"**FOMC meeting of {day:%B} {day.day}, {day.year}:** the Committee {decision}."]
+
+    vote = digest["vote"]
+    if vote:
+        tally = f"{len(vote['for'])}–{len(vote['against'])}"
+        if vote["against"]:
+            lines.append(f"**Vote:** {tally}; dissenting: {', '.join(vote['against'])}.")
+        else:
+            lines.append(f"**Vote:** unanimous ({tally}).")
+
+    if digest["statement_changes"]:
+        lines.append("**Key statement changes:**")
+        for change in digest["statement_changes"]:
+            if change["change"] == "added":
+                lines.append(f"- Added: {change['text']}")
+            elif change["change"] == "removed":
+                lines.append(f"- Removed: {change['previous']}")
+            else:
+                lines.append(f"- Now reads: {change['text']} (was: {change['previous']})")
+
+    if digest["passages"]:
+        lines.append("**From the minutes:**")
+        lines += [f"> {passage['text']}" for passage in digest["passages"]]
+    return "\n\n".join(lines)
+
+
+# Offline build: python -m fomc_dashboard.modules.meeting_digest [--force]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute FOMC meeting digests")
+    parser.add_argument("--force", action="store_true", help="Rebuild every meeting, not only changed ones")
+    parser.add_argument("--minutes-dir", default=MINUTES_DIR)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = build_digests(DigestStore(), minutes_dir=args.minutes_dir, force=args.force)
+    print(
+        f"Built {counts['built']}, unchanged {counts['unchanged']}, skipped {counts['skipped']} meetings "
+        f"in {time.perf_counter() - start:.1f}s; digests are in '{DIGEST_DB}'."
+    )
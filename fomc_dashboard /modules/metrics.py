@@ -0,0 +1,332 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+# Metrics are off unless FOMC_METRICS=1; disabled metrics are shared no-op objects
+METRICS_ENABLED = os.environ.get("FOMC_METRICS", "0") == "1"
+METRICS_HOST = os.environ.get("FOMC_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("FOMC_METRICS_PORT", "9464"))
+
+# Latency summaries report these quantiles over their most recent observations
+QUANTILES = (0.5, 0.95, 0.99)
+SUMMARY_WINDOW = 4096
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _label_key(label_names, labels):
+    if set(labels) != set(label_names):
+        raise ValueError(f"Expected labels {sorted(label_names)}, got {sorted(labels)}")
+    return tuple(str(labels[name]) for name in label_names)
+
+
+def _format_labels(label_names, key, extra=()):
+    pairs = list(zip(label_names, key)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value):
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class Metric:
+    """
+    Base class for a metric family: one value (or summary) per label combination.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labels=()):
+        """
+        Initialize the Metric instance.
+
+        Args:
+            name (str): Prometheus metric name.
+            documentation (str): HELP text.
+            labels (tuple, optional): Label names.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def samples(self):
+        """
+        Return the current samples.
+
+        Returns:
+            list: (sample name, labels dict, value) tuples.
+        """
+        with self._lock:
+            values = dict(self._values)
+        return [(self.name, dict(zip(self.label_names, key)), value) for key, value in sorted(values.items())]
+
+    def render(self):
+        """Return the family in Prometheus text exposition format."""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for name, labels, value in self.samples():
+            key = tuple(labels.get(label, "") for label in self.label_names)
+            extra = [(label, value_) for label, value_ in labels.items() if label not in self.label_names]
+            lines.append(f"{name}{_format_labels(self.label_names, key, extra)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing count, e.g. requests or tokens."""
+
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        """Add ``amount`` to the series selected by ``labels``."""
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """Value that can go up and down, optionally computed at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labels=(), function=None):
+        """
+        Initialize the Gauge instance.
+
+        Args:
+            name (str): Prometheus metric name.
+            documentation (str): HELP text.
+            labels (tuple, optional): Label names.
+            function (callable, optional): Called at scrape time for an unlabelled gauge.
+        """
+        super().__init__(name, documentation, labels)
+        self.function = function
+
+    def set(self, value, **labels):
+        """Set the series selected by ``labels``."""
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self):
+        if self.function is not None:
+            return [(self.name, {}, self.function())]
+        return super().samples()
+
+
+class Summary(Metric):
+    """
+    Observations (e.g. latencies in seconds) reported as count, sum and
+    p50/p95/p99 over the most recent SUMMARY_WINDOW observations.
+    """
+
+    kind = "summary"
+
+    def observe(self, value, **labels):
+        """Record one observation in the series selected by ``labels``."""
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = {"count": 0, "sum": 0.0, "window": deque(maxlen=SUMMARY_WINDOW)}
+            series["count"] += 1
+            series["sum"] += value
+            series["window"].append(value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the ``with`` block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def quantiles(self, **labels):
+        """
+        Return the recent quantiles of one series.
+
+        Returns:
+            dict: Quantile -> value, empty if nothing was observed.
+        """
+        key = _label_key(self.label_names, labels)
+        with self._lock:
+            series = self._values.get(key)
+            window = np.array(series["window"]) if series else np.empty(0)
+        if not window.size:
+            return {}
+        return dict(zip(QUANTILES, np.quantile(window, QUANTILES).tolist()))
+
+    def samples(self):
+        with self._lock:
+            snapshot = {
+                key: (series["count"], series["sum"], np.array(series["window"]))
+                for key, series in self._values.items()
+            }
+        samples = []
+        for key, (count, total, window) in sorted(snapshot.items()):
+            labels = dict(zip(self.label_names, key))
+            for quantile, value in zip(QUANTILES, np.quantile(window, QUANTILES)):
+                samples.append((self.name, dict(labels, quantile=str(quantile)), value))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, count))
+        return samples
+
+
+class _NullMetric:
+    """Stand-in for every metric while metrics are disabled."""
+
+    def inc(self, amount=1, **labels):
+        pass
+
+    def set(self, value, **labels):
+        pass
+
+    def observe(self, value, **labels):
+        pass
+
+    def time(self, **labels):
+        return nullcontext()
+
+    def quantiles(self, **labels):
+        return {}
+
+
+_NULL_METRIC = _NullMetric()
+
+
+class MetricsRegistry:
+    """
+    Process-wide collection of metric families, rendered for Prometheus.
+    """
+
+    def __init__(self, enabled=METRICS_ENABLED):
+        """
+        Initialize the MetricsRegistry instance.
+
+        Args:
+            enabled (bool, optional): When False every factory returns a no-op metric. Defaults to METRICS_ENABLED.
+        """
+        self.enabled = enabled
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, documentation, **kwargs):
+        if not self.enabled:
+            return _NULL_METRIC
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.kind}")
+        start_metrics_server()
+        return metric
+
+    def counter(self, name, documentation, labels=()):
+        """Return the counter ``name``, creating it on first use."""
+        return self._register(Counter, name, documentation, labels=labels)
+
+    def gauge(self, name, documentation, labels=(), function=None):
+        """Return the gauge ``name``, creating it on first use."""
+        return self._register(Gauge, name, documentation, labels=labels, function=function)
+
+    def summary(self, name, documentation, labels=()):
+        """Return the summary ``name``, creating it on first use."""
+        return self._register(Summary, name, documentation, labels=labels)
+
+    def samples(self):
+        """
+        Return every current sample.
+
+        Returns:
+            list: (sample name, labels dict, value) tuples.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return [sample for metric in metrics for sample in metric.samples()]
+
+    def render(self):
+        """Return all families in Prometheus text exposition format."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        return "".join(metric.render() + "\n" for metric in metrics)
+
+
+metrics = MetricsRegistry()
+
+
+def resident_memory_bytes():
+    """Return the resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        # Peak rather than current RSS where /proc is unavailable (kilobytes on Linux, bytes on macOS)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serve ``GET /metrics`` from the process-wide registry."""
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(host=METRICS_HOST, port=METRICS_PORT):
+    """
+    Start the process-wide metrics endpoint on a daemon thread (once).
+
+    Called when the first metric is registered, so nothing listens while
+    metrics are disabled.
+
+    Args:
+        host (str, optional): Bind address. Defaults to METRICS_HOST.
+        port (int, optional): Port. Defaults to METRICS_PORT.
+
+    Returns:
+        ThreadingHTTPServer: The running server, or None if the port was unavailable.
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+            except OSError as e:
+                print(f"Metrics server not started on {host}:{port}: {e}")
+                _server = False
+                return None
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+    return _server or None
+
+
+# Process memory is reported by every process exposing metrics
+metrics.gauge("fomc_process_resident_memory_bytes", "Resident memory of the dashboard process.",
+              function=resident_memory_bytes)
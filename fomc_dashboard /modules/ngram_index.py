@@ -0,0 +1,327 @@
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from wordcloud import STOPWORDS
+
+from fomc_dashboard.modules.index_shards import SHARD_DIR, shard_records
+from fomc_dashboard.modules.paths import DATA_DIR
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.sentiment import clean_passages
+
+# Postings arrays and their manifest
+NGRAM_DIR = os.path.join(DATA_DIR, "ngrams")
+
+# Longest phrase indexed, in words
+MAX_NGRAM = 3
+
+# Chunks counted (SEP chunks are projection tables, not prose)
+TREND_DOC_TYPES = ("minutes", "statement", "press_conference")
+
+# Normalized frequencies are reported per this many words of the meeting's documents
+PER_WORDS = 10000
+
+# Versioned arrays: sorted term hashes, their offsets into the postings, and per-meeting totals
+ARRAY_NAMES = ("keys", "offsets", "postings", "counts", "meetings", "totals")
+
+
+def tokenize(text):
+    """Lowercase words of a text, cleaned like the sentiment lexicon counts."""
+    return clean_passages([text])[0].split()
+
+
+def term_key(term):
+    """
+    Hash a space-joined n-gram to the 64-bit key it is stored under.
+
+    Terms are not stored themselves: with a few million distinct n-grams a
+    collision is practically impossible, and eight bytes per term keep the
+    index small enough to map in full.
+    """
+    return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def is_indexed(words):
+    """True if a phrase of these words is in the index (at most MAX_NGRAM words, no stopword at either end)."""
+    return 0 < len(words) <= MAX_NGRAM and words[0] not in STOPWORDS and words[-1] not in STOPWORDS
+
+
+def count_ngrams(texts, max_n=MAX_NGRAM):
+    """
+    Count the indexed n-grams of one meeting's chunks.
+
+    N-grams do not cross chunk boundaries, and those starting or ending with a
+    stopword ("of the", "the committee") are skipped, which removes most of
+    the distinct n-grams while keeping phrases such as "pace of purchases".
+
+    Args:
+        texts (list): Chunk texts.
+        max_n (int, optional): Longest n-gram. Defaults to MAX_NGRAM.
+
+    Returns:
+        tuple: (keys, counts, words): sorted uint64 term keys, their int32 counts and the number of words.
+    """
+    counts = Counter()
+    words = 0
+    for tokens in map(str.split, clean_passages(texts)):
+        words += len(tokens)
+        for n in range(1, max_n + 1):
+            for i in range(len(tokens) - n + 1):
+                gram = tokens[i:i + n]
+                if gram[0] not in STOPWORDS and gram[-1] not in STOPWORDS:
+                    counts[" ".join(gram)] += 1
+    keys = np.fromiter((term_key(term) for term in counts), dtype=np.uint64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.int32, count=len(counts))
+    order = np.argsort(keys)
+    return keys[order], values[order], words
+
+
+class NgramIndex:
+    """
+    Per-meeting n-gram counts over the whole chunk corpus, as memory-mapped postings.
+
+    Each term's postings are a contiguous slice of ``postings`` (meeting
+    column) and ``counts``, located by a binary search of the sorted term
+    keys, so a phrase's frequency at every meeting is one lookup. Arrays are
+    versioned like the rate store; ``update`` rewrites them for changed
+    meetings only and swaps the new version in.
+    """
+
+    def __init__(self, store_dir=NGRAM_DIR):
+        """
+        Initialize the NgramIndex instance and map the latest arrays.
+
+        Args:
+            store_dir (str, optional): Store directory. Defaults to NGRAM_DIR.
+        """
+        self.store_dir = store_dir
+        self.manifest_path = os.path.join(store_dir, "manifest.json")
+        self._lock = threading.Lock()
+        self.manifest = self._read_manifest()
+        self._arrays = self._map_arrays(self.manifest["version"]) if self.manifest["version"] else self._empty()
+
+    @property
+    def available(self):
+        """True if any meeting has been indexed."""
+        return bool(len(self._arrays["meetings"]))
+
+    @property
+    def meetings(self):
+        """Indexed meeting dates (datetime64[D], sorted)."""
+        return self._arrays["meetings"]
+
+    def signatures(self):
+        """Return {meeting: signature} of the indexed meetings."""
+        return dict(self.manifest["sources"])
+
+    def frequency(self, phrase, start=None, end=None):
+        """
+        Count a phrase at every indexed meeting.
+
+        Args:
+            phrase (str): One to MAX_NGRAM words.
+            start (date-like, optional): First meeting date. Defaults to the first indexed meeting.
+            end (date-like, optional): Last meeting date. Defaults to the last indexed meeting.
+
+        Returns:
+            pandas.DataFrame: ``Meeting``, ``Count`` and ``Per 10k words``, one row per meeting (zeros included).
+
+        Raises:
+            ValueError: If the phrase is too long or starts or ends with a stopword.
+        """
+        words = tokenize(phrase)
+        if not is_indexed(words):
+            raise ValueError(
+                f"'{phrase}' is not indexed: phrases have 1 to {MAX_NGRAM} words and cannot start or end "
+                "with a common word such as 'the' or 'of'."
+            )
+        arrays = self._arrays
+        meetings = arrays["meetings"]
+        lo = np.searchsorted(meetings, np.datetime64(start, "D")) if start is not None else 0
+        hi = np.searchsorted(meetings, np.datetime64(end, "D"), side="right") if end is not None else len(meetings)
+
+        counts = np.zeros(len(meetings), dtype=np.int64)
+        key = np.uint64(term_key(" ".join(words)))
+        i = np.searchsorted(arrays["keys"], key)
+        if i < len(arrays["keys"]) and arrays["keys"][i] == key:
+            first, last = arrays["offsets"][i], arrays["offsets"][i + 1]
+            counts[arrays["postings"][first:last]] = arrays["counts"][first:last]
+        counts, totals = counts[lo:hi], arrays["totals"][lo:hi]
+        return pd.DataFrame({
+            "Meeting": meetings[lo:hi].astype("datetime64[ns]"),
+            "Count": counts,
+            "Per 10k words": counts * PER_WORDS / np.maximum(totals, 1),
+        })
+
+    def trend(self, phrases, start=None, end=None):
+        """
+        Stack the per-meeting frequencies of several phrases for plotting.
+
+        Returns:
+            pandas.DataFrame: ``frequency`` columns plus ``Phrase``.
+        """
+        frames = [self.frequency(phrase, start, end).assign(Phrase=phrase) for phrase in phrases]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def update(self, documents, signatures, removed=()):
+        """
+        Recount changed meetings and write a new version of the arrays.
+
+        The existing postings are expanded to (term, meeting, count) entries,
+        the entries of changed or removed meetings are dropped, the new counts
+        are appended and the whole is re-sorted by term; unchanged meetings
+        are never re-read.
+
+        Args:
+            documents (dict): {meeting ISO date: [chunk texts]} of new or changed meetings.
+            signatures (dict): {meeting ISO date: signature} of those meetings.
+            removed (iterable, optional): Meetings to drop from the index.
+
+        Returns:
+            int: Number of distinct terms after the update.
+        """
+        removed = set(removed)
+        with self._lock:
+            arrays = self._arrays
+            old_meetings = arrays["meetings"].astype(str)
+            kept = ~np.isin(old_meetings, list(documents) + list(removed))
+            entry_meetings = arrays["postings"]
+            mask = kept[entry_meetings]
+            keys = [np.repeat(arrays["keys"], np.diff(arrays["offsets"]))[mask]]
+            meetings = [old_meetings[entry_meetings[mask]]]
+            counts = [np.asarray(arrays["counts"])[mask]]
+            totals = dict(zip(old_meetings[kept], arrays["totals"][kept].tolist()))
+
+            for meeting, texts in documents.items():
+                meeting_keys, meeting_counts, totals[meeting] = count_ngrams(texts)
+                keys.append(meeting_keys)
+                meetings.append(np.full(len(meeting_keys), meeting))
+                counts.append(meeting_counts)
+
+            dates = np.array(sorted(totals), dtype="datetime64[D]")
+            keys = np.concatenate(keys)
+            columns = np.searchsorted(dates.astype(str), np.concatenate(meetings)).astype(np.int32)
+            counts = np.concatenate(counts)
+            order = np.lexsort((columns, keys))
+            keys, columns, counts = keys[order], columns[order], counts[order]
+            unique_keys, starts = np.unique(keys, return_index=True)
+
+            sources = {m: s for m, s in self.manifest["sources"].items() if m not in removed}
+            sources.update(signatures)
+            self._write_arrays({
+                "keys": unique_keys,
+                "offsets": np.append(starts, len(keys)).astype(np.int64),
+                "postings": columns,
+                "counts": counts.astype(np.int32),
+                "meetings": dates,
+                "totals": np.array([totals[m] for m in dates.astype(str)], dtype=np.int64),
+            }, sources)
+            self._arrays = self._map_arrays(self.manifest["version"])
+            return len(unique_keys)
+
+    @staticmethod
+    def _empty():
+        return {
+            "keys": np.empty(0, dtype=np.uint64), "offsets": np.zeros(1, dtype=np.int64),
+            "postings": np.empty(0, dtype=np.int32), "counts": np.empty(0, dtype=np.int32),
+            "meetings": np.empty(0, dtype="datetime64[D]"), "totals": np.empty(0, dtype=np.int64),
+        }
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"version": 0, "terms": 0, "sources": {}}
+
+    def _array_path(self, name, version):
+        return os.path.join(self.store_dir, f"{name}-{version}.npy")
+
+    def _map_arrays(self, version):
+        return {name: np.load(self._array_path(name, version), mmap_mode="r") for name in ARRAY_NAMES}
+
+    def _write_arrays(self, arrays, sources):
+        """Write a new array version, point the manifest at it and drop older versions."""
+        os.makedirs(self.store_dir, exist_ok=True)
+        old_version = self.manifest["version"]
+        version = old_version + 1
+        for name in ARRAY_NAMES:
+            np.save(self._array_path(name, version), np.ascontiguousarray(arrays[name]))
+
+        manifest = {"version": version, "terms": len(arrays["keys"]), "sources": sources}
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        self.manifest = manifest
+
+        for name in ARRAY_NAMES if old_version else ():
+            try:
+                os.remove(self._array_path(name, old_version))
+            except OSError:
+                pass  # Still mapped by a reader on Windows; an orphaned old version is harmless
+
+
+def build_ngram_index(index=None, shard_dir=SHARD_DIR, doc_types=TREND_DOC_TYPES, force=False):
+    """
+    Bring the n-gram index up to date with the chunk corpus of the year shards.
+
+    A meeting is recounted only when the text of its chunks changed since the
+    last build; meetings no longer in the shards are dropped.
+
+    Args:
+        index (NgramIndex, optional): Target index. Defaults to the shared index.
+        shard_dir (str, optional): Shard directory. Defaults to SHARD_DIR.
+        doc_types (tuple, optional): Document types counted. Defaults to TREND_DOC_TYPES.
+        force (bool, optional): Recount every meeting. Defaults to False.
+
+    Returns:
+        dict: ``meetings`` recounted, ``removed`` and distinct ``terms``.
+    """
+    index = index or get_resource("ngram_index")
+    corpus = {}
+    for _, records in shard_records(shard_dir):
+        for record in records:
+            if record["doc_type"] in doc_types:
+                corpus.setdefault(record["meeting"], []).append(record["text"])
+
+    existing = index.signatures()
+    documents, signatures = {}, {}
+    for meeting, texts in corpus.items():
+        signature = hashlib.sha1("\n".join(texts).encode("utf-8")).hexdigest()
+        if force or existing.get(meeting) != signature:
+            documents[meeting], signatures[meeting] = texts, signature
+    removed = [meeting for meeting in existing if meeting not in corpus]
+
+    terms = index.update(documents, signatures, removed) if documents or removed else index.manifest["terms"]
+    return {"meetings": len(documents), "removed": len(removed), "terms": terms}
+
+
+# Offline build from the year shards: python -m fomc_dashboard.modules.ngram_index [--force] [--phrase transitory]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count phrases per meeting across the chunk corpus")
+    parser.add_argument("--force", action="store_true", help="Recount every meeting, not only changed ones")
+    parser.add_argument("--shard-dir", default=SHARD_DIR)
+    parser.add_argument("--phrase", help="Print this phrase's per-meeting counts after the build")
+    args = parser.parse_args()
+
+    index = NgramIndex()
+    start = time.perf_counter()
+    counts = build_ngram_index(index, args.shard_dir, force=args.force)
+    print(
+        f"Recounted {counts['meetings']} meetings ({counts['removed']} removed) in "
+        f"{time.perf_counter() - start:.1f}s; {counts['terms']:,} terms in '{NGRAM_DIR}'."
+    )
+    if not index.available:
+        print("No chunks found; build the year shards first (python -m fomc_dashboard.modules.index_shards).")
+    elif args.phrase:
+        start = time.perf_counter()
+        frame = index.frequency(args.phrase)
+        print(frame[frame["Count"] > 0].to_string(index=False))
+        print(f"Looked up in {(time.perf_counter() - start) * 1000:.2f} ms.")
@@ -0,0 +1,10 @@
+import os
+
+# Package root (the directory holding modules/, pages/ and assets/)
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Local data stores (override with the FOMC_DATA_DIR environment variable)
+DATA_DIR = os.environ.get("FOMC_DATA_DIR", os.path.join(PACKAGE_DIR, "data"))
+
+# Images shipped with the dashboard
+ASSETS_DIR = os.path.join(PACKAGE_DIR, "assets")
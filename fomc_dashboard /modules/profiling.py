@@ -0,0 +1,179 @@
+import cProfile
+import marshal
+import os
+import pstats
+import threading
+import time
+from functools import wraps
+
+import pandas as pd
+import streamlit as st
+
+# Profile every rerun of every page (FOMC_PROFILE=1), or only reruns opened with ?profile=1
+PROFILE_ALL = os.environ.get("FOMC_PROFILE", "0") == "1"
+PROFILE_QUERY_PARAM = "profile"
+
+# Functions listed in the per-rerun sidebar report
+RERUN_TOP_FUNCTIONS = 15
+
+# Only one profiler can be active per process; concurrent reruns run unprofiled
+_profiler_lock = threading.Lock()
+
+
+def hot_functions(stats, n=30, sort="own"):
+    """
+    Return the most expensive functions of a profile.
+
+    Args:
+        stats (pstats.Stats): Profile statistics.
+        n (int, optional): Number of functions. Defaults to 30.
+        sort (str, optional): "own" (time in the function itself) or "cumulative". Defaults to "own".
+
+    Returns:
+        pandas.DataFrame: ``Function``, ``Location``, ``Calls``, ``Own (s)`` and ``Cumulative (s)``.
+    """
+    rows = [
+        {
+            "Function": function,
+            "Location": f"{os.path.basename(file_name)}:{line}" if line else file_name,
+            "Calls": calls,
+            "Own (s)": own,
+            "Cumulative (s)": cumulative,
+        }
+        for (file_name, line, function), (_, calls, own, cumulative, _) in stats.stats.items()
+    ]
+    frame = pd.DataFrame(rows, columns=["Function", "Location", "Calls", "Own (s)", "Cumulative (s)"])
+    column = "Own (s)" if sort == "own" else "Cumulative (s)"
+    return frame.sort_values(column, ascending=False).head(n).reset_index(drop=True)
+
+
+class ProfileAggregator:
+    """
+    cProfile statistics merged per page across reruns and sessions.
+    """
+
+    def __init__(self):
+        """Initialize the ProfileAggregator instance."""
+        self._lock = threading.Lock()
+        self._pages = {}
+        self.skipped = 0
+
+    def add(self, page, profile, elapsed):
+        """
+        Merge one profiled rerun.
+
+        Args:
+            page (str): Page name.
+            profile (cProfile.Profile): Profile of the rerun.
+            elapsed (float): Wall time of the rerun in seconds.
+        """
+        with self._lock:
+            entry = self._pages.get(page)
+            if entry is None:
+                self._pages[page] = {"stats": pstats.Stats(profile), "reruns": 1, "total": elapsed, "max": elapsed}
+            else:
+                entry["stats"].add(profile)
+                entry["reruns"] += 1
+                entry["total"] += elapsed
+                entry["max"] = max(entry["max"], elapsed)
+
+    def pages(self):
+        """
+        Return rerun counts and timings per page.
+
+        Returns:
+            pandas.DataFrame: ``Page``, ``Reruns``, ``Mean (ms)``, ``Max (ms)`` and ``Total (s)``.
+        """
+        with self._lock:
+            rows = [
+                {
+                    "Page": page,
+                    "Reruns": entry["reruns"],
+                    "Mean (ms)": entry["total"] / entry["reruns"] * 1000,
+                    "Max (ms)": entry["max"] * 1000,
+                    "Total (s)": entry["total"],
+                }
+                for page, entry in sorted(self._pages.items())
+            ]
+        return pd.DataFrame(rows, columns=["Page", "Reruns", "Mean (ms)", "Max (ms)", "Total (s)"])
+
+    def hot_functions(self, page, n=30, sort="own"):
+        """Return the hottest functions of a page across all its profiled reruns (see ``hot_functions``)."""
+        with self._lock:
+            return hot_functions(self._pages[page]["stats"], n, sort)
+
+    def dump(self, page):
+        """
+        Serialize a page's merged statistics in the ``pstats`` file format.
+
+        The bytes can be saved as ``<page>.prof`` and opened with
+        ``pstats.Stats(path)`` or viewers such as snakeviz.
+
+        Returns:
+            bytes: Marshalled statistics.
+        """
+        with self._lock:
+            return marshal.dumps(self._pages[page]["stats"].stats)
+
+    def reset(self):
+        """Drop all collected statistics."""
+        with self._lock:
+            self._pages.clear()
+            self.skipped = 0
+
+
+aggregator = ProfileAggregator()
+
+
+def profiling_requested():
+    """Return True if this rerun should be profiled."""
+    return PROFILE_ALL or st.query_params.get(PROFILE_QUERY_PARAM) == "1"
+
+
+def _show_rerun_profile(page, profile, elapsed):
+    with st.sidebar.expander(f"🔬 Profile of this rerun ({elapsed * 1000:,.0f} ms)"):
+        st.dataframe(
+            hot_functions(pstats.Stats(profile), RERUN_TOP_FUNCTIONS, sort="cumulative"),
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.caption(f"Merged into the '{page}' profile on the Resource Status page.")
+
+
+def profiled(page):
+    """
+    Decorate a page entry point so its reruns are profiled on request.
+
+    Args:
+        page (str): Name the statistics are aggregated under.
+
+    Returns:
+        callable: The decorator.
+    """
+    def decorator(render):
+        @wraps(render)
+        def wrapper(*args, **kwargs):
+            if not profiling_requested():
+                return render(*args, **kwargs)
+            if not _profiler_lock.acquire(blocking=False):
+                aggregator.skipped += 1
+                return render(*args, **kwargs)
+
+            profile = cProfile.Profile()
+            start = time.perf_counter()
+            try:
+                profile.enable()
+                try:
+                    result = render(*args, **kwargs)
+                finally:
+                    profile.disable()
+            finally:
+                _profiler_lock.release()
+                elapsed = time.perf_counter() - start
+                aggregator.add(page, profile, elapsed)
+            _show_rerun_profile(page, profile, elapsed)
+            return result
+
+        return wrapper
+
+    return decorator
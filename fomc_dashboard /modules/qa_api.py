@@ -0,0 +1,249 @@
+import argparse
+import asyncio
+import contextvars
+import functools
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+
+from fomc_dashboard.modules.qa_pipeline import (
+    DEFAULT_TEMPERATURE,
+    DEFAULT_TOP_K,
+    check_answer_cache,
+    check_digest,
+    generate_answer,
+    remember_answer,
+    retrieve,
+)
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.tracing import span
+from fomc_dashboard.modules.warmup import WarmUp
+
+API_HOST = os.environ.get("FOMC_API_HOST", "127.0.0.1")
+API_PORT = int(os.environ.get("FOMC_API_PORT", "8600"))
+
+# Threads running retrieval; their encodes are merged by the shared batch encoder, so more
+# threads mean larger batches rather than more CPU contention
+ENCODE_WORKERS = int(os.environ.get("FOMC_API_ENCODE_WORKERS", "16"))
+
+# Completions in flight at once (each holds a thread while it waits on Azure)
+LLM_CONCURRENCY = int(os.environ.get("FOMC_API_LLM_CONCURRENCY", "16"))
+
+MAX_QUESTION_CHARS = 2000
+MAX_TOP_K = 20
+
+
+def _json_error(status, message):
+    return web.json_response({"error": message}, status=status)
+
+
+def parse_question_request(payload):
+    """
+    Validate a question request body.
+
+    Args:
+        payload (dict): Decoded JSON body.
+
+    Returns:
+        dict: ``question``, ``top_k``, ``model`` and ``temperature``.
+
+    Raises:
+        ValueError: If a field is missing or out of range.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object.")
+    question = payload.get("question")
+    if not isinstance(question, str) or not question.strip():
+        raise ValueError("'question' must be a non-empty string.")
+    if len(question) > MAX_QUESTION_CHARS:
+        raise ValueError(f"'question' must be at most {MAX_QUESTION_CHARS} characters.")
+    top_k = payload.get("top_k", DEFAULT_TOP_K)
+    if not isinstance(top_k, int) or not 1 <= top_k <= MAX_TOP_K:
+        raise ValueError(f"'top_k' must be an integer between 1 and {MAX_TOP_K}.")
+    temperature = payload.get("temperature", DEFAULT_TEMPERATURE)
+    if not isinstance(temperature, (int, float)) or not 0 <= temperature <= 2:
+        raise ValueError("'temperature' must be a number between 0 and 2.")
+    return {
+        "question": question.strip(),
+        "top_k": top_k,
+        "model": payload.get("model"),
+        "temperature": float(temperature),
+    }
+
+
+def _serialize_sources(sources):
+    return [{"text": source["text"], "distance": float(source["distance"])} for source in sources]
+
+
+def _run_in(pool, fn, *args):
+    # Run in the pool with a copy of the request context, so worker spans join the request's trace
+    context = contextvars.copy_context()
+    return asyncio.get_running_loop().run_in_executor(pool, functools.partial(context.run, fn, *args))
+
+
+async def _read_params(request):
+    try:
+        return parse_question_request(await request.json())
+    except json.JSONDecodeError:
+        raise ValueError("Request body must be valid JSON.")
+
+
+async def handle_health(request):
+    """GET /healthz: liveness probe."""
+    return web.json_response({"status": "ok"})
+
+
+async def handle_ready(request):
+    """GET /readyz: 200 once the warm-up succeeded, 503 while warming or after a failed step."""
+    status = request.app["warmup"].status()
+    return web.json_response(status, status=200 if status["state"] == "ready" else 503)
+
+
+async def handle_retrieve(request):
+    """POST /v1/retrieve: passages only, no LLM call."""
+    try:
+        params = await _read_params(request)
+    except ValueError as e:
+        return _json_error(400, str(e))
+
+    app = request.app
+    start = time.perf_counter()
+    with span("api_retrieve", top_k=params["top_k"]):
+        sources = await _run_in(
+            app["encode_pool"], retrieve, params["question"], params["top_k"], app["index_file"], app["metadata_file"]
+        )
+    return web.json_response({
+        "question": params["question"],
+        "sources": _serialize_sources(sources),
+        "timings": {"retrieval_ms": round((time.perf_counter() - start) * 1000, 2)},
+    })
+
+
+async def handle_answer(request):
+    """POST /v1/answer: answer from a meeting digest, the semantic cache, or retrieval and the LLM."""
+    try:
+        params = await _read_params(request)
+    except ValueError as e:
+        return _json_error(400, str(e))
+
+    app = request.app
+    question, top_k, model, temperature = params["question"], params["top_k"], params["model"], params["temperature"]
+    files = (app["index_file"], app["metadata_file"])
+    start = time.perf_counter()
+    with span("api_answer", top_k=top_k):
+        digest = await _run_in(app["encode_pool"], check_digest, question)
+        if digest is not None:
+            return web.json_response({
+                "question": question,
+                "answer": digest["answer"],
+                "sources": _serialize_sources(digest["passages"]),
+                "digest_meeting": digest["meeting"],
+                "cached_question": None,
+                "timings": {"digest_ms": round((time.perf_counter() - start) * 1000, 2)},
+            })
+
+        ai_helper = get_resource("llm_client", app["api_key"], app["azure_endpoint"])
+        embedding, hit = await _run_in(
+            app["encode_pool"], check_answer_cache, question, ai_helper.identity, top_k, model, temperature, *files
+        )
+        if hit is not None:
+            return web.json_response({
+                "question": question,
+                "answer": hit["answer"],
+                "sources": _serialize_sources(hit["sources"]),
+                "digest_meeting": None,
+                "cached_question": hit["question"],
+                "timings": {"cache_ms": round((time.perf_counter() - start) * 1000, 2)},
+            })
+
+        sources = await _run_in(app["encode_pool"], retrieve, question, top_k, *files, embedding)
+        retrieved = time.perf_counter()
+        if not sources:
+            return _json_error(404, "No relevant data found for your query.")
+
+        answer = await _run_in(app["llm_pool"], generate_answer, question, sources, ai_helper, model, temperature)
+    if answer is None:
+        return _json_error(502, "The language model request failed.")
+    remember_answer(question, ai_helper.identity, embedding, answer, sources, top_k, model, temperature, *files)
+    return web.json_response({
+        "question": question,
+        "answer": answer,
+        "sources": _serialize_sources(sources),
+        "digest_meeting": None,
+        "cached_question": None,
+        "timings": {
+            "retrieval_ms": round((retrieved - start) * 1000, 2),
+            "llm_ms": round((time.perf_counter() - retrieved) * 1000, 2),
+        },
+    })
+
+
+def create_app(api_key, azure_endpoint=None, index_file="faiss_index", metadata_file="metadata.pkl",
+               encode_workers=ENCODE_WORKERS, llm_concurrency=LLM_CONCURRENCY):
+    """
+    Build the answer API application.
+
+    Args:
+        api_key (str): Azure OpenAI API key used for every request.
+        azure_endpoint (str, optional): Endpoint override, e.g. a local stand-in.
+        index_file (str, optional): FAISS index path without the ".index" suffix.
+        metadata_file (str, optional): Passage metadata path.
+        encode_workers (int, optional): Encode/search threads. Defaults to ENCODE_WORKERS.
+        llm_concurrency (int, optional): Completions in flight. Defaults to LLM_CONCURRENCY.
+
+    Returns:
+        aiohttp.web.Application: The application.
+    """
+    app = web.Application(client_max_size=64 * 1024)
+    app["api_key"] = api_key
+    app["azure_endpoint"] = azure_endpoint
+    app["index_file"] = index_file
+    app["metadata_file"] = metadata_file
+    app["encode_pool"] = ThreadPoolExecutor(max_workers=encode_workers, thread_name_prefix="encode")
+    app["llm_pool"] = ThreadPoolExecutor(max_workers=llm_concurrency, thread_name_prefix="llm")
+    app["warmup"] = WarmUp(index_file, metadata_file, api_key, azure_endpoint)
+
+    async def warm_up(app):
+        # Load the model, index and client in the background; /readyz reports when they are warm
+        app["warmup"].start()
+
+    async def shutdown_pools(app):
+        app["encode_pool"].shutdown(wait=False)
+        app["llm_pool"].shutdown(wait=False)
+
+    app.on_startup.append(warm_up)
+    app.on_cleanup.append(shutdown_pools)
+    app.router.add_get("/healthz", handle_health)
+    app.router.add_get("/readyz", handle_ready)
+    app.router.add_post("/v1/retrieve", handle_retrieve)
+    app.router.add_post("/v1/answer", handle_answer)
+    return app
+
+
+# Run the API: AZURE_OPENAI_API_KEY=... python -m fomc_dashboard.modules.qa_api [--port 8600]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FOMC assistant answer API")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--llm-endpoint", default=None, help="Azure endpoint override (e.g. the local mock LLM)")
+    parser.add_argument("--index-file", default="faiss_index")
+    parser.add_argument("--metadata-file", default="metadata.pkl")
+    parser.add_argument("--encode-workers", type=int, default=ENCODE_WORKERS)
+    parser.add_argument("--llm-concurrency", type=int, default=LLM_CONCURRENCY)
+    args = parser.parse_args()
+
+    api_key = os.environ.get("AZURE_OPENAI_API_KEY")
+    if not api_key:
+        if not args.llm_endpoint:
+            parser.error("Set AZURE_OPENAI_API_KEY (or use --llm-endpoint with a local stand-in).")
+        api_key = "local"
+
+    web.run_app(
+        create_app(api_key, args.llm_endpoint, args.index_file, args.metadata_file,
+                   args.encode_workers, args.llm_concurrency),
+        host=args.host,
+        port=args.port,
+    )
@@ -0,0 +1,193 @@
+import hashlib
+import os
+
+from fomc_dashboard.modules.index_shards import SHARD_DIR
+from fomc_dashboard.modules.meeting_digest import find_digest, format_digest
+from fomc_dashboard.modules.query_parser import parse_query
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.semantic_cache import SEMANTIC_CACHE_ENABLED, index_snapshot
+from fomc_dashboard.modules.sentence_transformer import query_faiss
+from fomc_dashboard.modules.single_flight import completion_flight, normalize_question, retrieval_flight
+from fomc_dashboard.modules.tracing import span
+
+# System instruction and answer style shared by the chat pages and the API
+ASSISTANT_INSTRUCTION = "You are an assistant providing insights on FOMC meetings, interest rates, and economic policy."
+ANSWER_STYLE = "Answer concisely as a personal assistant."
+DEFAULT_TEMPERATURE = 0.7
+DEFAULT_TOP_K = 5
+
+
+def build_prompt(context, question):
+    """Combine retrieved context and the user's question into the completion prompt."""
+    return f"Context: {context}\n\nQuestion: {question}\n\n{ANSWER_STYLE}"
+
+
+def retrieve(question, top_k=DEFAULT_TOP_K, index_file="faiss_index", metadata_file="metadata.pkl",
+             query_embedding=None):
+    """
+    Retrieve the passages most relevant to a question.
+
+    Concurrent requests for the same normalized question share one retrieval.
+
+    Args:
+        question (str): User question.
+        top_k (int, optional): Number of passages. Defaults to DEFAULT_TOP_K.
+        index_file (str, optional): FAISS index path without the ".index" suffix.
+        metadata_file (str, optional): Passage metadata path.
+        query_embedding (numpy.ndarray, optional): Embedding of the question, if already computed.
+
+    Returns:
+        list: Dicts with ``text`` and ``distance``, closest first.
+    """
+    key = (normalize_question(question), top_k, index_file, metadata_file)
+    with span("retrieve"):
+        return retrieval_flight.do(
+            key, query_faiss, question, metadata_file=metadata_file, index_file=index_file, top_k=top_k,
+            query_embedding=query_embedding,
+        )
+
+
+def check_digest(question):
+    """
+    Answer a question about a specific meeting's outcome from its precomputed digest.
+
+    Args:
+        question (str): User question.
+
+    Returns:
+        dict: The digest with the rendered ``answer`` added, or None if the question needs retrieval.
+    """
+    with span("digest") as stage:
+        digest = find_digest(question)
+        stage.set(meeting=digest["meeting"] if digest else None)
+    if digest is None:
+        return None
+    return dict(digest, answer=format_digest(digest))
+
+
+def _cache_key(question, identity, top_k, model, temperature, index_file, metadata_file):
+    # Paraphrases about different meetings or years embed closely but must not share answers;
+    # neither do callers with different LLM credentials
+    parsed = parse_query(question)
+    scope = (tuple(sorted(parsed["meeting"].items())) if parsed["meeting"] else None, tuple(parsed["years"]))
+    snapshot = index_snapshot(f"{index_file}.index", metadata_file, os.path.join(SHARD_DIR, "manifest.json"))
+    return (identity, top_k, model, temperature, scope), snapshot
+
+
+def check_answer_cache(question, identity, top_k=DEFAULT_TOP_K, model=None, temperature=DEFAULT_TEMPERATURE,
+                       index_file="faiss_index", metadata_file="metadata.pkl"):
+    """
+    Encode a question and look for the answer to a paraphrase of it in the semantic cache.
+
+    Answers are only shared between callers with the same LLM credentials,
+    like completions in ``generate_answer``.
+
+    Args:
+        question (str): User question.
+        identity (str): Caller's credential identity (``AzureOpenAIHelper.identity``).
+        top_k (int, optional): Number of passages. Defaults to DEFAULT_TOP_K.
+        model (str, optional): Deployment name (None for the default).
+        temperature (float, optional): Sampling temperature. Defaults to DEFAULT_TEMPERATURE.
+        index_file (str, optional): FAISS index path without the ".index" suffix.
+        metadata_file (str, optional): Passage metadata path.
+
+    Returns:
+        tuple: (question embedding, cached entry or None). The embedding is None when the cache is disabled.
+    """
+    if not SEMANTIC_CACHE_ENABLED:
+        return None, None
+    with span("encode_question"):
+        embedding = get_resource("batch_encoder").encode([question])
+    with span("semantic_cache") as stage:
+        params, snapshot = _cache_key(question, identity, top_k, model, temperature, index_file, metadata_file)
+        hit = get_resource("semantic_cache").lookup(question, embedding, params, snapshot)
+        stage.set(cache_hit=hit is not None, distance=hit["distance"] if hit else None)
+    return embedding, hit
+
+
+def remember_answer(question, identity, embedding, answer, sources, top_k=DEFAULT_TOP_K, model=None,
+                    temperature=DEFAULT_TEMPERATURE, index_file="faiss_index", metadata_file="metadata.pkl"):
+    """Store an answer in the semantic cache (see ``check_answer_cache`` for the arguments)."""
+    if embedding is None or answer is None:
+        return
+    params, snapshot = _cache_key(question, identity, top_k, model, temperature, index_file, metadata_file)
+    get_resource("semantic_cache").store(question, embedding, answer, sources, params, snapshot)
+
+
+def generate_answer(question, sources, ai_helper, model=None, temperature=DEFAULT_TEMPERATURE):
+    """
+    Ask the LLM to answer a question from retrieved passages.
+
+    Concurrent requests with the same normalized question, context, model and
+    temperature share one completion, provided they use the same endpoint and
+    API key: a caller never receives an answer (or a failure) obtained with
+    another caller's credentials.
+
+    Args:
+        question (str): User question.
+        sources (list): Output of ``retrieve``.
+        ai_helper (AzureOpenAIHelper): LLM client.
+        model (str, optional): Deployment name. Defaults to the helper's default model.
+        temperature (float, optional): Sampling temperature. Defaults to DEFAULT_TEMPERATURE.
+
+    Returns:
+        str: Answer, or None if the completion failed.
+    """
+    with span("prompt_build", passages=len(sources)) as stage:
+        context = "\n".join(source["text"] for source in sources)
+        prompt = build_prompt(context, question)
+        stage.set(prompt_chars=len(prompt))
+    model = model or ai_helper.DEFAULT_MODEL
+    key = (
+        ai_helper.identity, normalize_question(question), hashlib.sha256(context.encode("utf-8")).hexdigest(),
+        model, temperature,
+    )
+    with span("generate"):
+        return completion_flight.do(
+            key,
+            ai_helper.get_response,
+            message=prompt,
+            instruction=ASSISTANT_INSTRUCTION,
+            model=model,
+            temperature=temperature,
+        )
+
+
+def answer_question(question, ai_helper, top_k=DEFAULT_TOP_K, model=None, temperature=DEFAULT_TEMPERATURE):
+    """
+    Retrieve context for a question and answer it.
+
+    Args:
+        question (str): User question.
+        ai_helper (AzureOpenAIHelper): LLM client.
+        top_k (int, optional): Number of passages. Defaults to DEFAULT_TOP_K.
+        model (str, optional): Deployment name. Defaults to the helper's default model.
+        temperature (float, optional): Sampling temperature. Defaults to DEFAULT_TEMPERATURE.
+
+    Returns:
+        dict: ``answer`` (None if no passage matched or the completion failed), ``sources``,
+        ``digest_meeting`` (the meeting whose precomputed digest answered, or None),
+        ``cached_question`` (the earlier question whose answer was reused, or None) and
+        ``trace``, the per-stage timing breakdown (None when tracing is off or the call is
+        part of a larger trace).
+    """
+    hit = None
+    with span("answer_question", question_chars=len(question)) as root:
+        digest = check_digest(question)
+        if digest is not None:
+            answer, sources = digest["answer"], digest["passages"]
+        else:
+            embedding, hit = check_answer_cache(question, ai_helper.identity, top_k, model, temperature)
+            if hit is not None:
+                answer, sources = hit["answer"], hit["sources"]
+            else:
+                sources = retrieve(question, top_k=top_k, query_embedding=embedding)
+                answer = generate_answer(question, sources, ai_helper, model, temperature) if sources else None
+                remember_answer(question, ai_helper.identity, embedding, answer, sources, top_k, model, temperature)
+    return {
+        "answer": answer,
+        "sources": sources,
+        "digest_meeting": digest["meeting"] if digest else None,
+        "cached_question": hit["question"] if hit else None,
+        "trace": getattr(root, "trace", None),
+    }
@@ -0,0 +1,170 @@
+import re
+from datetime import date
+
+import numpy as np
+
+# Month names and the abbreviations people type ("Sept", "Dec.")
+MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4, "april": 4,
+    "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8, "sep": 9, "sept": 9,
+    "september": 9, "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12,
+}
+MONTH_PATTERN = "(" + "|".join(sorted(MONTHS, key=len, reverse=True)) + r")\.?"
+
+ISO_DATE_PATTERN = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+# "December 13, 2023", "Dec 12-13, 2023", "July 31st 2024"
+MONTH_DAY_YEAR_PATTERN = re.compile(
+    rf"\b{MONTH_PATTERN}\s+(\d{{1,2}})(?:st|nd|rd|th)?(?:\s*[-–]\s*\d{{1,2}})?,?\s+(\d{{4}})\b", re.IGNORECASE
+)
+# "December 2023", "Sept. of 2022"
+MONTH_YEAR_PATTERN = re.compile(rf"\b{MONTH_PATTERN}\s+(?:of\s+)?(\d{{4}})\b", re.IGNORECASE)
+LATEST_MEETING_PATTERN = re.compile(
+    r"\b(?:last|latest|most recent|previous|prior|recent)\s+(?:fomc\s+|fed\s+)?(?:meeting|decision|statement)\b",
+    re.IGNORECASE,
+)
+
+YEAR_PATTERN = re.compile(r"\b(19[5-9]\d|20\d\d)\b")
+# "between 2020 and 2022", "from 2020 to 2022", "2020-2022", "2020 through 2022"
+YEAR_RANGE_PATTERN = re.compile(
+    r"\b(?:between\s+|from\s+)?(19[5-9]\d|20\d\d)\s*(?:-|–|\bto\b|\band\b|\bthrough\b|\buntil\b)\s*(19[5-9]\d|20\d\d)\b",
+    re.IGNORECASE,
+)
+SINCE_YEAR_PATTERN = re.compile(r"\b(?:since|after)\s+(19[5-9]\d|20\d\d)\b", re.IGNORECASE)
+
+# Document types named in questions (the keys match the ``doc_type`` of indexed chunks)
+DOC_TYPE_PATTERNS = {
+    "minutes": re.compile(r"\bminutes\b", re.IGNORECASE),
+    "statement": re.compile(r"\b(?:post-?meeting\s+)?statements?\b", re.IGNORECASE),
+    "sep": re.compile(
+        # "sep" but not the month abbreviation in "Sep 2023"
+        r"\b(?:sep(?!t?\.?\s+\d)|dot\s*plots?|dots|summary\s+of\s+economic\s+projections|economic\s+projections)\b",
+        re.IGNORECASE,
+    ),
+    "press_conference": re.compile(r"\b(?:press\s+conferences?|presser)\b", re.IGNORECASE),
+}
+
+
+def parse_meeting_reference(question):
+    """
+    Find the meeting a question refers to.
+
+    Recognizes ISO dates, "Month day, year", "Month year" and phrases such as
+    "the latest meeting". The first match wins, most specific form first.
+
+    Args:
+        question (str): User question.
+
+    Returns:
+        dict: ``year``, ``month`` and ``day`` (None when not given) and ``latest``
+        (True for "last/latest meeting"), or None if the question names no meeting.
+    """
+    match = ISO_DATE_PATTERN.search(question)
+    if match:
+        year, month, day = (int(group) for group in match.groups())
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            return {"year": year, "month": month, "day": day, "latest": False}
+    match = MONTH_DAY_YEAR_PATTERN.search(question)
+    if match:
+        return {
+            "year": int(match.group(3)), "month": MONTHS[match.group(1).lower()], "day": int(match.group(2)),
+            "latest": False,
+        }
+    match = MONTH_YEAR_PATTERN.search(question)
+    if match:
+        return {"year": int(match.group(2)), "month": MONTHS[match.group(1).lower()], "day": None, "latest": False}
+    if LATEST_MEETING_PATTERN.search(question):
+        return {"year": None, "month": None, "day": None, "latest": True}
+    return None
+
+
+def _meeting_spans(question):
+    return [
+        match.span()
+        for pattern in (ISO_DATE_PATTERN, MONTH_DAY_YEAR_PATTERN, MONTH_YEAR_PATTERN)
+        for match in pattern.finditer(question)
+    ]
+
+
+def parse_query(question, today=None):
+    """
+    Extract the meeting, years and document types a question is about.
+
+    Years inside a meeting reference ("December 2023") are not reported
+    separately; ranges ("2020 to 2022", "since 2021") are expanded.
+
+    Args:
+        question (str): User question.
+        today (date-like, optional): Reference date for open ranges. Defaults to today.
+
+    Returns:
+        dict: ``meeting`` (see ``parse_meeting_reference``, or None), ``years`` (sorted ints)
+        and ``doc_types`` (sorted keys of DOC_TYPE_PATTERNS).
+    """
+    meeting_spans = _meeting_spans(question)
+
+    def outside_meeting(match):
+        return not any(start <= match.start() < end for start, end in meeting_spans)
+
+    years = set()
+    for match in YEAR_RANGE_PATTERN.finditer(question):
+        if outside_meeting(match):
+            first, last = sorted(int(year) for year in match.groups())
+            years.update(range(first, last + 1))
+    current_year = np.datetime64(today or date.today(), "D").astype(object).year
+    for match in SINCE_YEAR_PATTERN.finditer(question):
+        years.update(range(int(match.group(1)), current_year + 1))
+    for match in YEAR_PATTERN.finditer(question):
+        if outside_meeting(match):
+            years.add(int(match.group(1)))
+
+    return {
+        "meeting": parse_meeting_reference(question),
+        "years": sorted(years),
+        "doc_types": sorted(name for name, pattern in DOC_TYPE_PATTERNS.items() if pattern.search(question)),
+    }
+
+
+def resolve_meeting(reference, meetings, today=None, tolerance=3):
+    """
+    Match a meeting reference against known meeting dates.
+
+    Args:
+        reference (dict): Output of ``parse_meeting_reference``.
+        meetings (numpy.ndarray): Sorted datetime64[D] meeting dates.
+        today (date-like, optional): Reference date for "latest meeting". Defaults to today.
+        tolerance (int, optional): Days a day reference may be off (meetings span two days). Defaults to 3.
+
+    Returns:
+        numpy.datetime64: The meeting, or None if none matches.
+    """
+    if not len(meetings):
+        return None
+    if reference["latest"]:
+        i = np.searchsorted(meetings, np.datetime64(today or date.today(), "D"), side="right")
+        return meetings[i - 1] if i else None
+    if reference["day"] is not None:
+        try:
+            day = np.datetime64(f"{reference['year']:04d}-{reference['month']:02d}-{reference['day']:02d}", "D")
+        except ValueError:
+            return None
+        i = np.searchsorted(meetings, day)
+        candidates = meetings[max(i - 1, 0):i + 1]
+        closest = candidates[np.argmin(np.abs(candidates - day))]
+        return closest if abs(int((closest - day).astype(int))) <= tolerance else None
+    # Several meetings in one month (e.g. March 2020): the last decision is taken
+    month = np.datetime64(f"{reference['year']:04d}-{reference['month']:02d}", "M")
+    i = np.searchsorted(meetings, (month + 1).astype("datetime64[D]"), side="left")
+    return meetings[i - 1] if i and meetings[i - 1] >= month.astype("datetime64[D]") else None
+
+
+# Example usage: parse a few typical questions
+if __name__ == "__main__":
+    for question in [
+        "What happened at the December 2023 meeting?",
+        "How did members vote on Dec 12-13, 2023?",
+        "Summarize the 2024-09-18 decision",
+        "What did the Fed decide at its latest meeting?",
+        "How did the dot plot shift between 2021 and 2023?",
+        "How is inflation evolving?",
+    ]:
+        print(f"{question!r}: {parse_query(question)}")
@@ -0,0 +1,278 @@
+import glob
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.downsampling import resample_mean
+from fomc_dashboard.modules.paths import DATA_DIR
+
+# Store location; CSV drops (e.g. FRED "DFF" downloads) go in the incoming/ subfolder
+FED_FUNDS_DIR = os.path.join(DATA_DIR, "fed_funds")
+
+# Rate at each recent policy decision, used until a CSV drop has been ingested
+SEED_RATES = {
+    "2020-11-05": 0.00, "2022-03-16": 0.25, "2022-05-04": 0.75, "2022-06-15": 1.50,
+    "2022-07-27": 2.25, "2022-09-21": 3.00, "2022-11-02": 3.75, "2022-12-14": 4.25,
+    "2023-02-01": 4.50, "2023-03-22": 4.75, "2023-05-03": 5.00, "2023-06-14": 5.00,
+    "2023-07-26": 5.25, "2023-09-20": 5.25, "2023-11-01": 5.25, "2023-12-13": 5.25,
+    "2024-01-31": 5.25, "2024-03-20": 5.25, "2024-05-01": 5.25, "2024-06-12": 5.25,
+    "2024-07-31": 5.25, "2024-09-18": 4.75, "2024-11-07": 4.50,
+}
+
+
+def read_rate_csv(path):
+    """
+    Read a date/value CSV such as FRED's DFF export.
+
+    The first column is parsed as the date and the second as the rate; FRED's
+    "." placeholder for missing observations is dropped.
+
+    Args:
+        path (str): CSV file path.
+
+    Returns:
+        tuple: (dates, values) as datetime64[D] and float64 arrays, sorted by date.
+    """
+    df = pd.read_csv(path, usecols=[0, 1], na_values=["."])
+    df.columns = ["Date", "Rate"]
+    df = df.dropna()
+    dates = pd.to_datetime(df["Date"]).to_numpy().astype("datetime64[D]")
+    values = df["Rate"].to_numpy(dtype=np.float64)
+    order = np.argsort(dates, kind="stable")
+    return dates[order], values[order]
+
+
+def merge_series(dates, values, new_dates, new_values):
+    """
+    Merge new observations into a sorted series; new values win on duplicate dates.
+
+    Args:
+        dates (numpy.ndarray): Existing sorted datetime64[D] dates.
+        values (numpy.ndarray): Existing values.
+        new_dates (numpy.ndarray): Sorted dates to merge in.
+        new_values (numpy.ndarray): Values to merge in.
+
+    Returns:
+        tuple: Merged (dates, values), sorted and unique by date.
+    """
+    if not len(new_dates):
+        return dates, values
+    # Fast path: a drop that only extends the history
+    if not len(dates) or new_dates[0] > dates[-1]:
+        return np.concatenate([dates, new_dates]), np.concatenate([values, new_values])
+
+    merged_dates = np.concatenate([dates, new_dates])
+    merged_values = np.concatenate([values, new_values])
+    order = np.argsort(merged_dates, kind="stable")
+    merged_dates, merged_values = merged_dates[order], merged_values[order]
+    # Keep the last entry of each run of equal dates (the newer observation)
+    keep = np.append(merged_dates[1:] != merged_dates[:-1], True)
+    return merged_dates[keep], merged_values[keep]
+
+
+class RateStore:
+    """
+    Daily fed funds rate history stored as a memory-mapped, date-sorted array pair.
+
+    Arrays are written as versioned .npy files described by a manifest, so a
+    refresh never overwrites a file another reader may still have mapped.
+    """
+
+    def __init__(self, store_dir=FED_FUNDS_DIR):
+        """
+        Initialize the RateStore instance and map the latest arrays.
+
+        Args:
+            store_dir (str, optional): Store directory. Defaults to FED_FUNDS_DIR.
+        """
+        self.store_dir = store_dir
+        self.drop_dir = os.path.join(store_dir, "incoming")
+        self.manifest_path = os.path.join(store_dir, "manifest.json")
+        self._lock = threading.Lock()
+
+        self.manifest = self._read_manifest()
+        if self.manifest["version"]:
+            self._dates, self._values = self._map_arrays(self.manifest["version"])
+            self.is_seed = False
+        else:
+            self._dates = np.array(list(SEED_RATES), dtype="datetime64[D]")
+            self._values = np.array(list(SEED_RATES.values()), dtype=np.float64)
+            self.is_seed = True
+        self._aggregates = self._compute_aggregates()
+
+    def snapshot(self):
+        """
+        Return the current arrays; they are never modified in place.
+
+        Returns:
+            tuple: (dates, values).
+        """
+        return self._dates, self._values
+
+    def date_range(self):
+        """Return the first and last stored dates as datetime.date objects."""
+        dates = self._dates
+        return dates[0].astype(object), dates[-1].astype(object)
+
+    def slice(self, start, end):
+        """
+        Return the observations between two dates (inclusive) by binary search.
+
+        Args:
+            start (date-like): First date.
+            end (date-like): Last date.
+
+        Returns:
+            tuple: (dates, values) views into the stored arrays.
+        """
+        return self._slice(self.snapshot(), start, end)
+
+    def aggregate(self, unit="M", start=None, end=None):
+        """
+        Return precomputed monthly ("M") or annual ("Y") averages within a date range.
+
+        Args:
+            unit (str, optional): "M" or "Y". Defaults to "M".
+            start (date-like, optional): First date. Defaults to the start of the history.
+            end (date-like, optional): Last date. Defaults to the end of the history.
+
+        Returns:
+            tuple: (period start dates, mean values).
+        """
+        first, last = self.date_range()
+        # Include the period containing ``start`` even though it begins earlier
+        start = np.datetime64(start or first, unit).astype("datetime64[D]")
+        return self._slice(self._aggregates[unit], start, end or last)
+
+    def to_frame(self, start=None, end=None):
+        """
+        Return a DataFrame with ``Date`` and ``Fed Funds Rate`` columns.
+
+        Args:
+            start (date-like, optional): First date. Defaults to the start of the history.
+            end (date-like, optional): Last date. Defaults to the end of the history.
+        """
+        first, last = self.date_range()
+        dates, values = self.slice(start or first, end or last)
+        return pd.DataFrame({"Date": dates.astype("datetime64[ns]"), "Fed Funds Rate": values})
+
+    def refresh(self):
+        """
+        Ingest new or changed CSV files from the drop folder.
+
+        Only files whose modification time or size changed since the last
+        refresh are read, so calling this on every page render is cheap. A
+        file that cannot be parsed (malformed, or still being written) is
+        recorded as rejected in its current state and skipped until it
+        changes; the store keeps serving its current arrays.
+
+        Returns:
+            int: Number of new observations added to the store.
+        """
+        changed = self._changed_drops()
+        if not changed:
+            return 0
+
+        with self._lock:
+            changed = self._changed_drops()
+            if self.is_seed:
+                dates = np.empty(0, dtype="datetime64[D]")
+                values = np.empty(0, dtype=np.float64)
+            else:
+                dates, values = self.snapshot()
+            rows_before = len(dates)
+
+            accepted = False
+            for path, signature in changed:
+                name = os.path.basename(path)
+                try:
+                    new_dates, new_values = read_rate_csv(path)
+                except (ValueError, OSError) as e:
+                    print(f"Rejected rate file '{path}': {e}")
+                    self.manifest["rejected"][name] = signature
+                    continue
+                dates, values = merge_series(dates, values, new_dates, new_values)
+                self.manifest["sources"][name] = signature
+                self.manifest["rejected"].pop(name, None)
+                accepted = True
+
+            if not accepted:
+                self._write_manifest()
+                return 0
+            self._write_arrays(dates, values)
+            self._dates, self._values = self._map_arrays(self.manifest["version"])
+            self.is_seed = False
+            self._aggregates = self._compute_aggregates()
+            return len(dates) - rows_before
+
+    @staticmethod
+    def _slice(series, start, end):
+        dates, values = series
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+        return dates[lo:hi], values[lo:hi]
+
+    def _compute_aggregates(self):
+        dates, values = self.snapshot()
+        return {unit: resample_mean(dates, values, unit) for unit in ("M", "Y")}
+
+    @property
+    def rejected(self):
+        """Names of drop files that could not be parsed in their current state."""
+        return sorted(self.manifest["rejected"])
+
+    def _changed_drops(self):
+        """Return [(path, [mtime, size])] for drop files not yet ingested or rejected in their current state."""
+        changed = []
+        for path in sorted(glob.glob(os.path.join(self.drop_dir, "*.csv"))):
+            stat = os.stat(path)
+            signature = [stat.st_mtime, stat.st_size]
+            name = os.path.basename(path)
+            if signature not in (self.manifest["sources"].get(name), self.manifest["rejected"].get(name)):
+                changed.append((path, signature))
+        return changed
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {"version": 0, "rows": 0, "sources": {}}
+        manifest.setdefault("rejected", {})
+        return manifest
+
+    def _write_manifest(self):
+        os.makedirs(self.store_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _array_paths(self, version):
+        return (os.path.join(self.store_dir, f"dates-{version}.npy"),
+                os.path.join(self.store_dir, f"values-{version}.npy"))
+
+    def _map_arrays(self, version):
+        dates_path, values_path = self._array_paths(version)
+        return np.load(dates_path, mmap_mode="r"), np.load(values_path, mmap_mode="r")
+
+    def _write_arrays(self, dates, values):
+        """Write a new array version, point the manifest at it and drop older versions."""
+        os.makedirs(self.store_dir, exist_ok=True)
+        old_version = self.manifest["version"]
+        version = old_version + 1
+        dates_path, values_path = self._array_paths(version)
+        np.save(dates_path, np.ascontiguousarray(dates, dtype="datetime64[D]"))
+        np.save(values_path, np.ascontiguousarray(values, dtype=np.float64))
+
+        self.manifest.update(version=version, rows=len(dates))
+        self._write_manifest()
+
+        for path in self._array_paths(old_version) if old_version else ():
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Still mapped by a reader on Windows; an orphaned old version is harmless
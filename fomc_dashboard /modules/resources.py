@@ -0,0 +1,402 @@
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.tracing import span
+
+# Sentence embedding model shared by the retriever and every encoder
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def estimate_size(obj, _seen=None, _depth=0):
+    """
+    Estimate the memory held by a resource, in bytes.
+
+    Knows about numpy arrays (memory-mapped ones count at full size),
+    pandas objects, FAISS indexes and torch modules; other objects are
+    walked through their containers and attributes a few levels deep.
+
+    Args:
+        obj: Object to measure.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen or _depth > 5:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+    if hasattr(obj, "ntotal") and hasattr(obj, "d"):
+        # FAISS index: stored codes (code_size is d * 4 bytes for flat indexes)
+        return int(obj.ntotal) * int(getattr(obj, "code_size", obj.d * 4))
+    if callable(getattr(obj, "parameters", None)) and callable(getattr(obj, "buffers", None)):
+        # torch.nn.Module, e.g. a SentenceTransformer
+        tensors = list(obj.parameters()) + list(obj.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, seen, _depth + 1) + estimate_size(v, seen, _depth + 1) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen, _depth + 1) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += estimate_size(vars(obj), seen, _depth + 1)
+    return size
+
+
+def _describe_lifetime(ttl, idle_ttl, signature):
+    parts = []
+    if ttl:
+        parts.append(f"max age {ttl / 60:g} min")
+    if idle_ttl:
+        parts.append(f"idle {idle_ttl / 60:g} min")
+    if signature:
+        parts.append("until sources change")
+    return ", ".join(parts) or "process"
+
+
+class ResourceRegistry:
+    """
+    Process-wide singletons shared by every page and session.
+
+    Each resource is registered with a loader and an explicit lifetime: it
+    lives for the whole process unless it has a maximum age (``ttl``), an idle
+    timeout (``idle_ttl``) or a ``signature`` whose value changing (e.g. file
+    mtimes) forces a reload. Resources loaded with arguments, such as one LLM
+    client per API key, are kept per argument tuple.
+    """
+
+    def __init__(self):
+        """Initialize the ResourceRegistry instance."""
+        self._specs = {}
+        self._entries = {}
+        self._stats = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, loader, ttl=None, idle_ttl=None, signature=None, description=""):
+        """
+        Register a resource.
+
+        Args:
+            name (str): Resource name.
+            loader (callable): Called with the ``get`` arguments to build the resource.
+            ttl (float, optional): Maximum age in seconds. Defaults to the process lifetime.
+            idle_ttl (float, optional): Seconds without a hit before it is dropped.
+            signature (callable, optional): Called with the ``get`` arguments; a changed value forces a reload.
+            description (str, optional): Shown in the status panel.
+        """
+        with self._lock:
+            self._specs[name] = {
+                "loader": loader,
+                "ttl": ttl,
+                "idle_ttl": idle_ttl,
+                "signature": signature,
+                "description": description,
+            }
+            self._stats.setdefault(name, {"hits": 0, "loads": 0, "load_seconds": 0.0})
+            self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name, *args):
+        """
+        Return a resource, loading it on first use or when its lifetime has ended.
+
+        Args:
+            name (str): Registered resource name.
+            *args: Loader arguments; each distinct tuple is a separate instance.
+
+        Returns:
+            object: The shared resource.
+
+        Raises:
+            KeyError: If the resource is not registered.
+        """
+        spec = self._specs[name]
+        key = (name, args)
+        now = time.monotonic()
+        signature = spec["signature"](*args) if spec["signature"] else None
+
+        entry = self._entries.get(key)
+        if entry is not None and not self._expired(spec, entry, now, signature):
+            entry["last_used"] = now
+            self._stats[name]["hits"] += 1
+            return entry["value"]
+
+        # One loader per resource at a time, so concurrent sessions do not load a model twice
+        with self._locks[name]:
+            entry = self._entries.get(key)
+            if entry is not None and not self._expired(spec, entry, now, signature):
+                entry["last_used"] = now
+                self._stats[name]["hits"] += 1
+                return entry["value"]
+
+            start = time.perf_counter()
+            with span("load", resource=name):
+                value = spec["loader"](*args)
+            elapsed = time.perf_counter() - start
+            self._entries[key] = {"value": value, "loaded": now, "last_used": now, "signature": signature}
+            stats = self._stats[name]
+            stats["loads"] += 1
+            stats["load_seconds"] = elapsed
+            return value
+
+    @staticmethod
+    def _expired(spec, entry, now, signature):
+        if spec["ttl"] and now - entry["loaded"] > spec["ttl"]:
+            return True
+        if spec["idle_ttl"] and now - entry["last_used"] > spec["idle_ttl"]:
+            return True
+        return signature != entry["signature"]
+
+    def peek(self, name, *args):
+        """
+        Return a loaded resource without loading it or counting a hit.
+
+        Returns:
+            object: The resource, or None if it is not loaded.
+        """
+        entry = self._entries.get((name, args))
+        return None if entry is None else entry["value"]
+
+    def release(self, name):
+        """
+        Drop every loaded instance of a resource; the next ``get`` reloads it.
+
+        Args:
+            name (str): Resource name.
+        """
+        with self._locks[name]:
+            for key in [k for k in self._entries if k[0] == name]:
+                del self._entries[key]
+
+    def evict_expired(self):
+        """
+        Drop instances whose age or idle time is over their limit.
+
+        Returns:
+            int: Number of instances dropped.
+        """
+        now = time.monotonic()
+        dropped = 0
+        for key, entry in list(self._entries.items()):
+            spec = self._specs[key[0]]
+            if (spec["ttl"] and now - entry["loaded"] > spec["ttl"]) or (
+                spec["idle_ttl"] and now - entry["last_used"] > spec["idle_ttl"]
+            ):
+                self._entries.pop(key, None)
+                dropped += 1
+        return dropped
+
+    def stats(self, measure_memory=True):
+        """
+        Summarize every registered resource.
+
+        Args:
+            measure_memory (bool, optional): Estimate memory per resource. Defaults to True.
+
+        Returns:
+            pandas.DataFrame: One row per resource.
+        """
+        self.evict_expired()
+        now = time.monotonic()
+        rows = []
+        for name, spec in self._specs.items():
+            entries = [entry for key, entry in list(self._entries.items()) if key[0] == name]
+            stats = self._stats[name]
+            requests = stats["hits"] + stats["loads"]
+            rows.append({
+                "Resource": name,
+                "Description": spec["description"],
+                "Lifetime": _describe_lifetime(spec["ttl"], spec["idle_ttl"], spec["signature"]),
+                "Instances": len(entries),
+                "Hits": stats["hits"],
+                "Loads": stats["loads"],
+                "Hit Rate": stats["hits"] / requests if requests else np.nan,
+                "Last Load (s)": round(stats["load_seconds"], 3),
+                "Age (s)": round(now - min(e["loaded"] for e in entries), 1) if entries else np.nan,
+                "Memory (MB)": (
+                    sum(estimate_size(e["value"]) for e in entries) / 2**20 if measure_memory else np.nan
+                ),
+            })
+        return pd.DataFrame(rows)
+
+
+registry = ResourceRegistry()
+
+
+def register_resource(name, loader, **lifetime):
+    """Register a resource on the process-wide registry (see ``ResourceRegistry.register``)."""
+    registry.register(name, loader, **lifetime)
+
+
+def get_resource(name, *args):
+    """Return a resource from the process-wide registry (see ``ResourceRegistry.get``)."""
+    return registry.get(name, *args)
+
+
+def release_resource(name):
+    """Drop a resource from the process-wide registry so it reloads on next use."""
+    registry.release(name)
+
+
+# ----------------------------------------
+# Shared resources. Loaders import lazily so a page only pays for what it uses.
+
+def _load_embedding_model():
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+def _load_batch_encoder():
+    from fomc_dashboard.modules.batch_encoder import BatchEncoder
+
+    return BatchEncoder(get_resource("embedding_model"))
+
+
+def _load_retriever(index_file, metadata_file):
+    from fomc_dashboard.modules.sentence_transformer import FaissRetriever
+
+    return FaissRetriever(index_file, metadata_file)
+
+
+def _retriever_signature(index_file, metadata_file):
+    return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in (index_file, metadata_file))
+
+
+def _load_index_shards(shard_dir):
+    from fomc_dashboard.modules.index_shards import ShardedIndex
+
+    return ShardedIndex(shard_dir)
+
+
+def _shards_signature(shard_dir):
+    manifest = os.path.join(shard_dir, "manifest.json")
+    return os.path.getmtime(manifest) if os.path.exists(manifest) else None
+
+
+def _load_llm_client(api_key, azure_endpoint=None):
+    from fomc_dashboard.modules.ai_responder import AzureOpenAIHelper
+
+    return AzureOpenAIHelper(api_key=api_key, azure_endpoint=azure_endpoint)
+
+
+def _load_rate_store():
+    from fomc_dashboard.modules.rate_store import RateStore
+
+    return RateStore()
+
+
+def _load_event_study():
+    from fomc_dashboard.modules.event_study import run_event_study
+    from fomc_dashboard.modules.meeting_calendar import get_calendar
+
+    return run_event_study(get_calendar().previous())
+
+
+def _event_study_signature():
+    from fomc_dashboard.modules.event_study import market_files_signature
+    from fomc_dashboard.modules.meeting_calendar import get_calendar
+
+    return market_files_signature(), tuple(get_calendar().previous().astype(str))
+
+
+def _load_intraday_store():
+    from fomc_dashboard.modules.intraday_store import IntradayStore
+
+    return IntradayStore()
+
+
+def _load_sep_store():
+    from fomc_dashboard.modules.sep_store import SepStore
+
+    return SepStore()
+
+
+def _load_static_assets():
+    from fomc_dashboard.modules.assets import load_asset_pipeline
+
+    return load_asset_pipeline()
+
+
+def _load_semantic_cache():
+    from fomc_dashboard.modules.semantic_cache import SemanticCache
+    from fomc_dashboard.modules.sentence_transformer import dimension
+
+    return SemanticCache(dimension)
+
+
+def _load_digest_store():
+    from fomc_dashboard.modules.meeting_digest import DigestStore
+
+    return DigestStore()
+
+
+def _load_diff_store():
+    from fomc_dashboard.modules.statement_diff import DiffStore
+
+    return DiffStore()
+
+
+def _load_ngram_index():
+    from fomc_dashboard.modules.ngram_index import NgramIndex
+
+    return NgramIndex()
+
+
+def _ngram_signature():
+    from fomc_dashboard.modules.ngram_index import NGRAM_DIR
+
+    manifest = os.path.join(NGRAM_DIR, "manifest.json")
+    return os.path.getmtime(manifest) if os.path.exists(manifest) else None
+
+
+def _load_sentiment_lexicon():
+    from fomc_dashboard.modules.sentiment import build_lexicon
+
+    return build_lexicon()
+
+
+register_resource("embedding_model", _load_embedding_model, description=EMBEDDING_MODEL)
+register_resource(
+    "batch_encoder", _load_batch_encoder,
+    description="Micro-batching query encoder shared by all sessions",
+)
+register_resource(
+    "faiss_retriever", _load_retriever, signature=_retriever_signature,
+    description="FAISS index and passage metadata",
+)
+register_resource(
+    "index_shards", _load_index_shards, signature=_shards_signature,
+    description="Per-year FAISS shards for date-routed questions",
+)
+register_resource("semantic_cache", _load_semantic_cache, description="Answers to recent questions, matched by meaning")
+# One client per API key; dropped after an hour without questions
+register_resource("llm_client", _load_llm_client, idle_ttl=3600, description="Azure OpenAI client")
+register_resource("rate_store", _load_rate_store, description="Daily fed funds rate (memory-mapped)")
+register_resource(
+    "event_study", _load_event_study, signature=_event_study_signature,
+    description="Market reactions to every past meeting",
+)
+register_resource("intraday_store", _load_intraday_store, description="Intraday announcement windows (memory-mapped)")
+register_resource("sep_store", _load_sep_store, description="Parsed SEP dot plots")
+register_resource("digest_store", _load_digest_store, description="Precomputed meeting digests (SQLite)")
+register_resource("diff_store", _load_diff_store, description="Sentence embeddings and statement diffs (SQLite)")
+register_resource(
+    "ngram_index", _load_ngram_index, signature=_ngram_signature,
+    description="Per-meeting phrase counts (memory-mapped postings)",
+)
+register_resource("static_assets", _load_static_assets, description="Resized, content-hashed images")
+register_resource("sentiment_lexicon", _load_sentiment_lexicon, description="Hawkish/dovish terms and weights")
@@ -0,0 +1,202 @@
+import itertools
+import os
+import random
+import threading
+import time
+from collections import deque
+
+import faiss
+import numpy as np
+
+from fomc_dashboard.modules.metrics import metrics
+
+# A cached answer is reused when the new question's embedding is within this squared L2
+# distance of a cached one (embeddings are unit length, so 0.15 is a cosine similarity of 0.925)
+MAX_DISTANCE = float(os.environ.get("FOMC_SEMANTIC_CACHE_DISTANCE", "0.15"))
+MAX_ENTRIES = int(os.environ.get("FOMC_SEMANTIC_CACHE_SIZE", "5000"))
+SEMANTIC_CACHE_ENABLED = os.environ.get("FOMC_SEMANTIC_CACHE", "1") != "0"
+
+# Share of hits kept for manual false-hit review, and how many are kept
+SAMPLE_RATE = float(os.environ.get("FOMC_SEMANTIC_CACHE_SAMPLE_RATE", "0.1"))
+MAX_SAMPLES = 200
+
+# Cached neighbours checked per lookup (a neighbour only matches with the same answer parameters)
+SEARCH_NEIGHBOURS = 4
+
+CACHE_LOOKUPS = metrics.counter(
+    "fomc_semantic_cache_lookups_total", "Semantic answer cache lookups.", labels=("result",)
+)
+
+
+def index_snapshot(*paths):
+    """
+    Identify the current version of the files an answer was retrieved from.
+
+    Returns:
+        tuple: (mtime, size) per path, None for missing files.
+    """
+    snapshot = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            snapshot.append(None)
+        else:
+            snapshot.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(snapshot)
+
+
+class SemanticCache:
+    """
+    Answers keyed by question embedding, reused for paraphrased questions.
+
+    Each answered question's normalized embedding is kept in a small flat
+    FAISS index next to its answer. A lookup returns the closest entry within
+    ``max_distance`` that was answered with the same parameters (top_k,
+    model, temperature). Everything is dropped when the snapshot of the
+    retrieval index changes, since the cached answers may be stale.
+    """
+
+    def __init__(self, dimension, max_distance=MAX_DISTANCE, max_entries=MAX_ENTRIES, sample_rate=SAMPLE_RATE):
+        """
+        Initialize the SemanticCache instance.
+
+        Args:
+            dimension (int): Embedding size.
+            max_distance (float, optional): Largest squared L2 distance counted as a hit. Defaults to MAX_DISTANCE.
+            max_entries (int, optional): Capacity; the oldest tenth is evicted when full. Defaults to MAX_ENTRIES.
+            sample_rate (float, optional): Share of hits kept for false-hit review. Defaults to SAMPLE_RATE.
+        """
+        self.dimension = dimension
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self.sample_rate = sample_rate
+        self._index = faiss.IndexFlatL2(dimension)
+        self._entries = []
+        self._snapshot = None
+        self._samples = deque(maxlen=MAX_SAMPLES)
+        self._sample_ids = itertools.count(1)
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._counters = {"lookups": 0, "hits": 0, "stores": 0, "invalidations": 0, "evictions": 0}
+
+    @staticmethod
+    def _normalize(embedding):
+        vector = np.array(embedding, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _check_snapshot(self, snapshot):
+        # Called with the lock held
+        if snapshot != self._snapshot:
+            if self._entries:
+                self._counters["invalidations"] += 1
+            self._index.reset()
+            self._entries = []
+            self._snapshot = snapshot
+
+    def lookup(self, question, embedding, params, snapshot):
+        """
+        Find a cached answer for a question.
+
+        Args:
+            question (str): New question (kept with sampled hits).
+            embedding (numpy.ndarray): Its embedding.
+            params (tuple): Answer parameters that must match, e.g. (top_k, model, temperature).
+            snapshot (tuple): Current ``index_snapshot`` of the retrieval index.
+
+        Returns:
+            dict: The entry (``question``, ``answer``, ``sources``, ``distance``), or None on a miss.
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._check_snapshot(snapshot)
+            self._counters["lookups"] += 1
+            hit = None
+            if self._entries:
+                distances, indices = self._index.search(vector, min(SEARCH_NEIGHBOURS, len(self._entries)))
+                for distance, idx in zip(distances[0], indices[0]):
+                    if idx < 0 or distance > self.max_distance:
+                        break
+                    if self._entries[idx]["params"] == params:
+                        hit = dict(self._entries[idx], distance=float(distance))
+                        break
+            if hit is None:
+                CACHE_LOOKUPS.inc(result="miss")
+                return None
+            self._counters["hits"] += 1
+            CACHE_LOOKUPS.inc(result="hit")
+            if self._random.random() < self.sample_rate:
+                self._samples.append({
+                    "id": next(self._sample_ids),
+                    "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "question": question,
+                    "cached_question": hit["question"],
+                    "distance": hit["distance"],
+                    "answer": hit["answer"],
+                    "false_hit": None,
+                })
+            return hit
+
+    def store(self, question, embedding, answer, sources, params, snapshot):
+        """
+        Cache an answer.
+
+        Args:
+            question (str): Answered question.
+            embedding (numpy.ndarray): Its embedding.
+            answer (str): The answer.
+            sources (list): Passages the answer was based on.
+            params (tuple): Answer parameters (see ``lookup``).
+            snapshot (tuple): ``index_snapshot`` the passages were retrieved from.
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            self._check_snapshot(snapshot)
+            if len(self._entries) >= self.max_entries:
+                self._evict_oldest(max(self.max_entries // 10, 1))
+            self._index.add(vector)
+            self._entries.append({"question": question, "answer": answer, "sources": sources, "params": params})
+            self._counters["stores"] += 1
+
+    def _evict_oldest(self, n):
+        # Called with the lock held; a flat index is cheap to rebuild at this size
+        vectors = self._index.reconstruct_n(n, self._index.ntotal - n)
+        self._entries = self._entries[n:]
+        self._index.reset()
+        self._index.add(vectors)
+        self._counters["evictions"] += n
+
+    def review(self, sample_id, false_hit):
+        """Record a reviewer's verdict on a sampled hit."""
+        with self._lock:
+            for sample in self._samples:
+                if sample["id"] == sample_id:
+                    sample["false_hit"] = bool(false_hit)
+
+    def samples(self):
+        """Return the sampled hits, newest first."""
+        with self._lock:
+            return [dict(sample) for sample in reversed(self._samples)]
+
+    def clear(self):
+        """Drop every cached answer."""
+        with self._lock:
+            self._index.reset()
+            self._entries = []
+
+    def stats(self):
+        """
+        Return cache metrics.
+
+        Returns:
+            dict: Counters, ``entries``, ``hit_rate``, ``reviewed`` samples and the
+            estimated ``false_hit_rate`` among reviewed samples (None before any review).
+        """
+        with self._lock:
+            counters = dict(self._counters, entries=len(self._entries))
+            reviewed = [sample["false_hit"] for sample in self._samples if sample["false_hit"] is not None]
+        counters["hit_rate"] = counters["hits"] / counters["lookups"] if counters["lookups"] else 0.0
+        counters["reviewed"] = len(reviewed)
+        counters["false_hit_rate"] = sum(reviewed) / len(reviewed) if reviewed else None
+        return counters
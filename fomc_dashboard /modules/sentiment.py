@@ -0,0 +1,416 @@
+import hashlib
+import heapq
+import itertools
+import re
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from fomc_dashboard.modules.metrics import metrics
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.word_cloud import MAX_WORDS, update_word_frequencies
+
+# Predefined Hawkish/Dovish Words for Classification
+hawkish_terms = {
+    "tighten": 1, "inflation": 1, "rate hike": 2, "restrictive policy stance": 2,
+    "elevated inflation": 2, "tight financial conditions": 2, "labor market tightness": 1
+}
+dovish_terms = {
+    "accommodative": 1, "stimulus": 1, "easing": 1, "economic cooling": 2,
+    "slowing economic activity": 2, "lower unemployment risks": 1, "supply-demand pressures easing": 2
+}
+
+# Passage boundaries: sentence terminators or blank lines
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+PARAGRAPH_SPLIT_PATTERN = re.compile(r"\n\s*\n")
+
+# Separator used when cleaning many passages in one pass (never a lexicon character)
+PASSAGE_SEPARATOR = "\x00"
+
+# Streaming analysis: where a chunk may be cut so no sentence, word or whitespace run is split
+SENTENCE_END_PATTERN = re.compile(r"[.!?](?=\s)")
+TRAILING_WORD_PATTERN = re.compile(r"\s+\S*\Z")
+MAX_CARRY_CHARS = 64 * 1024
+
+SENTIMENT_LATENCY = metrics.summary(
+    "fomc_sentiment_seconds", "Sentiment analysis time per call (batch or stream).", labels=("mode",)
+)
+SENTIMENT_CHARACTERS = metrics.counter(
+    "fomc_sentiment_characters_total", "Characters of text scored for sentiment.", labels=("mode",)
+)
+
+
+# Clean text
+def clean_text(text):
+    text = re.sub(r"\s+", " ", text)  # Remove extra whitespaces
+    text = re.sub(r"[^a-zA-Z\s]", "", text)  # Remove special characters
+    text = text.lower()  # Convert to lowercase
+    return text
+
+
+# Sentiment Classification
+def classify_sentiment(text):
+    cleaned_text = clean_text(text)
+    hawkish_score = sum(cleaned_text.count(term) * weight for term, weight in hawkish_terms.items())
+    dovish_score = sum(cleaned_text.count(term) * weight for term, weight in dovish_terms.items())
+
+    if hawkish_score > dovish_score:
+        return "Hawkish", hawkish_score, dovish_score
+    elif dovish_score > hawkish_score:
+        return "Dovish", hawkish_score, dovish_score
+    else:
+        return "Neutral", hawkish_score, dovish_score
+
+
+def build_lexicon():
+    """
+    Flatten the hawkish/dovish dictionaries into a term list and a weight matrix.
+
+    Returns:
+        tuple: (terms, weights) where ``weights`` is an (n_terms, 2) array holding
+        the hawkish weight of each term in column 0 and the dovish weight in column 1.
+    """
+    terms = list(hawkish_terms) + list(dovish_terms)
+    weights = np.zeros((len(terms), 2))
+    weights[:len(hawkish_terms), 0] = list(hawkish_terms.values())
+    weights[len(hawkish_terms):, 1] = list(dovish_terms.values())
+    return terms, weights
+
+
+def split_passages(text, unit="sentence"):
+    """
+    Split raw document text into sentences or paragraphs.
+
+    Args:
+        text (str): Raw document text (before cleaning, so punctuation is still present).
+        unit (str, optional): "sentence" or "paragraph". Defaults to "sentence".
+
+    Returns:
+        list: Non-empty, stripped passages in document order.
+    """
+    if unit == "sentence":
+        pattern = SENTENCE_SPLIT_PATTERN
+    elif unit == "paragraph":
+        pattern = PARAGRAPH_SPLIT_PATTERN
+    else:
+        raise ValueError(f"Unknown passage unit: {unit!r}")
+    return [passage.strip() for passage in pattern.split(text) if passage.strip()]
+
+
+def sentence_windows(text, size=3):
+    """
+    Split text into passages of ``size`` consecutive sentences (the last one may be shorter).
+
+    Returns:
+        list: Passages in document order.
+    """
+    sentences = split_passages(text)
+    return [" ".join(sentences[i:i + size]) for i in range(0, len(sentences), size)]
+
+
+def clean_passages(passages):
+    """
+    Apply ``clean_text`` to many passages with a single pass of each regex.
+
+    Args:
+        passages (list): Raw passages.
+
+    Returns:
+        list: Cleaned passages, aligned with the input.
+    """
+    corpus = PASSAGE_SEPARATOR.join(passages)
+    corpus = re.sub(r"\s+", " ", corpus)
+    corpus = re.sub(r"[^a-zA-Z\s\x00]", "", corpus)
+    return corpus.lower().split(PASSAGE_SEPARATOR)
+
+
+def build_term_matrix(cleaned_passages, terms):
+    """
+    Build a sparse passage-term count matrix.
+
+    Passages are joined into one string separated by newlines (which cleaned text
+    never contains), each term is scanned once over the whole corpus, and match
+    offsets are mapped back to passage rows with a binary search.
+
+    Args:
+        cleaned_passages (list): Passages already passed through ``clean_text``.
+        terms (list): Lexicon terms, one matrix column each.
+
+    Returns:
+        scipy.sparse.csr_matrix: (n_passages, n_terms) matrix of term counts.
+    """
+    corpus = "\n".join(cleaned_passages)
+    lengths = np.fromiter((len(p) + 1 for p in cleaned_passages), dtype=np.int64, count=len(cleaned_passages))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    rows, cols = [], []
+    for column, term in enumerate(terms):
+        offsets = np.fromiter((m.start() for m in re.finditer(re.escape(term), corpus)), dtype=np.int64)
+        if offsets.size:
+            rows.append(np.searchsorted(starts, offsets, side="right") - 1)
+            cols.append(np.full(offsets.size, column, dtype=np.int64))
+
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+    else:
+        rows = cols = np.empty(0, dtype=np.int64)
+    data = np.ones(rows.size, dtype=np.int32)
+    # Duplicate (row, col) pairs are summed when converting to CSR
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(cleaned_passages), len(terms)))
+
+
+def score_documents(documents, unit="sentence"):
+    """
+    Score every sentence (or paragraph) of many documents in one matrix product.
+
+    Args:
+        documents (list or dict): Raw document texts, or a mapping of document id to text.
+        unit (str, optional): "sentence" or "paragraph". Defaults to "sentence".
+
+    Returns:
+        pandas.DataFrame: One row per passage with columns ``document``, ``passage``,
+        ``text``, ``hawkish_score``, ``dovish_score`` and ``net_score``
+        (hawkish minus dovish).
+    """
+    items = documents.items() if isinstance(documents, dict) else enumerate(documents)
+    start = time.perf_counter()
+
+    doc_ids, passage_ids, passages = [], [], []
+    for doc_id, text in items:
+        doc_passages = split_passages(text, unit=unit)
+        doc_ids.extend([doc_id] * len(doc_passages))
+        passage_ids.extend(range(len(doc_passages)))
+        passages.extend(doc_passages)
+
+    terms, weights = get_resource("sentiment_lexicon")
+    term_matrix = build_term_matrix(clean_passages(passages), terms)
+    scores = np.asarray(term_matrix @ weights)
+    SENTIMENT_LATENCY.observe(time.perf_counter() - start, mode="batch")
+    SENTIMENT_CHARACTERS.inc(sum(len(passage) for passage in passages), mode="batch")
+
+    return pd.DataFrame({
+        "document": doc_ids,
+        "passage": passage_ids,
+        "text": passages,
+        "hawkish_score": scores[:, 0],
+        "dovish_score": scores[:, 1],
+        "net_score": scores[:, 0] - scores[:, 1],
+    })
+
+
+def top_passages(passage_scores, n=5, side="hawkish"):
+    """
+    Return the passages contributing most to one side of the sentiment score.
+
+    Args:
+        passage_scores (pandas.DataFrame): Output of ``score_documents``.
+        n (int, optional): Number of passages to return. Defaults to 5.
+        side (str, optional): "hawkish" or "dovish". Defaults to "hawkish".
+
+    Returns:
+        pandas.DataFrame: Up to ``n`` passages with a positive score, highest first.
+    """
+    column = f"{side}_score"
+    values = passage_scores[column].to_numpy()
+    candidates = np.flatnonzero(values > 0)
+    if candidates.size > n:
+        candidates = candidates[np.argpartition(-values[candidates], n - 1)[:n]]
+    candidates = candidates[np.argsort(-values[candidates], kind="stable")]
+    return passage_scores.iloc[candidates]
+
+
+class StreamingAnalyzer:
+    """
+    Incremental sentiment analysis over a document fed in chunks.
+
+    Each chunk is cut at the last sentence boundary (or whitespace) and the
+    remainder is carried into the next one, so cleaning chunk by chunk gives
+    the same text as cleaning the whole document. Only the current chunk, the
+    running term/word counts and the top passages are kept in memory.
+    """
+
+    def __init__(self, top_n=5, max_carry=MAX_CARRY_CHARS):
+        """
+        Initialize the StreamingAnalyzer instance.
+
+        Args:
+            top_n (int, optional): Number of top hawkish/dovish passages to keep. Defaults to 5.
+            max_carry (int, optional): Longest text carried between chunks. Defaults to MAX_CARRY_CHARS.
+        """
+        self.terms, self.weights = get_resource("sentiment_lexicon")
+        self.top_n = top_n
+        self.max_carry = max_carry
+
+        self.term_counts = np.zeros(len(self.terms), dtype=np.int64)
+        self.word_frequencies = Counter()
+        self.characters = 0
+
+        self._hash = hashlib.sha256()
+        self._carry = ""
+        # Cleaned text kept from the previous chunk to count lexicon terms spanning the cut
+        self._cleaned_tail = ""
+        self._tail_size = max(len(term) for term in self.terms) - 1
+        self._top = {"hawkish": [], "dovish": []}
+        self._sequence = itertools.count()
+
+    def feed(self, text):
+        """
+        Add the next chunk of raw document text.
+
+        Args:
+            text (str): Raw text chunk.
+        """
+        self._hash.update(text.encode("utf-8"))
+        self.characters += len(text)
+
+        text = self._carry + text
+        cut = self._find_cut(text)
+        self._carry = text[cut:]
+        self._process(text[:cut])
+
+    def close(self):
+        """
+        Flush the carried text and return the analysis.
+
+        Returns:
+            dict: ``sentiment``, ``hawkish_score``, ``dovish_score``, ``term_counts``,
+            ``word_frequencies``, ``top_hawkish``, ``top_dovish`` (lists of (passage, score),
+            highest first), ``characters`` and ``doc_hash``.
+        """
+        self._process(self._carry)
+        self._carry = ""
+
+        hawkish_score, dovish_score = (self.term_counts @ self.weights).astype(int).tolist()
+        if hawkish_score > dovish_score:
+            sentiment = "Hawkish"
+        elif dovish_score > hawkish_score:
+            sentiment = "Dovish"
+        else:
+            sentiment = "Neutral"
+
+        return {
+            "sentiment": sentiment,
+            "hawkish_score": hawkish_score,
+            "dovish_score": dovish_score,
+            "term_counts": dict(zip(self.terms, self.term_counts.tolist())),
+            "word_frequencies": dict(self.word_frequencies.most_common(MAX_WORDS)),
+            "top_hawkish": self._ranked("hawkish"),
+            "top_dovish": self._ranked("dovish"),
+            "characters": self.characters,
+            "doc_hash": self._hash.hexdigest(),
+        }
+
+    def _find_cut(self, text):
+        """Return the offset up to which ``text`` can be processed now."""
+        window_start = max(len(text) - self.max_carry, 0)
+        window = text[window_start:]
+
+        last_sentence_end = None
+        for last_sentence_end in SENTENCE_END_PATTERN.finditer(window):
+            pass
+        if last_sentence_end is not None:
+            return window_start + last_sentence_end.end()
+
+        trailing_word = TRAILING_WORD_PATTERN.search(window)
+        if trailing_word is not None:
+            return window_start + trailing_word.start()
+        return len(text)
+
+    def _process(self, text):
+        """Clean and score a piece of text that ends on a safe boundary."""
+        if not text:
+            return
+
+        # Document-level counts, matching classify_sentiment on the full text
+        cleaned = clean_text(text)
+        combined = self._cleaned_tail + cleaned
+        self.term_counts += np.array(
+            [combined.count(term) - self._cleaned_tail.count(term) for term in self.terms], dtype=np.int64
+        )
+        self._cleaned_tail = combined[-self._tail_size:]
+        update_word_frequencies(self.word_frequencies, cleaned)
+
+        # Sentence-level scores, keeping only the top passages
+        passages = split_passages(text)
+        if not passages:
+            return
+        scores = np.asarray(build_term_matrix(clean_passages(passages), self.terms) @ self.weights)
+        for column, side in enumerate(["hawkish", "dovish"]):
+            heap = self._top[side]
+            for row in np.flatnonzero(scores[:, column] > 0):
+                item = (float(scores[row, column]), next(self._sequence), passages[row])
+                if len(heap) < self.top_n:
+                    heapq.heappush(heap, item)
+                elif item[0] > heap[0][0]:
+                    heapq.heapreplace(heap, item)
+
+    def _ranked(self, side):
+        """Return the kept passages for one side as (passage, score), highest score first."""
+        return [(text, score) for score, _, text in sorted(self._top[side], key=lambda item: (-item[0], item[1]))]
+
+
+def analyze_chunks(chunks, top_n=5):
+    """
+    Run a StreamingAnalyzer over an iterable of text chunks.
+
+    Args:
+        chunks (iterable): Raw text chunks, e.g. from ``document_reader.iter_text_chunks``.
+        top_n (int, optional): Number of top hawkish/dovish passages to keep. Defaults to 5.
+
+    Returns:
+        dict: See ``StreamingAnalyzer.close``.
+    """
+    start = time.perf_counter()
+    analyzer = StreamingAnalyzer(top_n=top_n)
+    for chunk in chunks:
+        analyzer.feed(chunk)
+    result = analyzer.close()
+    SENTIMENT_LATENCY.observe(time.perf_counter() - start, mode="stream")
+    SENTIMENT_CHARACTERS.inc(result["characters"], mode="stream")
+    return result
+
+
+def _synthetic_corpus(n_documents, sentences_per_document, seed=0):
+    """Generate FOMC-like documents sprinkled with lexicon terms."""
+    rng = np.random.default_rng(seed)
+    filler = np.array([
+        "the committee", "economic activity", "participants noted", "over the intermeeting period",
+        "household spending", "the labor market", "financial markets", "longer-term yields",
+        "business investment", "energy prices", "the staff projection", "consumer price",
+    ])
+    lexicon = np.array(list(hawkish_terms) + list(dovish_terms))
+    documents = []
+    for _ in range(n_documents):
+        words = rng.choice(filler, size=(sentences_per_document, 6))
+        hits = rng.random(sentences_per_document) < 0.3
+        words[hits, 3] = rng.choice(lexicon, size=hits.sum())
+        documents.append(" ".join(" ".join(row).capitalize() + "." for row in words))
+    return documents
+
+
+# Example usage: throughput benchmark on a synthetic corpus
+if __name__ == "__main__":
+    for n_documents in (100, 1_000, 10_000):
+        corpus = _synthetic_corpus(n_documents, sentences_per_document=50)
+
+        start = time.perf_counter()
+        passage_scores = score_documents(corpus)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for document in corpus:
+            classify_sentiment(document)
+        baseline = time.perf_counter() - start
+
+        print(
+            f"{n_documents:>6} docs | {len(passage_scores):>8} sentences | "
+            f"sentence scoring {elapsed:.3f}s ({len(passage_scores) / elapsed:,.0f} sentences/s) | "
+            f"document-level classify_sentiment {baseline:.3f}s"
+        )
+
+    print("\nTop hawkish passages:")
+    print(top_passages(passage_scores, n=3)[["document", "text", "hawkish_score"]].to_string(index=False))
@@ -0,0 +1,390 @@
+import glob
+import os
+import re
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.document_reader import extract_text_from_pdf
+from fomc_dashboard.modules.paths import DATA_DIR
+
+# Local copies of fomcprojtabl*.pdf and the parsed store built from them
+SEP_PDF_DIR = os.path.join(DATA_DIR, "documents", "sep")
+SEP_STORE_FILE = os.path.join(DATA_DIR, "sep", "sep_store.npz")
+
+# FOMC meeting dates and corresponding SEP file names
+SEP_LIBRARY = [
+    {"Date": "January 31, 2023", "File Name": "fomcprojtabl20230131.pdf"},
+    {"Date": "March 22, 2023", "File Name": "fomcprojtabl20230322.pdf"},
+    {"Date": "June 14, 2023", "File Name": "fomcprojtabl20230614.pdf"},
+    {"Date": "September 20, 2023", "File Name": "fomcprojtabl20230920.pdf"},
+    {"Date": "December 13, 2023", "File Name": "fomcprojtabl20231213.pdf"},
+    {"Date": "March 20, 2024", "File Name": "fomcprojtabl20240320.pdf"},
+    {"Date": "June 19, 2024", "File Name": "fomcprojtabl20240619.pdf"},
+    {"Date": "September 18, 2024", "File Name": "fomcprojtabl20240918.pdf"},
+    {"Date": "December 11, 2024", "File Name": "fomcprojtabl20241211.pdf"},
+]
+
+# Base URL for SEP files
+SEP_BASE_URL = "https://www.federalreserve.gov/monetarypolicy/files/"
+
+# Histogram grid: midpoints of 25bp target ranges from 0-0.25 to 6.75-7
+MIDPOINT_GRID = np.arange(0.125, 7.0, 0.25)
+
+# Horizon code used for the "Longer run" column
+LONGER_RUN = 0
+
+# Dot plot previously hardcoded on the SEP page (September 2024 SEP), used when no PDFs are parsed
+SEED_DOTS = {
+    "meeting": "2024-09-18",
+    "ranges": [
+        "2-2.25", "2.25-2.5", "2.5-2.75", "2.75-3", "3.0-3.25", "3.25-3.5", "3.5-3.75", "3.75-4",
+        "4-4.25", "4.25-4.5", "4.5-4.75", "4.75-5", "5.25-5.5", "5.5-5.75", "5.75-6",
+    ],
+    "counts": {
+        2024: [0, 0, 0, 0, 0, 0, 0, 0, 1, 9, 7, 2, 0, 0, 0],
+        2025: [0, 0, 0, 0, 2, 6, 6, 3, 1, 1, 0, 0, 0, 0, 0],
+        2026: [0, 1, 3, 6, 2, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0],
+        2027: [0, 2, 3, 5, 2, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0],
+    },
+}
+
+
+def horizon_label(horizon):
+    """Return the display label of a horizon code ("2025", "Longer run")."""
+    return "Longer run" if horizon == LONGER_RUN else str(horizon)
+
+
+def range_label(midpoint):
+    """Format a dot midpoint as its 25bp target range, e.g. 4.375 -> "4.25-4.5"."""
+    return f"{midpoint - 0.125:g}-{midpoint + 0.125:g}"
+
+
+def meeting_from_file_name(file_name):
+    """Return the meeting date encoded in an fomcprojtabl file name as datetime64[D]."""
+    digits = re.search(r"(\d{8})", file_name).group(1)
+    return np.datetime64(f"{digits[:4]}-{digits[4:6]}-{digits[6:]}", "D")
+
+
+def parse_projection_years(text):
+    """
+    Find the projection horizons in the Table 1 header ("2024 2025 2026 2027 Longer run").
+
+    Returns:
+        list: Year horizons followed by LONGER_RUN; empty if the header is not found.
+    """
+    match = re.search(r"((?:20\d\d\s+){2,4})Longer\s*run", text)
+    if not match:
+        return []
+    return [int(year) for year in match.group(1).split()] + [LONGER_RUN]
+
+
+def parse_fed_funds_medians(text, horizons):
+    """
+    Read the published median federal funds rate per horizon from Table 1.
+
+    Returns:
+        dict: Horizon -> median; empty if the row is not found.
+    """
+    numbers = r"((?:\s*\d+\.\d+){%d})" % len(horizons)
+    match = re.search(r"Federal funds rate[^\d]*?" + numbers, text)
+    if not match:
+        return {}
+    return dict(zip(horizons, (float(value) for value in match.group(1).split())))
+
+
+def parse_dot_table(text, horizons):
+    """
+    Read dot counts from a "midpoint count count ..." table in the extracted text.
+
+    The printed dot plot is a graphic, so this only succeeds for documents
+    whose text includes the tabular version; rows whose count of cells does
+    not match the horizons are ambiguous (blank cells) and are rejected.
+
+    Returns:
+        list: (horizon, midpoint, count) tuples.
+    """
+    rows = []
+    for match in re.finditer(r"^\s*(\d{1,2}\.\d{3})((?:[ \t]+\d{1,2})+)[ \t]*$", text, flags=re.MULTILINE):
+        counts = [int(value) for value in match.group(2).split()]
+        if len(counts) != len(horizons):
+            continue
+        midpoint = float(match.group(1))
+        rows.extend((horizon, midpoint, count) for horizon, count in zip(horizons, counts) if count)
+    return rows
+
+
+def read_dots_csv(path):
+    """
+    Read a sidecar dot table: a ``midpoint`` column and one column per horizon.
+
+    Returns:
+        list: (horizon, midpoint, count) tuples.
+    """
+    df = pd.read_csv(path)
+    rows = []
+    for column in df.columns[1:]:
+        horizon = LONGER_RUN if column.strip().lower().startswith("longer") else int(column)
+        for midpoint, count in zip(df.iloc[:, 0], df[column].fillna(0)):
+            if count:
+                rows.append((horizon, float(midpoint), int(count)))
+    return rows
+
+
+def parse_sep_pdf(path):
+    """
+    Parse one fomcprojtabl PDF.
+
+    Dot counts come from the document text when available, otherwise from a
+    sidecar ``<name>_dots.csv`` next to the PDF.
+
+    Args:
+        path (str): PDF path.
+
+    Returns:
+        dict: ``meeting``, ``dots`` ((horizon, midpoint, count) tuples) and ``medians`` (horizon -> median).
+    """
+    text = extract_text_from_pdf(path)
+    horizons = parse_projection_years(text)
+    dots = parse_dot_table(text, horizons) if horizons else []
+
+    sidecar = os.path.splitext(path)[0] + "_dots.csv"
+    if not dots and os.path.exists(sidecar):
+        dots = read_dots_csv(sidecar)
+    return {
+        "meeting": meeting_from_file_name(os.path.basename(path)),
+        "dots": dots,
+        "medians": parse_fed_funds_medians(text, horizons) if horizons else {},
+    }
+
+
+def seed_documents():
+    """Return the built-in dot plot in the same shape as ``parse_sep_pdf`` output."""
+    midpoints = [float(label.split("-")[0]) + 0.125 for label in SEED_DOTS["ranges"]]
+    dots = [
+        (year, midpoint, count)
+        for year, counts in SEED_DOTS["counts"].items()
+        for midpoint, count in zip(midpoints, counts) if count
+    ]
+    return [{"meeting": np.datetime64(SEED_DOTS["meeting"], "D"), "dots": dots, "medians": {}}]
+
+
+def summarize_histograms(histograms):
+    """
+    Compute dot statistics for many histograms at once.
+
+    Args:
+        histograms (numpy.ndarray): (n_rows, len(MIDPOINT_GRID)) dot counts.
+
+    Returns:
+        dict: Arrays of length n_rows: ``participants``, ``median``, ``p25``, ``p75``,
+        ``mean``, ``std``, ``low`` and ``high``.
+    """
+    counts = histograms.astype(np.float64)
+    n = counts.sum(axis=1)
+    cumulative = np.cumsum(histograms, axis=1)
+    safe_n = np.where(n > 0, n, 1)
+
+    def value_at_rank(rank):
+        # Midpoint of the dot at a (0-based, fractional) rank, interpolating between neighbours
+        lower = np.floor(rank).astype(np.int64)
+        upper = np.ceil(rank).astype(np.int64)
+        low_values = MIDPOINT_GRID[(cumulative > lower[:, None]).argmax(axis=1)]
+        high_values = MIDPOINT_GRID[(cumulative > upper[:, None]).argmax(axis=1)]
+        return low_values + (high_values - low_values) * (rank - lower)
+
+    mean = counts @ MIDPOINT_GRID / safe_n
+    variance = counts @ (MIDPOINT_GRID ** 2) / safe_n - mean ** 2
+    stats = {
+        "participants": n.astype(np.int64),
+        "median": value_at_rank((n - 1) / 2),
+        "p25": value_at_rank((n - 1) * 0.25),
+        "p75": value_at_rank((n - 1) * 0.75),
+        "mean": mean,
+        "std": np.sqrt(np.clip(variance, 0, None)),
+        "low": MIDPOINT_GRID[(histograms > 0).argmax(axis=1)],
+        "high": MIDPOINT_GRID[len(MIDPOINT_GRID) - 1 - (histograms[:, ::-1] > 0).argmax(axis=1)],
+    }
+    empty = n == 0
+    for key in ("median", "p25", "p75", "mean", "std", "low", "high"):
+        stats[key] = np.where(empty, np.nan, stats[key])
+    return stats
+
+
+def documents_to_arrays(documents):
+    """
+    Turn parsed SEP documents into the store's columnar arrays.
+
+    One row per (meeting, horizon) holds the dot histogram on MIDPOINT_GRID,
+    its precomputed statistics and the published Table 1 median.
+
+    Args:
+        documents (list): ``parse_sep_pdf`` outputs.
+
+    Returns:
+        dict: Array name -> numpy.ndarray.
+    """
+    meetings, horizons, histograms, published = [], [], [], []
+    for document in sorted(documents, key=lambda d: d["meeting"]):
+        by_horizon = {}
+        for horizon, midpoint, count in document["dots"]:
+            column = int(np.argmin(np.abs(MIDPOINT_GRID - midpoint)))
+            by_horizon.setdefault(horizon, np.zeros(len(MIDPOINT_GRID), dtype=np.int16))[column] += count
+        # Calendar years first, "Longer run" last
+        for horizon in sorted(by_horizon, key=lambda h: (h == LONGER_RUN, h)):
+            meetings.append(document["meeting"])
+            horizons.append(horizon)
+            histograms.append(by_horizon[horizon])
+            published.append(document["medians"].get(horizon, np.nan))
+
+    histograms = np.array(histograms, dtype=np.int16).reshape(-1, len(MIDPOINT_GRID))
+    arrays = {
+        "meeting": np.array(meetings, dtype="datetime64[D]"),
+        "horizon": np.array(horizons, dtype=np.int16),
+        "histogram": histograms,
+        "published_median": np.array(published, dtype=np.float32),
+        "grid": MIDPOINT_GRID,
+    }
+    arrays.update({f"stat_{key}": value for key, value in summarize_histograms(histograms).items()})
+    return arrays
+
+
+def build_sep_store(documents, store_file=SEP_STORE_FILE):
+    """
+    Write parsed SEP documents to a compact columnar .npz store.
+
+    Args:
+        documents (list): ``parse_sep_pdf`` outputs.
+        store_file (str, optional): Output path. Defaults to SEP_STORE_FILE.
+
+    Returns:
+        int: Number of (meeting, horizon) rows written.
+    """
+    arrays = documents_to_arrays(documents)
+    os.makedirs(os.path.dirname(store_file), exist_ok=True)
+    # Write next to the target and swap, so a running dashboard never loads a partial file
+    tmp_path = store_file + ".tmp.npz"
+    np.savez_compressed(tmp_path, **arrays)
+    os.replace(tmp_path, store_file)
+    return len(arrays["meeting"])
+
+
+def build_from_pdfs(pdf_dir=SEP_PDF_DIR, store_file=SEP_STORE_FILE):
+    """
+    Parse every fomcprojtabl*.pdf in a directory and rebuild the store.
+
+    Documents without dot counts add no rows; when none has any, the store
+    is left as it was rather than replaced by an empty one.
+
+    Returns:
+        int: Number of (meeting, horizon) rows written.
+    """
+    documents = []
+    for path in sorted(glob.glob(os.path.join(pdf_dir, "fomcprojtabl*.pdf"))):
+        document = parse_sep_pdf(path)
+        if not document["dots"]:
+            print(f"No dot counts found in {os.path.basename(path)}; add a sidecar _dots.csv to include it.")
+            continue
+        documents.append(document)
+    if not documents:
+        print(f"No dot counts found in '{pdf_dir}'; '{store_file}' was not written.")
+        return 0
+    return build_sep_store(documents, store_file)
+
+
+class SepStore:
+    """
+    Read side of the SEP store: every lookup is an index into precomputed arrays.
+    """
+
+    def __init__(self, store_file=SEP_STORE_FILE):
+        """
+        Initialize the SepStore instance, falling back to the built-in dot plot
+        when there is no store file or it holds no rows.
+
+        Args:
+            store_file (str, optional): Store path. Defaults to SEP_STORE_FILE.
+        """
+        self.store_file = store_file
+        self._lock = threading.Lock()
+        # False so the first refresh always loads, even when there is no store file yet
+        self._mtime = False
+        self.refresh()
+
+    def refresh(self):
+        """Reload the arrays if the store file was built, rebuilt or removed."""
+        mtime = os.path.getmtime(self.store_file) if os.path.exists(self.store_file) else None
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            arrays = None
+            if mtime is not None:
+                with np.load(self.store_file) as data:
+                    arrays = {key: data[key] for key in data.files}
+            # An empty store (e.g. built before any dot counts were available) shows the seed instead
+            is_seed = arrays is None or not len(arrays["meeting"])
+            self.arrays = documents_to_arrays(seed_documents()) if is_seed else arrays
+            self.is_seed = is_seed
+            self._mtime = mtime
+
+    def meetings(self):
+        """Return the meetings in the store, most recent first, as datetime64[D]."""
+        return np.unique(self.arrays["meeting"])[::-1]
+
+    def horizons(self, meeting):
+        """Return the horizon codes available for a meeting."""
+        return self.arrays["horizon"][self._rows(meeting)].tolist()
+
+    def histogram(self, meeting, horizon):
+        """
+        Return one dot plot column as a DataFrame of non-empty 25bp ranges.
+
+        Returns:
+            pandas.DataFrame: ``Rate (%)`` (range label), ``Midpoint`` and ``Count``.
+        """
+        row = self._row(meeting, horizon)
+        counts = self.arrays["histogram"][row]
+        nonzero = np.flatnonzero(counts)
+        midpoints = self.arrays["grid"][nonzero]
+        return pd.DataFrame({
+            "Rate (%)": [range_label(m) for m in midpoints],
+            "Midpoint": midpoints,
+            "Count": counts[nonzero],
+        })
+
+    def summary(self, meeting):
+        """
+        Return the precomputed statistics for every horizon of a meeting.
+
+        Returns:
+            pandas.DataFrame: One row per horizon.
+        """
+        rows = self._rows(meeting)
+        arrays = self.arrays
+        return pd.DataFrame({
+            "Horizon": [horizon_label(h) for h in arrays["horizon"][rows]],
+            "Participants": arrays["stat_participants"][rows],
+            "Median": arrays["stat_median"][rows],
+            "Published Median": arrays["published_median"][rows],
+            "25th Pct": arrays["stat_p25"][rows],
+            "75th Pct": arrays["stat_p75"][rows],
+            "Std Dev": arrays["stat_std"][rows].round(2),
+            "Low": arrays["stat_low"][rows],
+            "High": arrays["stat_high"][rows],
+        })
+
+    def _rows(self, meeting):
+        return np.flatnonzero(self.arrays["meeting"] == np.datetime64(meeting, "D"))
+
+    def _row(self, meeting, horizon):
+        rows = self._rows(meeting)
+        return rows[np.flatnonzero(self.arrays["horizon"][rows] == horizon)[0]]
+
+
+# Offline build: python -m fomc_dashboard.modules.sep_store [pdf_dir]
+if __name__ == "__main__":
+    written = build_from_pdfs(*sys.argv[1:2])
+    if written:
+        print(f"Wrote {written} meeting/horizon rows to '{SEP_STORE_FILE}'.")
@@ -0,0 +1,98 @@
+import re
+import threading
+from concurrent.futures import Future
+
+from fomc_dashboard.modules.tracing import set_attributes
+
+
+def normalize_question(question):
+    """
+    Normalize a question for deduplication: case, whitespace and trailing punctuation.
+
+    Args:
+        question (str): Raw question.
+
+    Returns:
+        str: Normalized question.
+    """
+    return re.sub(r"\s+", " ", question).strip().rstrip("?!. ").lower()
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers with the same key.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait for and receive the same result (or exception). Nothing is
+    cached: once the call finishes, the next caller starts a new one.
+    """
+
+    def __init__(self, name):
+        """
+        Initialize the SingleFlight instance.
+
+        Args:
+            name (str): Label shown with the counters.
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._counters = {"calls": 0, "coalesced": 0, "max_waiters": 0}
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Run ``fn(*args, **kwargs)`` unless an identical call is already in flight.
+
+        The current trace span is tagged ``coalesced`` when the result was shared.
+
+        Args:
+            key (hashable): Identity of the call.
+            fn (callable): Function to run.
+
+        Returns:
+            object: The result of the (possibly shared) call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call["waiters"] += 1
+                self._counters["coalesced"] += 1
+                self._counters["max_waiters"] = max(self._counters["max_waiters"], call["waiters"])
+                leader = False
+            else:
+                call = {"future": Future(), "waiters": 0}
+                self._calls[key] = call
+                self._counters["calls"] += 1
+                leader = True
+
+        set_attributes(coalesced=not leader)
+        if not leader:
+            return call["future"].result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            call["future"].set_exception(e)
+            raise
+        else:
+            call["future"].set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self):
+        """
+        Return the counters.
+
+        Returns:
+            dict: ``calls`` executed, ``coalesced`` calls saved, ``max_waiters`` on one call
+            and ``in_flight`` calls right now.
+        """
+        with self._lock:
+            return dict(self._counters, name=self.name, in_flight=len(self._calls))
+
+
+# Process-wide flights for the question-answer path
+retrieval_flight = SingleFlight("retrieval")
+completion_flight = SingleFlight("completion")
@@ -0,0 +1,442 @@
+import argparse
+import difflib
+import glob
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from fomc_dashboard.modules.document_mirror import MINUTES_DIR, STATEMENTS_DIR
+from fomc_dashboard.modules.document_reader import extract_text_from_pdf
+from fomc_dashboard.modules.paths import DATA_DIR
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.sentiment import split_passages
+
+# Sentence embeddings and precomputed diffs, one SQLite database
+DIFF_DB = os.path.join(DATA_DIR, "diffs", "diffs.sqlite")
+
+# Documents compared: the policy statement quoted in the minutes, or the whole minutes
+DOCUMENT_KINDS = {"statement": "Policy statement", "minutes": "Minutes"}
+
+# Aligned sentences at or above this cosine similarity are the same sentence, possibly reworded;
+# below it they count as one removed and one added sentence
+MODIFIED_SIMILARITY = 0.75
+
+ENCODE_BATCH_SIZE = 256
+
+# Bump when sentence extraction changes, so the next build re-encodes every meeting
+DIFF_VERSION = 2
+
+MINUTES_FILE_PATTERN = re.compile(r"fomcminutes(\d{4})(\d{2})(\d{2})\.pdf$")
+STATEMENT_FILE_PATTERN = re.compile(r"monetary(\d{4})(\d{2})(\d{2})a1\.pdf$")
+POLICY_SECTION_PATTERN = re.compile(r"Committee Policy Actions?", re.IGNORECASE)
+# The sentence introducing the quoted statement ("The vote also encompassed approval of the statement below
+# for release at 2:00 p.m.:", older "...to be released at 2:15 p.m.:")
+STATEMENT_QUOTE_PATTERN = re.compile(
+    r"approval of the (?:accompanying )?statement below (?:for release|to be released)"
+    r"(?: at \d{1,2}:\d{2} [ap]\.m\.)?:?",
+    re.IGNORECASE,
+)
+ROLL_CALL_PATTERN = re.compile(r"Voting for this action")
+# The domestic policy directive the policy vote covers ("...directs the Desk to", older "...seeks monetary
+# and financial conditions")
+DIRECTIVE_PATTERN = re.compile(
+    r"domestic policy directive|Federal Open Market Committee directs the Desk|"
+    r"Federal Open Market Committee seeks monetary and financial conditions",
+    re.IGNORECASE,
+)
+
+# Press release framing around the statement text
+RELEASE_LINE_PATTERN = re.compile(r"For (?:release at \d{1,2}:\d{2} [ap]\.m\.(?: E[DS]T)?|immediate release)", re.IGNORECASE)
+PRESS_STATEMENT_END_PATTERN = re.compile(
+    r"Voting for the (?:FOMC )?monetary policy action|Implementation Note|For media inquiries", re.IGNORECASE
+)
+
+
+def policy_roll_call(text):
+    """
+    Locate the roll call of the policy vote in minutes text.
+
+    Minutes can hold several roll calls (organizational matters, facilities,
+    the Board's votes), so the first one is not necessarily the policy vote.
+    The vote is found from the domestic policy directive: the roll call that
+    closes the vote on it (the first one after its last mention), or the last
+    roll call before it when the directive is quoted after the vote. Without
+    a directive, the first roll call after the last "Committee Policy Action"
+    heading is used, then the first roll call.
+
+    Returns:
+        int: Position of the roll call, or -1 if the minutes have none.
+    """
+    roll_calls = [match.start() for match in ROLL_CALL_PATTERN.finditer(text)]
+    if not roll_calls:
+        return -1
+    directives = list(DIRECTIVE_PATTERN.finditer(text))
+    anchors = directives or list(POLICY_SECTION_PATTERN.finditer(text))
+    if not anchors:
+        return roll_calls[0]
+    anchor = anchors[-1].start()
+    after = [position for position in roll_calls if position > anchor]
+    if after:
+        return after[0]
+    return roll_calls[-1] if directives else roll_calls[0]
+
+
+def policy_statement(text):
+    """
+    Return the sentences of the policy statement as quoted in the minutes.
+
+    The statement runs from the sentence introducing it ("...approval of
+    the statement below for release at 2:00 p.m.:") to the policy roll call
+    (see ``policy_roll_call``), so it matches ``press_statement`` of the
+    same meeting. Older minutes without that sentence fall back to the last
+    "Committee Policy Action" heading before the roll call, then to the
+    2,000 characters before it.
+
+    Returns:
+        list: Sentences, empty if the minutes have no roll call.
+    """
+    end = policy_roll_call(text)
+    if end < 0:
+        return []
+    anchors = list(STATEMENT_QUOTE_PATTERN.finditer(text, 0, end)) or list(POLICY_SECTION_PATTERN.finditer(text, 0, end))
+    start = anchors[-1].end() if anchors else max(end - 2000, 0)
+    return split_passages(text[start:end])
+
+
+def press_statement(text):
+    """
+    Return the sentences of a policy statement press release.
+
+    The release header ("For release at 2:00 p.m. EST") and everything from
+    the vote ("Voting for the monetary policy action were...") on are
+    dropped, matching the statement as quoted in the minutes.
+
+    Returns:
+        list: Sentences.
+    """
+    text = re.sub(r"\s+", " ", text)
+    header = RELEASE_LINE_PATTERN.search(text)
+    start = header.end() if header else 0
+    end = PRESS_STATEMENT_END_PATTERN.search(text, start)
+    return split_passages(text[start:end.start() if end else len(text)])
+
+
+def _normalized(embeddings):
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def align_sentences(previous, current, previous_embeddings, current_embeddings, threshold=MODIFIED_SIMILARITY):
+    """
+    Align two documents sentence by sentence and label every change.
+
+    All pairwise cosine similarities come from one matrix product; the
+    Hungarian algorithm (``linear_sum_assignment``) then picks the one-to-one
+    pairing with the highest total similarity. Pairs at or above
+    ``threshold`` are "unchanged" (identical text) or "modified"; every
+    other sentence is "removed" (previous only) or "added" (current only).
+
+    Args:
+        previous (list): Sentences of the earlier document.
+        current (list): Sentences of the later document.
+        previous_embeddings (numpy.ndarray): Embeddings of ``previous``, one row per sentence.
+        current_embeddings (numpy.ndarray): Embeddings of ``current``.
+        threshold (float, optional): Lowest similarity of a modified pair. Defaults to MODIFIED_SIMILARITY.
+
+    Returns:
+        list: Dicts with ``change``, ``text`` (None if removed), ``previous`` (None if added) and
+        ``similarity``, in the order of the current document; removed sentences follow the
+        sentence they came after.
+    """
+    matched = {}
+    if previous and current:
+        similarity = _normalized(previous_embeddings) @ _normalized(current_embeddings).T
+        rows, cols = linear_sum_assignment(similarity, maximize=True)
+        matched = {
+            int(i): (int(j), float(similarity[i, j])) for i, j in zip(rows, cols) if similarity[i, j] >= threshold
+        }
+
+    entries = []
+    matched_current = {j: (i, score) for i, (j, score) in matched.items()}
+    for j, text in enumerate(current):
+        if j in matched_current:
+            i, score = matched_current[j]
+            change = "unchanged" if previous[i] == text else "modified"
+            row = {"change": change, "text": text, "previous": previous[i], "similarity": score}
+            entries.append(((j, 0, i), row))
+        else:
+            entries.append(((j, 0, -1), {"change": "added", "text": text, "previous": None, "similarity": None}))
+
+    # A removed sentence is placed after the current position of the closest earlier matched sentence
+    anchor = -1
+    for i, text in enumerate(previous):
+        if i in matched:
+            anchor = matched[i][0]
+        else:
+            entries.append(((anchor, 1, i), {"change": "removed", "text": None, "previous": text, "similarity": None}))
+    return [entry for _, entry in sorted(entries, key=lambda item: item[0])]
+
+
+def summarize(rows):
+    """Count the rows of a diff by change type."""
+    counts = {"added": 0, "removed": 0, "modified": 0, "unchanged": 0}
+    for row in rows:
+        counts[row["change"]] += 1
+    return counts
+
+
+def highlight_changes(previous, text):
+    """
+    Mark the words that differ between two versions of a sentence.
+
+    Returns:
+        str: Markdown of ``text`` with deleted words as ~~strikethrough~~ and inserted words in **bold**.
+    """
+    old, new = previous.split(), text.split()
+    parts = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+        if tag in ("delete", "replace"):
+            parts.append(f"~~{' '.join(old[i1:i2])}~~")
+        if tag in ("insert", "replace"):
+            parts.append(f"**{' '.join(new[j1:j2])}**")
+        if tag == "equal":
+            parts.append(" ".join(new[j1:j2]))
+    return " ".join(parts)
+
+
+def document_sentences(minutes_text, statement_text=None):
+    """
+    Split a meeting's documents into the sentences of each document kind.
+
+    Args:
+        minutes_text (str): Minutes text, or None if the minutes are not out yet.
+        statement_text (str, optional): Text of the policy statement press release; the statement
+            quoted in the minutes is used without it.
+
+    Returns:
+        dict: Sentence lists keyed by DOCUMENT_KINDS, for the kinds the documents cover.
+    """
+    documents = {}
+    if minutes_text is not None:
+        text = re.sub(r"\s+", " ", minutes_text)
+        documents["minutes"] = split_passages(text)
+        documents["statement"] = policy_statement(text)
+    if statement_text is not None:
+        documents["statement"] = press_statement(statement_text)
+    return documents
+
+
+class DiffStore:
+    """
+    Sentence embeddings per meeting and document, plus the diffs computed from them.
+
+    Diffs between consecutive meetings are precomputed by ``build_diffs``;
+    any other pair is aligned from the stored embeddings on first request
+    (one matrix product) and cached as well.
+    """
+
+    def __init__(self, db_file=DIFF_DB):
+        """
+        Initialize the DiffStore instance, creating the database if needed.
+
+        Args:
+            db_file (str, optional): Database path. Defaults to DIFF_DB.
+        """
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (meeting TEXT NOT NULL, kind TEXT NOT NULL, "
+                "sentences TEXT NOT NULL, embeddings BLOB NOT NULL, dimension INTEGER NOT NULL, "
+                "signature TEXT NOT NULL, PRIMARY KEY (kind, meeting))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS diffs (kind TEXT NOT NULL, previous TEXT NOT NULL, current TEXT NOT NULL, "
+                "body TEXT NOT NULL, PRIMARY KEY (kind, previous, current))"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.db_file, timeout=10)
+
+    def put_document(self, meeting, kind, sentences, embeddings, signature):
+        """Store a document's sentences and embeddings, dropping the cached diffs that involve it."""
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?)",
+                (meeting, kind, json.dumps(sentences), embeddings.tobytes(), embeddings.shape[1], signature),
+            )
+            connection.execute(
+                "DELETE FROM diffs WHERE kind = ? AND (previous = ? OR current = ?)", (kind, meeting, meeting)
+            )
+
+    def signatures(self, kind):
+        """Return {meeting: source signature} of the stored documents of a kind."""
+        with closing(self._connect()) as connection:
+            return dict(connection.execute("SELECT meeting, signature FROM documents WHERE kind = ?", (kind,)))
+
+    def meetings(self, kind):
+        """Return the meetings with a stored document of a kind, oldest first."""
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT meeting FROM documents WHERE kind = ? AND sentences != '[]' ORDER BY meeting", (kind,)
+            )
+            return [row[0] for row in rows]
+
+    def has_diff(self, previous, current, kind):
+        """Return True if the diff between two meetings' documents is cached."""
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                "SELECT 1 FROM diffs WHERE kind = ? AND previous = ? AND current = ?", (kind, previous, current)
+            ).fetchone() is not None
+
+    def document(self, meeting, kind):
+        """
+        Return a stored document.
+
+        Returns:
+            tuple: (sentences, embeddings), or None if the document is not stored.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT sentences, embeddings, dimension FROM documents WHERE kind = ? AND meeting = ?", (kind, meeting)
+            ).fetchone()
+        if row is None:
+            return None
+        sentences = json.loads(row[0])
+        return sentences, np.frombuffer(row[1], dtype=np.float32).reshape(len(sentences), row[2])
+
+    def diff(self, previous, current, kind="statement"):
+        """
+        Return the diff between two meetings' documents, computing and caching it if needed.
+
+        Args:
+            previous (str): Earlier meeting (ISO date).
+            current (str): Later meeting (ISO date).
+            kind (str, optional): A DOCUMENT_KINDS key. Defaults to "statement".
+
+        Returns:
+            list: Rows of ``align_sentences``, or None if either document is not stored.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT body FROM diffs WHERE kind = ? AND previous = ? AND current = ?", (kind, previous, current)
+            ).fetchone()
+        if row is not None:
+            return json.loads(row[0])
+        old, new = self.document(previous, kind), self.document(current, kind)
+        if old is None or new is None:
+            return None
+        rows = align_sentences(old[0], new[0], old[1], new[1])
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO diffs VALUES (?, ?, ?, ?)", (kind, previous, current, json.dumps(rows))
+            )
+        return rows
+
+
+def _dated_paths(directory, pattern):
+    paths = {}
+    for path in glob.glob(os.path.join(directory, "*.pdf")):
+        match = pattern.search(os.path.basename(path))
+        if match:
+            paths["-".join(match.groups())] = path
+    return paths
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    signature = [DIFF_VERSION, os.path.basename(path), stat.st_mtime_ns, stat.st_size]
+    return hashlib.sha1(json.dumps(signature).encode("utf-8")).hexdigest()
+
+
+def build_diffs(store=None, minutes_dir=MINUTES_DIR, statements_dir=STATEMENTS_DIR, force=False):
+    """
+    Embed every mirrored minutes and statement PDF and precompute the diffs between consecutive meetings.
+
+    The policy statement comes from the same-day press release when it is
+    mirrored, so a meeting's statement diff is available on release day;
+    until then (and for meetings without a mirrored release) the statement
+    quoted in the minutes is used. Only documents that are new or changed
+    since the last build are read and encoded; diffs are recomputed only for
+    the pairs that involve them.
+
+    Args:
+        store (DiffStore, optional): Target store. Defaults to the shared store.
+        minutes_dir (str, optional): Directory of mirrored minutes PDFs. Defaults to MINUTES_DIR.
+        statements_dir (str, optional): Directory of mirrored statement PDFs. Defaults to STATEMENTS_DIR.
+        force (bool, optional): Re-encode every document. Defaults to False.
+
+    Returns:
+        dict: Counts of ``encoded`` meetings and ``diffs`` computed.
+    """
+    store = store or get_resource("diff_store")
+    minutes_paths = _dated_paths(minutes_dir, MINUTES_FILE_PATTERN)
+    statement_paths = _dated_paths(statements_dir, STATEMENT_FILE_PATTERN)
+
+    existing = {kind: {} if force else store.signatures(kind) for kind in DOCUMENT_KINDS}
+    counts = {"encoded": 0, "diffs": 0}
+    encoder = None
+    for meeting in sorted(set(minutes_paths) | set(statement_paths)):
+        # Source file of each kind: the press release wins over the statement quoted in the minutes
+        sources = {"statement": statement_paths.get(meeting) or minutes_paths[meeting]}
+        if meeting in minutes_paths:
+            sources["minutes"] = minutes_paths[meeting]
+        signatures = {kind: _file_signature(path) for kind, path in sources.items()}
+        changed = [kind for kind in sources if existing[kind].get(meeting) != signatures[kind]]
+        if not changed:
+            continue
+
+        minutes_text = statement_text = None
+        if "minutes" in changed or sources["statement"] == minutes_paths.get(meeting):
+            minutes_text = extract_text_from_pdf(minutes_paths[meeting])
+        if meeting in statement_paths and "statement" in changed:
+            statement_text = extract_text_from_pdf(statement_paths[meeting])
+        documents = {kind: sentences for kind, sentences in document_sentences(minutes_text, statement_text).items()
+                     if kind in changed}
+
+        encoder = encoder or get_resource("embedding_model")
+        # One encoder pass for both documents (the statement sentences repeat minutes sentences)
+        unique = list(dict.fromkeys(sentence for sentences in documents.values() for sentence in sentences))
+        if unique:
+            embeddings = np.asarray(encoder.encode(unique, batch_size=ENCODE_BATCH_SIZE), dtype=np.float32)
+        else:
+            embeddings = np.empty((0, 0), dtype=np.float32)
+        rows = {sentence: i for i, sentence in enumerate(unique)}
+        for kind, sentences in documents.items():
+            store.put_document(meeting, kind, sentences, embeddings[[rows[s] for s in sentences]], signatures[kind])
+        counts["encoded"] += 1
+
+    # Refill the consecutive pairs whose cached diff was dropped or never computed
+    for kind in DOCUMENT_KINDS:
+        meetings = store.meetings(kind)
+        for previous, current in zip(meetings, meetings[1:]):
+            if not store.has_diff(previous, current, kind):
+                store.diff(previous, current, kind)
+                counts["diffs"] += 1
+    return counts
+
+
+# Offline build: python -m fomc_dashboard.modules.statement_diff [--force]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute statement and minutes diffs between meetings")
+    parser.add_argument("--force", action="store_true", help="Re-encode every document, not only changed ones")
+    parser.add_argument("--minutes-dir", default=MINUTES_DIR)
+    parser.add_argument("--statements-dir", default=STATEMENTS_DIR)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    counts = build_diffs(DiffStore(), args.minutes_dir, args.statements_dir, args.force)
+    print(
+        f"Encoded {counts['encoded']} meetings and computed {counts['diffs']} diffs "
+        f"in {time.perf_counter() - start:.1f}s; stored in '{DIFF_DB}'."
+    )
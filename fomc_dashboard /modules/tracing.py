@@ -0,0 +1,211 @@
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from fomc_dashboard.modules.paths import DATA_DIR
+
+# Finished traces are appended here as JSON lines (set FOMC_TRACING=0 to disable tracing)
+TRACE_LOG = os.environ.get("FOMC_TRACE_LOG", os.path.join(DATA_DIR, "logs", "traces.jsonl"))
+TRACING_ENABLED = os.environ.get("FOMC_TRACING", "1") != "0"
+MAX_LOG_BYTES = 20 * 1024 * 1024
+
+# Most recent traces kept in memory for the debug panels
+RECENT_TRACES = 200
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+_recent = deque(maxlen=RECENT_TRACES)
+_log_lock = threading.Lock()
+
+
+class Span:
+    """
+    One timed stage of a request, with attributes and child stages.
+    """
+
+    def __init__(self, name, parent=None, **attributes):
+        """
+        Initialize the Span instance.
+
+        Args:
+            name (str): Stage name, e.g. "encode".
+            parent (Span, optional): Enclosing span.
+            **attributes: Initial attributes (token counts, cache flags, sizes).
+        """
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+        self.children = []
+        self.start = time.perf_counter()
+        self.duration = None
+
+    def set(self, **attributes):
+        """Add or overwrite attributes."""
+        self.attributes.update(attributes)
+
+    def to_dict(self, origin=None):
+        """Return the span tree as nested dicts, with times in milliseconds relative to the root."""
+        origin = self.start if origin is None else origin
+        return {
+            "name": self.name,
+            "offset_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round((self.duration or 0) * 1000, 3),
+            "attributes": self.attributes,
+            "children": [child.to_dict(origin) for child in list(self.children)],
+        }
+
+
+class _NullSpan:
+    """Stand-in returned while tracing is disabled."""
+
+    def set(self, **attributes):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Time a stage of the current request.
+
+    A span opened with no enclosing span is a root: when it closes, the whole
+    trace is written to TRACE_LOG and kept in memory for the debug panels.
+
+    Args:
+        name (str): Stage name.
+        **attributes: Initial attributes.
+
+    Yields:
+        Span: The span, for adding attributes such as token counts or cache hits.
+    """
+    if not TRACING_ENABLED:
+        yield _NULL_SPAN
+        return
+
+    parent = _current_span.get()
+    current = Span(name, parent, **attributes)
+    if parent is not None:
+        parent.children.append(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.set(error=type(e).__name__)
+        raise
+    finally:
+        current.duration = time.perf_counter() - current.start
+        _current_span.reset(token)
+        if parent is None:
+            _finish_trace(current)
+
+
+def set_attributes(**attributes):
+    """Add attributes to the innermost open span, if any."""
+    current = _current_span.get()
+    if current is not None:
+        current.set(**attributes)
+
+
+def current_span():
+    """Return the innermost open span, or None."""
+    return _current_span.get()
+
+
+def _finish_trace(root):
+    trace = root.to_dict()
+    trace["trace_id"] = uuid.uuid4().hex[:16]
+    trace["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    root.trace = trace
+    _recent.append(trace)
+    try:
+        with _log_lock:
+            os.makedirs(os.path.dirname(TRACE_LOG), exist_ok=True)
+            if os.path.exists(TRACE_LOG) and os.path.getsize(TRACE_LOG) > MAX_LOG_BYTES:
+                os.replace(TRACE_LOG, TRACE_LOG + ".1")
+            with open(TRACE_LOG, "a", encoding="utf-8") as f:
+                f.write(json.dumps(trace, default=str) + "\n")
+    except OSError as e:
+        print(f"Could not write trace log: {e}")
+
+
+def recent_traces(name=None, n=50):
+    """
+    Return the most recent finished traces, newest first.
+
+    Args:
+        name (str, optional): Only traces whose root has this name.
+        n (int, optional): Maximum number of traces. Defaults to 50.
+
+    Returns:
+        list: Trace dicts as written to TRACE_LOG.
+    """
+    traces = [trace for trace in reversed(_recent) if name is None or trace["name"] == name]
+    return traces[:n]
+
+
+def trace_frame(trace):
+    """
+    Flatten a trace into one row per stage for display.
+
+    Args:
+        trace (dict): A finished trace.
+
+    Returns:
+        pandas.DataFrame: ``Stage`` (indented by depth), ``Start (ms)``, ``Duration (ms)`` and ``Details``.
+    """
+    rows = []
+
+    def walk(node, depth):
+        details = ", ".join(f"{key}={value}" for key, value in node["attributes"].items())
+        rows.append({
+            "Stage": "  " * depth + node["name"],
+            "Start (ms)": node["offset_ms"],
+            "Duration (ms)": node["duration_ms"],
+            "Details": details,
+        })
+        for child in node["children"]:
+            walk(child, depth + 1)
+
+    walk(trace, 0)
+    return pd.DataFrame(rows)
+
+
+def stage_summary(traces):
+    """
+    Summarize stage durations across traces.
+
+    Args:
+        traces (list): Finished traces.
+
+    Returns:
+        pandas.DataFrame: One row per stage name with ``Calls``, ``p50 (ms)``, ``p95 (ms)`` and ``Mean (ms)``.
+    """
+    durations = {}
+
+    def walk(node):
+        durations.setdefault(node["name"], []).append(node["duration_ms"])
+        for child in node["children"]:
+            walk(child)
+
+    for trace in traces:
+        walk(trace)
+    rows = [
+        {
+            "Stage": name,
+            "Calls": len(values),
+            "p50 (ms)": float(np.percentile(values, 50)),
+            "p95 (ms)": float(np.percentile(values, 95)),
+            "Mean (ms)": float(np.mean(values)),
+        }
+        for name, values in durations.items()
+    ]
+    return pd.DataFrame(rows, columns=["Stage", "Calls", "p50 (ms)", "p95 (ms)", "Mean (ms)"])
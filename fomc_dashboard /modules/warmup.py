@@ -0,0 +1,266 @@
+import os
+import threading
+import time
+
+from fomc_dashboard.modules.file_server import register_endpoint, serve_endpoints
+from fomc_dashboard.modules.resources import get_resource
+
+# Texts encoded during warm-up: a short and a long query, so the first real
+# encode does not pay for lazy initialisation of either padding length
+WARMUP_TEXTS = [
+    "FOMC",
+    "What did the Federal Open Market Committee decide about the target range for the federal funds rate?",
+]
+
+# Step states
+PENDING, RUNNING, DONE, SKIPPED, FAILED = "pending", "running", "done", "skipped", "failed"
+
+# Failed steps are retried after 5 s, doubling up to 5 minutes, until they succeed
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 300
+
+# Address of this worker's /healthz and /readyz, reachable by the load balancer. Each worker on a host
+# needs its own port; 0 picks a free one and prints it
+PROBE_HOST = os.environ.get("FOMC_PROBE_HOST", "0.0.0.0")
+PROBE_PORT = int(os.environ.get("FOMC_PROBE_PORT", "8503"))
+
+
+class WarmUp:
+    """
+    Preload and exercise the question-answer path on a background thread.
+
+    Steps run in order: load the embedding model, run its tokenizer, encode
+    through the shared batch encoder, read and search the FAISS index, and
+    create the LLM client (skipped when no API key is configured). The
+    instance is ready once every step has finished without failing; on the
+    background thread, failed steps are retried with exponential backoff.
+    """
+
+    def __init__(self, index_file="faiss_index", metadata_file="metadata.pkl", api_key=None, azure_endpoint=None):
+        """
+        Initialize the WarmUp instance.
+
+        Args:
+            index_file (str, optional): FAISS index path without the ".index" suffix.
+            metadata_file (str, optional): Passage metadata path.
+            api_key (str, optional): Azure OpenAI API key; without one the LLM client step is skipped.
+            azure_endpoint (str, optional): Endpoint override, e.g. a local stand-in.
+        """
+        self.index_file = index_file
+        self.metadata_file = metadata_file
+        self.api_key = api_key
+        self.azure_endpoint = azure_endpoint
+        self.steps = {
+            "encoder": self._load_encoder,
+            "tokenizer": self._run_tokenizer,
+            "encode": self._encode,
+            "index": self._search_index,
+            "llm_client": self._create_llm_client,
+        }
+        self._status = {name: {"state": PENDING, "seconds": None, "error": None} for name in self.steps}
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = None
+        self._started = None
+        self._finished = None
+        self._attempts = 0
+        self._next_retry = None
+
+    def _load_encoder(self):
+        get_resource("embedding_model")
+
+    def _run_tokenizer(self):
+        tokenizer = getattr(get_resource("embedding_model"), "tokenizer", None)
+        if tokenizer is None:
+            return SKIPPED
+        tokenizer(WARMUP_TEXTS, padding=True, truncation=True)
+
+    def _encode(self):
+        get_resource("batch_encoder").encode(WARMUP_TEXTS)
+
+    def _search_index(self):
+        from fomc_dashboard.modules.sentence_transformer import query_faiss
+
+        query_faiss(WARMUP_TEXTS[0], metadata_file=self.metadata_file, index_file=self.index_file, top_k=1)
+
+    def _create_llm_client(self):
+        if not self.api_key:
+            # Still import the client library, the slowest part of creating a client later
+            import openai  # noqa: F401
+
+            return SKIPPED
+        get_resource("llm_client", self.api_key, self.azure_endpoint)
+
+    def start(self):
+        """Start the warm-up thread (once)."""
+        with self._lock:
+            if self._thread is None:
+                self._started = time.monotonic()
+                self._thread = threading.Thread(target=self.run, kwargs={"retry": True}, name="warm-up", daemon=True)
+                self._thread.start()
+        return self
+
+    def run(self, retry=False):
+        """
+        Run every step in the calling thread.
+
+        Args:
+            retry (bool, optional): Keep retrying failed steps (and the steps after them) with
+                exponential backoff until all succeed. Defaults to False: one pass.
+        """
+        if self._started is None:
+            self._started = time.monotonic()
+        pending = list(self.steps)
+        while True:
+            self._attempts += 1
+            for name in pending:
+                self._run_step(name)
+            self._finished = time.monotonic()
+            self._done.set()
+            failed = [name for name in self.steps if self._status[name]["state"] == FAILED]
+            if not failed or not retry:
+                self._next_retry = None
+                return
+            # Later steps usually depend on earlier ones, so rerun everything from the first failure
+            pending = list(self.steps)[list(self.steps).index(failed[0]):]
+            delay = min(RETRY_BASE_SECONDS * 2 ** (self._attempts - 1), RETRY_MAX_SECONDS)
+            self._next_retry = time.monotonic() + delay
+            time.sleep(delay)
+
+    def _run_step(self, name):
+        with self._lock:
+            self._status[name]["state"] = RUNNING
+        start = time.perf_counter()
+        try:
+            state, error = self.steps[name]() or DONE, None
+        except Exception as e:
+            state, error = FAILED, f"{type(e).__name__}: {e}"
+            print(f"Warm-up step '{name}' failed (attempt {self._attempts}): {error}")
+        with self._lock:
+            self._status[name].update(state=state, seconds=round(time.perf_counter() - start, 3), error=error)
+
+    @property
+    def finished(self):
+        """True once every step has run."""
+        return self._done.is_set()
+
+    @property
+    def ready(self):
+        """True once every step has run and none failed."""
+        with self._lock:
+            return self.finished and all(step["state"] != FAILED for step in self._status.values())
+
+    def wait(self, timeout=None):
+        """
+        Block until the warm-up finishes.
+
+        Returns:
+            bool: ``ready``, or False if the timeout expired first.
+        """
+        return self._done.wait(timeout) and self.ready
+
+    def status(self):
+        """
+        Return the readiness state.
+
+        Returns:
+            dict: ``state`` ("warming", "ready" or "failed"), ``elapsed_s``, ``attempts``,
+            ``retry_in_s`` (seconds until failed steps are retried, or None) and per-step
+            ``state``, ``seconds`` and ``error``.
+        """
+        with self._lock:
+            steps = {name: dict(step) for name, step in self._status.items()}
+        if not self.finished:
+            state = "warming"
+        else:
+            state = "failed" if any(step["state"] == FAILED for step in steps.values()) else "ready"
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished or time.monotonic()) - self._started
+        next_retry = self._next_retry
+        retry_in = None if next_retry is None else round(max(next_retry - time.monotonic(), 0.0), 1)
+        return {
+            "state": state, "elapsed_s": round(elapsed, 3), "attempts": self._attempts, "retry_in_s": retry_in,
+            "steps": steps,
+        }
+
+
+def health():
+    """Liveness probe: the process is up and serving."""
+    return 200, {"status": "ok"}
+
+
+def readiness():
+    """Readiness probe: 200 once the warm-up succeeded, 503 before that or if it failed."""
+    status = get_warmup().status()
+    return (200 if status["state"] == "ready" else 503), status
+
+
+_warmup = None
+_warmup_lock = threading.Lock()
+_probe_server = None
+
+
+# Probes are registered on import; they answer once the probe server runs (see get_warmup)
+register_endpoint("/healthz", health)
+register_endpoint("/readyz", readiness)
+
+
+def start_probe_server(host=PROBE_HOST, port=PROBE_PORT):
+    """
+    Serve ``/healthz`` and ``/readyz`` for this process (once).
+
+    Args:
+        host (str, optional): Bind address. Defaults to PROBE_HOST.
+        port (int, optional): Port, 0 for a free one. Defaults to PROBE_PORT.
+
+    Returns:
+        ThreadingHTTPServer: The running probe server.
+
+    Raises:
+        RuntimeError: If the address is taken, e.g. by another worker; its probes would not describe this one.
+    """
+    global _probe_server
+    if _probe_server is None:
+        try:
+            _probe_server = serve_endpoints(host, port)
+        except OSError as e:
+            raise RuntimeError(
+                f"Health probes cannot listen on {host}:{port} ({e}); "
+                "give each worker its own FOMC_PROBE_PORT (0 picks a free port)."
+            ) from e
+        bound_host, bound_port = _probe_server.server_address[:2]
+        print(f"Health probes on http://{bound_host}:{bound_port}/healthz and /readyz")
+    return _probe_server
+
+
+def get_warmup():
+    """
+    Return the process-wide warm-up, starting it and the probe server on first call.
+
+    It warms the default index files and, when AZURE_OPENAI_API_KEY is set,
+    that key's LLM client. ``/healthz`` and ``/readyz`` are served on
+    PROBE_HOST:PROBE_PORT so a load balancer can route only to warm workers;
+    if that address is taken this raises instead of starting unprobed.
+    Launch the dashboard through ``fomc_dashboard.modules.launcher`` so this
+    happens at server start; otherwise the first page render starts it.
+
+    Returns:
+        WarmUp: The running (or finished) warm-up.
+    """
+    global _warmup
+    if _warmup is None:
+        with _warmup_lock:
+            if _warmup is None:
+                start_probe_server()
+                _warmup = WarmUp(api_key=os.environ.get("AZURE_OPENAI_API_KEY")).start()
+    return _warmup
+
+
+# Example usage: time a cold warm-up
+if __name__ == "__main__":
+    warmup = WarmUp().start()
+    warmup.wait()
+    for name, step in warmup.status()["steps"].items():
+        print(f"{name:>10}: {step['state']:<8} {step['seconds'] or 0:7.3f}s {step['error'] or ''}")
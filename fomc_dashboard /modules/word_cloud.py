@@ -0,0 +1,84 @@
+import hashlib
+import io
+import re
+from collections import Counter
+
+from matplotlib.figure import Figure
+from wordcloud import STOPWORDS, WordCloud
+
+# Number of words kept for rendering (WordCloud's own default)
+MAX_WORDS = 200
+
+
+def document_hash(text):
+    """
+    Return a stable content hash used as the cache key for a document.
+
+    Args:
+        text (str or bytes): Document content.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    return hashlib.sha256(text).hexdigest()
+
+
+def update_word_frequencies(counter, cleaned_text):
+    """
+    Add the words of a cleaned text (or a chunk of one) to a running counter.
+
+    Args:
+        counter (collections.Counter): Counter updated in place.
+        cleaned_text (str): Text already passed through ``clean_text``.
+
+    Returns:
+        collections.Counter: The same counter, for chaining.
+    """
+    counter.update(
+        word for word in re.findall(r"[a-z]+", cleaned_text)
+        if len(word) > 1 and word not in STOPWORDS
+    )
+    return counter
+
+
+def compute_word_frequencies(cleaned_text, max_words=MAX_WORDS):
+    """
+    Compute the word frequencies a word cloud is drawn from.
+
+    Args:
+        cleaned_text (str): Text already passed through ``clean_text``.
+        max_words (int, optional): Number of most frequent words to keep. Defaults to MAX_WORDS.
+
+    Returns:
+        dict: Word to count, most frequent first.
+    """
+    return dict(update_word_frequencies(Counter(), cleaned_text).most_common(max_words))
+
+
+def render_word_cloud_png(frequencies, width=800, height=400):
+    """
+    Render a word cloud to PNG bytes.
+
+    A new Figure is created for every call and never registered with pyplot,
+    so concurrent sessions do not share or leak matplotlib state.
+
+    Args:
+        frequencies (dict): Word to count, e.g. from ``compute_word_frequencies``.
+        width (int, optional): Word cloud width in pixels. Defaults to 800.
+        height (int, optional): Word cloud height in pixels. Defaults to 400.
+
+    Returns:
+        bytes: PNG image.
+    """
+    wordcloud = WordCloud(background_color="white", width=width, height=height).generate_from_frequencies(frequencies)
+
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.imshow(wordcloud, interpolation="bilinear")
+    ax.axis("off")
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight")
+    return buffer.getvalue()
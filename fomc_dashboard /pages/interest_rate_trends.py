@@ -1,31 +1,20 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import os
+import sys
 
-# Load Real Historical Interest Rate Data
-def load_interest_rate_data():
-    """
-    Load real historical Fed Funds Rate data.
-    """
-    data = {
-        "Date": [
-            "2024-11-07", "2024-09-18", "2024-07-31", "2024-06-12", "2024-05-01",
-            "2024-03-20", "2024-01-31", "2023-12-13", "2023-11-01", "2023-09-20",
-            "2023-07-26", "2023-06-14", "2023-05-03", "2023-03-22", "2023-02-01",
-            "2022-12-14", "2022-11-02", "2022-09-21", "2022-07-27", "2022-06-15",
-            "2022-05-04", "2022-03-16", "2020-11-05"
-        ],
-        "Fed Funds Rate": [
-            4.50, 4.75, 5.25, 5.25, 5.25, 5.25, 5.25, 5.25, 5.25, 5.25,
-            5.25, 5.00, 5.00, 4.75, 4.50, 4.25, 3.75, 3.00, 2.25, 1.50,
-            0.75, 0.25, 0.00
-        ],
-    }
-    df = pd.DataFrame(data)
-    df["Date"] = pd.to_datetime(df["Date"])  # Ensure Date column is in datetime format
-    return df
+# Dynamically add the project root to Python's path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from fomc_dashboard.modules.downsampling import CHART_WIDTH_PX, downsample, event_indices, step_change_indices
+from fomc_dashboard.modules.meeting_calendar import get_calendar
+from fomc_dashboard.modules.profiling import profiled
+from fomc_dashboard.modules.resources import get_resource
 
 # Main App Render Function
+@profiled("interest_rate_trends")
 def render():
     """Render the Interest Rate Trends page."""
     st.title("📉 Historical Interest Rate Trends")
@@ -34,16 +23,20 @@ def render():
     Use the interactive chart below to analyze trends and key policy changes.
     """)
 
-    # Load Data
-    df = load_interest_rate_data()
+    # Load Data (picks up any new CSV drops)
+    store = get_resource("rate_store")
+    store.refresh()
+    if store.rejected:
+        st.warning(f"Skipped unreadable rate files in the drop folder: {', '.join(store.rejected)}")
+    first_date, last_date = store.date_range()
 
     # Date Range Selection - Above the Chart
     st.subheader("📅 Select Date Range")
     col1, col2 = st.columns(2)
     with col1:
-        start_date = st.date_input("Start Date", df["Date"].min())
+        start_date = st.date_input("Start Date", first_date, min_value=first_date, max_value=last_date)
     with col2:
-        end_date = st.date_input("End Date", df["Date"].max())
+        end_date = st.date_input("End Date", last_date, min_value=first_date, max_value=last_date)
 
     # Error handling for invalid date range
     if start_date > end_date:
@@ -51,8 +44,26 @@ def render():
         st.stop()
 
     # Filter Data Based on User Selection
-    filtered_df = df[(df["Date"] >= pd.to_datetime(start_date)) &
-                     (df["Date"] <= pd.to_datetime(end_date))]
+    dates, values = store.slice(start_date, end_date)
+    observations = len(dates)
+
+    # Chart Resolution: "Auto" reduces the series to the chart width but keeps every policy step
+    resolution = st.radio(
+        "Chart Resolution",
+        ["Auto", "Daily", "Monthly", "Annual"],
+        horizontal=True,
+        help="Auto keeps every rate step and downsamples the rest of the series to the chart width.",
+    )
+    if resolution == "Monthly":
+        dates, values = store.aggregate("M", start_date, end_date)
+    elif resolution == "Annual":
+        dates, values = store.aggregate("Y", start_date, end_date)
+    elif resolution == "Auto":
+        # Keep every policy step: detected rate moves plus the days around each FOMC decision
+        keep = np.union1d(step_change_indices(values), event_indices(dates, get_calendar().dates))
+        indices = downsample(dates, values, CHART_WIDTH_PX, keep=keep)
+        dates, values = dates[indices], values[indices]
+    filtered_df = pd.DataFrame({"Date": dates.astype("datetime64[ns]"), "Fed Funds Rate": values})
 
     # Plotly Visualization
     st.subheader("📊 Federal Funds Rate Over Selected Time Range")
@@ -62,11 +73,13 @@ def render():
         y="Fed Funds Rate",
         title="Federal Funds Rate Trends",
         labels={"Fed Funds Rate": "Interest Rate (%)", "Date": "Date"},
-        markers=True,
+        markers=len(filtered_df) <= 100,
+        render_mode="webgl" if len(filtered_df) > CHART_WIDTH_PX else "auto",
         template="plotly_white",
     )
     fig.update_traces(line=dict(width=3), marker=dict(size=6))
     st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"Plotting {len(filtered_df):,} points for {observations:,} daily observations.")
 
     # Insights Section
     st.subheader("📌 Key Insights")
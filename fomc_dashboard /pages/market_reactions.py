@@ -2,10 +2,20 @@ import streamlit as st
 from datetime import datetime, timedelta
 import plotly.express as px
 import pandas as pd
+import os
+import sys
+
+# Dynamically add the project root to Python's path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from fomc_dashboard.modules.event_study import MARKET_DIR, event_table, window_label
+from fomc_dashboard.modules.intraday_store import resample_window
+from fomc_dashboard.modules.meeting_calendar import get_calendar
+from fomc_dashboard.modules.profiling import profiled
+from fomc_dashboard.modules.resources import get_resource
 
 # ----------------------------------------
 # Configuration Variables
-FOMC_TARGET_DATE = datetime(2024, 12, 18).date()
 
 # Economic Projections
 economic_projections = {
@@ -21,6 +31,8 @@ economic_projections = {
 
 def display_countdown(target_date):
     """Display a countdown to the FOMC meeting date."""
+    if target_date is None:
+        return "No Upcoming Meeting Scheduled"
     today = datetime.now().date()
     remaining_days = (target_date - today).days
     if remaining_days > 0:
@@ -29,6 +41,83 @@ def display_countdown(target_date):
         return "🚨 FOMC Meeting Today!"
     return "FOMC Meeting Completed"
 
+def event_study_section(result):
+    """Display abnormal market reactions for any FOMC meeting from the precomputed event study."""
+    st.subheader("📊 Market Reactions by FOMC Meeting")
+
+    # Most recent meetings first, skipping those without enough price history
+    valid_events = [i for i in range(len(result["events"]))[::-1] if result["valid"][i]]
+    if not valid_events:
+        st.warning("The local price files do not cover any FOMC meeting.")
+        return
+
+    event_index = st.selectbox(
+        "Select a Meeting:",
+        valid_events,
+        format_func=lambda i: pd.Timestamp(result["events"][i]).strftime("%B %d, %Y"),
+    )
+    st.markdown("""
+    Returns are measured from the first trading day on or after the decision.  
+    **Abnormal** returns subtract each instrument's average daily move over the prior year (days -250 to -11).
+    """)
+    st.table(event_table(result, event_index))
+
+    # Cumulative abnormal return path around the meeting
+    offsets = result["offsets"]
+    path_df = pd.DataFrame(result["abnormal_path"][event_index], columns=result["names"])
+    path_df.insert(0, "Trading Day", offsets)
+    fig = px.line(
+        path_df,
+        x="Trading Day",
+        y=result["names"],
+        title=f"Cumulative Abnormal Return, Days {window_label((offsets[0], offsets[-1]))}",
+        labels={"value": "Cumulative Abnormal Return (% / bps)", "variable": "Instrument"},
+        markers=True
+    )
+    fig.add_vline(x=0, line_dash="dash", line_color="gray")
+    st.plotly_chart(fig)
+
+def intraday_section(store):
+    """Display minute-level moves around the 2:00 pm statement release."""
+    st.subheader("⏱️ Intraday Moves Around the Statement Release")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        symbol = st.selectbox("Instrument:", store.symbols())
+    meetings = store.meetings(symbol)[::-1]
+    if not len(meetings):
+        st.warning(f"No intraday data for {symbol} around any indexed meeting.")
+        return
+    with col2:
+        meeting = st.selectbox(
+            "Meeting:", meetings, format_func=lambda d: pd.Timestamp(d).strftime("%B %d, %Y"), key="intraday_meeting"
+        )
+    with col3:
+        bar_minutes = st.selectbox("Bar Size (minutes):", [1, 5, 15], index=1)
+
+    # Window rows are views into the memory-mapped store; only resampling copies data
+    window = store.window(symbol, meeting)
+    bars = resample_window(window, minutes=bar_minutes)
+    if bars.empty:
+        st.warning("No trades recorded in this window.")
+        return
+    # Reference is the last price before the release; bucket 0 starts at the release, so its close
+    # already includes the first reaction
+    before_release = bars[bars["Minutes From Release"] < 0]
+    reference = before_release["Close"].iloc[-1] if not before_release.empty else bars["Open"].iloc[0]
+    bars["Change (%)"] = (bars["Close"] / reference - 1) * 100
+
+    fig = px.line(
+        bars,
+        x="Time",
+        y="Change (%)",
+        title=f"{symbol}: ±{store.window_minutes} Minutes Around the Statement",
+        labels={"Change (%)": "Change vs. Release (%)", "Time": "Time (ET)"},
+    )
+    release_time = pd.to_datetime(window["center"], utc=True).tz_convert("America/New_York")
+    fig.add_vline(x=release_time, line_dash="dash", line_color="gray")
+    st.plotly_chart(fig)
+
 def market_reactions_section():
     """Display market reactions to the Nov 6-7 FOMC meeting recap."""
     st.subheader("📊 Market Reactions: Nov 6-7 FOMC Recap")
@@ -110,6 +199,7 @@ def fed_analysis_insights():
 
 # ----------------------------------------
 # Streamlit App Layout
+@profiled("market_reactions")
 def main():
     """Render the Streamlit FOMC Insights app."""
     st.set_page_config(page_title="FOMC Insights and Countdown", page_icon="📊", layout="wide")
@@ -117,14 +207,32 @@ def main():
     # Title and countdown
     st.title("⏳ FOMC Countdown & Insights")
     st.markdown("## Countdown to Next FOMC Meeting")
-    countdown = display_countdown(FOMC_TARGET_DATE)
+    calendar = get_calendar()
+    next_meeting = calendar.next_meeting()
+    countdown = display_countdown(next_meeting)
     st.markdown(f"<h2 style='text-align: center; color: #FF5733;'>{countdown}</h2>", unsafe_allow_html=True)
+    if next_meeting:
+        st.markdown(f"<p style='text-align: center;'>Next decision: {next_meeting:%B %d, %Y}</p>", unsafe_allow_html=True)
 
     # Separator
     st.markdown("---")
 
-    # Market Reactions Recap Section
-    market_reactions_section()
+    # Market Reactions Section (falls back to the Nov 6-7 recap without local price files)
+    # Shared across sessions; recomputed only when the price files or past meetings change
+    with st.spinner("Computing market reactions for all meetings..."):
+        result = get_resource("event_study")
+    if result is not None:
+        event_study_section(result)
+    else:
+        st.caption(f"Add daily price files to `{MARKET_DIR}` to analyze every FOMC meeting.")
+        market_reactions_section()
+
+    # Intraday Section (only when the intraday store has been built)
+    intraday_store = get_resource("intraday_store")
+    intraday_store.refresh()
+    if intraday_store.symbols():
+        st.markdown("---")
+        intraday_section(intraday_store)
 
     # Separator
     st.markdown("---")
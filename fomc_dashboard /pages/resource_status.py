@@ -0,0 +1,194 @@
+import streamlit as st
+import pandas as pd
+import os
+import sys
+
+# Dynamically add the project root to Python's path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from fomc_dashboard.modules.metrics import METRICS_HOST, METRICS_PORT, metrics
+from fomc_dashboard.modules.profiling import PROFILE_QUERY_PARAM, aggregator, profiled
+from fomc_dashboard.modules.resources import registry
+from fomc_dashboard.modules.single_flight import completion_flight, retrieval_flight
+from fomc_dashboard.modules.tracing import TRACE_LOG, recent_traces, stage_summary, trace_frame
+
+
+@profiled("resource_status")
+def main():
+    """Render the shared resource status panel."""
+    st.set_page_config(page_title="Resource Status", page_icon="🧰", layout="wide")
+    st.title("🧰 Shared Resource Status")
+    st.markdown("""
+    Models, indexes, clients and datasets are loaded once per server process and shared by every page and session.
+    Hits are requests served from memory; loads count first use plus every reload after a lifetime ended.
+    """)
+
+    stats = registry.stats()
+    loaded = stats[stats["Instances"] > 0]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Loaded Resources", f"{len(loaded)} / {len(stats)}")
+    col2.metric("Estimated Memory", f"{loaded['Memory (MB)'].sum():,.1f} MB")
+    requests = stats["Hits"].sum() + stats["Loads"].sum()
+    col3.metric("Overall Hit Rate", f"{stats['Hits'].sum() / requests:.1%}" if requests else "n/a")
+
+    st.dataframe(
+        stats,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Hit Rate": st.column_config.NumberColumn(format="percent"),
+            "Memory (MB)": st.column_config.NumberColumn(format="%.2f"),
+        },
+    )
+    st.caption("Memory is estimated; memory-mapped stores are counted at their full mapped size.")
+
+    # Identical concurrent questions served by one retrieval / one completion
+    st.subheader("🔗 Request Coalescing")
+    flights = pd.DataFrame([retrieval_flight.stats(), completion_flight.stats()]).set_index("name")
+    col1, col2 = st.columns(2)
+    col1.metric("Retrievals Saved", f"{flights.loc['retrieval', 'coalesced']:,}")
+    col2.metric("LLM Calls Saved", f"{flights.loc['completion', 'coalesced']:,}")
+    st.dataframe(
+        flights.rename(columns={
+            "calls": "Executed", "coalesced": "Saved", "max_waiters": "Max Waiters", "in_flight": "In Flight",
+        }),
+        use_container_width=True,
+    )
+
+    # Answers reused for paraphrased questions, with sampled hits for false-hit review
+    cache = registry.peek("semantic_cache")
+    if cache is not None:
+        st.subheader("🧠 Semantic Answer Cache")
+        cache_stats = cache.stats()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Cached Answers", f"{cache_stats['entries']:,}")
+        col2.metric(
+            "Hit Rate", f"{cache_stats['hit_rate']:.1%}",
+            help=f"{cache_stats['hits']:,} of {cache_stats['lookups']:,} lookups",
+        )
+        col3.metric(
+            "Invalidations", f"{cache_stats['invalidations']:,}", help="Index snapshot changes that emptied the cache"
+        )
+        false_hit_rate = cache_stats["false_hit_rate"]
+        col4.metric(
+            "False-Hit Rate", f"{false_hit_rate:.1%}" if false_hit_rate is not None else "n/a",
+            help=f"Among {cache_stats['reviewed']} reviewed samples",
+        )
+        samples = cache.samples()
+        if samples:
+            st.markdown("**Sampled hits** — tick the ones where the reused answer does not fit the question:")
+            edited = st.data_editor(
+                pd.DataFrame(samples).assign(false_hit=lambda df: df["false_hit"].fillna(False).astype(bool)),
+                column_order=["time", "question", "cached_question", "distance", "false_hit"],
+                column_config={
+                    "time": "Time",
+                    "question": "Question",
+                    "cached_question": "Answered As",
+                    "distance": st.column_config.NumberColumn("Distance", format="%.3f"),
+                    "false_hit": st.column_config.CheckboxColumn("False Hit"),
+                },
+                disabled=["time", "question", "cached_question", "distance"],
+                hide_index=True,
+                use_container_width=True,
+                key="semantic_cache_samples",
+            )
+            if st.button("Save review"):
+                for sample_id, false_hit in zip(edited["id"], edited["false_hit"]):
+                    cache.review(int(sample_id), false_hit)
+                st.rerun()
+        if st.button("Clear semantic cache"):
+            cache.clear()
+            st.rerun()
+
+    # Meeting digests answering "what happened at the <month> <year> meeting" without retrieval
+    digests = registry.peek("digest_store")
+    if digests is not None:
+        st.subheader("📒 Meeting Digests")
+        frame = digests.frame()
+        st.metric("Meetings with a Digest", f"{len(frame):,}")
+        st.dataframe(frame, use_container_width=True, hide_index=True)
+        st.caption(f"Rebuilt offline with `python -m fomc_dashboard.modules.meeting_digest`; stored in {digests.db_file}.")
+
+    # Micro-batching metrics of the shared query encoder
+    encoder = registry.peek("batch_encoder")
+    if encoder is not None:
+        st.subheader("⚙️ Query Encoder Batching")
+        encoder_stats = encoder.stats()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Encode Requests", f"{encoder_stats['requests']:,}")
+        col2.metric("Forward Passes", f"{encoder_stats['batches']:,}")
+        col3.metric("Mean Batch Size", f"{encoder_stats['mean_batch_size']:.1f}")
+        col4.metric("Queue Delay p95", f"{encoder_stats['queue_delay_ms']['p95']:.1f} ms")
+        histogram = encoder_stats["batch_size_histogram"]
+        if histogram:
+            st.bar_chart(
+                pd.DataFrame({"Batches": list(histogram.values())}, index=pd.Index(list(histogram), name="Batch Size"))
+            )
+
+    # Per-stage latency of recent questions answered by this server process
+    traces = recent_traces("answer_question")
+    if traces:
+        st.subheader("⏱️ Question Latency by Stage")
+        st.dataframe(stage_summary(traces), use_container_width=True, hide_index=True)
+        labels = [f"{trace['timestamp']} · {trace['duration_ms']:,.0f} ms" for trace in traces]
+        choice = st.selectbox("Trace:", range(len(traces)), format_func=lambda i: labels[i])
+        st.dataframe(trace_frame(traces[choice]), use_container_width=True, hide_index=True)
+        st.caption(f"All traces are appended to {TRACE_LOG}.")
+
+    # Current values of the Prometheus metrics (enabled with FOMC_METRICS=1)
+    if metrics.enabled:
+        st.subheader("📈 Metrics")
+        st.caption(f"Scraped by Prometheus from http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+        st.dataframe(
+            pd.DataFrame(
+                [
+                    {"Metric": name, "Labels": ", ".join(f"{k}={v}" for k, v in labels.items()), "Value": value}
+                    for name, labels, value in metrics.samples()
+                ],
+                columns=["Metric", "Labels", "Value"],
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+    # Page profiles merged across reruns and sessions (FOMC_PROFILE=1 or ?profile=1 on a page)
+    pages = aggregator.pages()
+    if not pages.empty:
+        st.subheader("🔬 Page Profiles")
+        st.dataframe(
+            pages,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Mean (ms)": st.column_config.NumberColumn(format="%.1f"),
+                "Max (ms)": st.column_config.NumberColumn(format="%.1f"),
+                "Total (s)": st.column_config.NumberColumn(format="%.2f"),
+            },
+        )
+        col1, col2 = st.columns(2)
+        page = col1.selectbox("Page:", pages["Page"])
+        sort = col2.radio("Sort by:", ["own", "cumulative"], horizontal=True, format_func=str.capitalize)
+        st.dataframe(aggregator.hot_functions(page, sort=sort), use_container_width=True, hide_index=True)
+        col1, col2 = st.columns(2)
+        col1.download_button(
+            "Download stats (.prof)", aggregator.dump(page), file_name=f"{page}.prof",
+            mime="application/octet-stream",
+        )
+        if col2.button("Reset profiles"):
+            aggregator.reset()
+            st.rerun()
+        if aggregator.skipped:
+            st.caption(f"{aggregator.skipped} reruns ran unprofiled because another rerun was being profiled.")
+    else:
+        st.caption(f"Open any page with ?{PROFILE_QUERY_PARAM}=1 (or set FOMC_PROFILE=1) to collect page profiles.")
+
+    # Manual release, e.g. after rebuilding an index outside the app
+    with st.expander("Release a resource"):
+        name = st.selectbox("Resource:", stats["Resource"])
+        if st.button("Release"):
+            registry.release(name)
+            st.success(f"Released '{name}'; it will be reloaded on next use.")
+
+
+if __name__ == "__main__":
+    main()
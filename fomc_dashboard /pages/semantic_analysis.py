@@ -1,83 +1,115 @@
 import streamlit as st
-import re
-import PyPDF2
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+import os
+import sys
 import pandas as pd
 import plotly.express as px
 
-# Predefined Hawkish/Dovish Words for Classification
-hawkish_terms = {
-    "tighten": 1, "inflation": 1, "rate hike": 2, "restrictive policy stance": 2,
-    "elevated inflation": 2, "tight financial conditions": 2, "labor market tightness": 1
-}
-dovish_terms = {
-    "accommodative": 1, "stimulus": 1, "easing": 1, "economic cooling": 2,
-    "slowing economic activity": 2, "lower unemployment risks": 1, "supply-demand pressures easing": 2
-}
-
-# Clean text
-def clean_text(text):
-    text = re.sub(r"\s+", " ", text)  # Remove extra whitespaces
-    text = re.sub(r"[^a-zA-Z\s]", "", text)  # Remove special characters
-    text = text.lower()  # Convert to lowercase
-    return text
-
-# Sentiment Classification
-def classify_sentiment(text):
-    cleaned_text = clean_text(text)
-    hawkish_score = sum(cleaned_text.count(term) * weight for term, weight in hawkish_terms.items())
-    dovish_score = sum(cleaned_text.count(term) * weight for term, weight in dovish_terms.items())
-
-    if hawkish_score > dovish_score:
-        return "Hawkish", hawkish_score, dovish_score
-    elif dovish_score > hawkish_score:
-        return "Dovish", hawkish_score, dovish_score
-    else:
-        return "Neutral", hawkish_score, dovish_score
+# Dynamically add the project root to Python's path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
-# Extract text from PDF
-def extract_text_from_pdf(pdf_file):
-    pdf_reader = PyPDF2.PdfReader(pdf_file)
-    text = ""
-    for page in pdf_reader.pages:
-        text += page.extract_text()
-    return text
+from fomc_dashboard.modules.ngram_index import MAX_NGRAM
+from fomc_dashboard.modules.profiling import profiled
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.sentiment import hawkish_terms, dovish_terms, analyze_chunks
+from fomc_dashboard.modules.word_cloud import render_word_cloud_png
+from fomc_dashboard.modules.document_reader import MAX_UPLOAD_BYTES, iter_text_chunks, iter_pdf_pages
 
-# Streamlit App
-st.title("📊 FOMC Sentiment Analysis Tool")
-st.markdown("""
-Analyze FOMC meeting minutes to assess the Hawkish or Dovish sentiment.  
-Upload a document, and we'll do the rest! 🚀
-""")
+# Word Cloud (cached per document hash; arguments starting with "_" are not hashed)
+@st.cache_data(show_spinner=False)
+def get_word_cloud_png(doc_hash, _frequencies):
+    return render_word_cloud_png(_frequencies)
+
+# Stream the upload through the analyzer, reporting progress as it is read
+def analyze_upload(uploaded_file, progress_bar):
+    def report_progress(done, total):
+        if total:
+            progress_bar.progress(min(int(75 * done / total), 75))
+
+    if uploaded_file.name.endswith(".txt"):
+        chunks = iter_text_chunks(uploaded_file, progress_callback=report_progress)
+    elif uploaded_file.name.endswith(".pdf"):
+        chunks = iter_pdf_pages(uploaded_file, progress_callback=report_progress)
+    else:
+        raise ValueError("Unsupported file format.")
+    return analyze_chunks(chunks)
+
+# Phrase frequency at every indexed meeting, from the precomputed n-gram postings
+def render_term_trends():
+    st.markdown(f"""
+    Track how often phrases of up to {MAX_NGRAM} words appear in the minutes, meeting by meeting.  
+    Separate several phrases with commas.
+    """)
+    index = get_resource("ngram_index")
+    if not index.available:
+        st.info(
+            "No phrase counts yet. Build the year shards and run "
+            "`python -m fomc_dashboard.modules.ngram_index` to count them."
+        )
+        return
+
+    phrases = st.text_input("Phrases:", value="transitory")
+    phrases = list(dict.fromkeys(phrase.strip() for phrase in phrases.split(",") if phrase.strip()))
+    years = index.meetings.astype("datetime64[Y]").astype(int) + 1970
+    first, last = int(years.min()), int(years.max())
+    col1, col2 = st.columns([2, 1])
+    if first < last:
+        start, end = col1.slider("Years:", first, last, (first, last))
+    else:
+        start, end = first, last
+    measure = col2.radio("Show:", ["Per 10k words", "Count"], horizontal=True)
+    if not phrases:
+        return
+
+    try:
+        trend = index.trend(phrases, f"{start}-01-01", f"{end}-12-31")
+    except ValueError as e:
+        st.warning(str(e))
+        return
+    fig = px.line(
+        trend, x="Meeting", y=measure, color="Phrase", markers=True,
+        title=f"Phrase Usage by Meeting, {start}–{end}",
+    )
+    st.plotly_chart(fig)
+    totals = trend.groupby("Phrase", sort=False)["Count"].sum()
+    st.caption(" · ".join(f"**{phrase}**: {count:,} mentions" for phrase, count in totals.items()))
 
-# File Upload
-uploaded_file = st.file_uploader("Upload a file (TXT or PDF format)", type=["txt", "pdf"])
+# Score one uploaded document
+def render_upload_analysis():
+    st.markdown(f"""
+    Analyze FOMC meeting minutes to assess the Hawkish or Dovish sentiment.  
+    Upload a document (up to {MAX_UPLOAD_BYTES // 1024 // 1024} MB), and we'll do the rest! 🚀
+    """)
+
+    # File Upload
+    uploaded_file = st.file_uploader("Upload a file (TXT or PDF format)", type=["txt", "pdf"])
+    if not uploaded_file:
+        return
 
-if uploaded_file:
     # Progress Bar
     progress_bar = st.progress(0)
-    progress_bar.progress(20)
 
-    # Determine file type and extract text
-    if uploaded_file.name.endswith(".txt"):
-        text = uploaded_file.read().decode("utf-8")
-    elif uploaded_file.name.endswith(".pdf"):
-        text = extract_text_from_pdf(uploaded_file)
+    # Analyze each upload once; reruns reuse the result kept in the session
+    cached = st.session_state.get("semantic_analysis")
+    if cached and cached[0] == uploaded_file.file_id:
+        analysis = cached[1]
     else:
-        st.error("Unsupported file format.")
-        st.stop()
+        try:
+            analysis = analyze_upload(uploaded_file, progress_bar)
+        except ValueError as e:
+            st.error(f"Could not analyze the uploaded file: {e}")
+            st.stop()
+        st.session_state["semantic_analysis"] = (uploaded_file.file_id, analysis)
 
-    progress_bar.progress(50)
+    progress_bar.progress(75)
 
     # Check if text was extracted
-    if not text.strip():
+    if not analysis["word_frequencies"]:
         st.error("No text could be extracted from the uploaded file. Please ensure the file contains readable text.")
         st.stop()
 
-    # Sentiment Analysis
-    sentiment, hawkish_score, dovish_score = classify_sentiment(text)
-    progress_bar.progress(75)
+    sentiment = analysis["sentiment"]
+    hawkish_score = analysis["hawkish_score"]
+    dovish_score = analysis["dovish_score"]
 
     # Display Results
     st.subheader(f"📈 Sentiment Analysis Result: **{sentiment}**")
@@ -86,15 +118,7 @@ if uploaded_file:
 
     # Word Cloud Section (Moved Up)
     st.subheader("Word Cloud of Uploaded Document")
-    cleaned_text = clean_text(text)
-    if cleaned_text.strip():
-        wordcloud = WordCloud(background_color="white", width=800, height=400).generate(cleaned_text)
-        plt.figure(figsize=(10, 5))
-        plt.imshow(wordcloud, interpolation="bilinear")
-        plt.axis("off")
-        st.pyplot(plt)
-    else:
-        st.error("Unable to generate a word cloud as the cleaned text is empty.")
+    st.image(get_word_cloud_png(analysis["doc_hash"], analysis["word_frequencies"]))
 
     # Dynamic Bar Chart for Scores
     st.subheader("Sentiment Score Comparison")
@@ -109,12 +133,23 @@ if uploaded_file:
     )
     st.plotly_chart(fig)
 
+    # Sentence-Level Drivers
+    st.subheader("Top Contributing Passages")
+    for side in ["hawkish", "dovish"]:
+        top = pd.DataFrame(analysis[f"top_{side}"], columns=["Sentence", "Score"])
+        st.write(f"**Most {side.capitalize()} Sentences:**")
+        if top.empty:
+            st.info(f"No {side} terms found in any sentence.")
+        else:
+            st.table(top)
+
     progress_bar.progress(90)
 
     # Keyword Analysis
     st.subheader("Keyword Frequency Analysis")
-    hawkish_found = {term: cleaned_text.count(term) for term in hawkish_terms if term in cleaned_text}
-    dovish_found = {term: cleaned_text.count(term) for term in dovish_terms if term in cleaned_text}
+    term_counts = analysis["term_counts"]
+    hawkish_found = {term: term_counts[term] for term in hawkish_terms if term_counts[term]}
+    dovish_found = {term: term_counts[term] for term in dovish_terms if term_counts[term]}
 
     hawkish_df = pd.DataFrame(list(hawkish_found.items()), columns=["Term", "Frequency"])
     dovish_df = pd.DataFrame(list(dovish_found.items()), columns=["Term", "Frequency"])
@@ -126,3 +161,17 @@ if uploaded_file:
     st.table(dovish_df)
 
     progress_bar.progress(100)
+
+# Streamlit App
+@profiled("semantic_analysis")
+def main():
+    st.title("📊 FOMC Sentiment Analysis Tool")
+    upload_tab, trends_tab = st.tabs(["📄 Analyze a Document", "📈 Term Usage Over Time"])
+    # Trends first: the upload flow may stop the script
+    with trends_tab:
+        render_term_trends()
+    with upload_tab:
+        render_upload_analysis()
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,15 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 import os
+import sys
+
+# Dynamically add the project root to Python's path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from fomc_dashboard.modules.document_mirror import get_mirror
+from fomc_dashboard.modules.profiling import profiled
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.sep_store import SEP_BASE_URL, SEP_LIBRARY, horizon_label
 
 # Set up the page configuration
 st.set_page_config(
@@ -28,29 +37,26 @@ def render_projections():
     These projections reflect the balance of risks between controlling inflation and fostering employment.
     """)
 
-    # Data preparation
-    data = {
-        "Rate (%)": [
-            "2-2.25", "2.25-2.5", "2.5-2.75", "2.75-3", "3.0-3.25", "3.25-3.5",
-            "3.5-3.75", "3.75-4", "4-4.25", "4.25-4.5", "4.5-4.75", "4.75-5",
-            "5.25-5.5", "5.5-5.75", "5.75-6"
-        ],
-        "2024": [0, 0, 0, 0, 0, 0, 0, 0, 1, 9, 7, 2, 0, 0, 0],
-        "2025": [0, 0, 0, 0, 2, 6, 6, 3, 1, 1, 0, 0, 0, 0, 0],
-        "2026": [0, 1, 3, 6, 2, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0],
-        "2027": [0, 2, 3, 5, 2, 3, 3, 1, 0, 0, 0, 0, 0, 0, 0],
-    }
-
-    # Convert data to DataFrame and reshape it
-    df = pd.DataFrame(data)
-    df_melted = df.melt(id_vars=["Rate (%)"], var_name="Year", value_name="Count")
-
-    # User selection for year
+    # Histograms and statistics are precomputed offline (modules/sep_store.py)
+    store = get_resource("sep_store")
+    store.refresh()
+    if store.is_seed:
+        st.caption("Showing the built-in September 2024 dot plot; run `python -m fomc_dashboard.modules.sep_store` to parse the SEP library.")
+
+    # User selection for meeting and year
     st.subheader("🔍 Explore Projections by Year")
-    selected_year = st.selectbox("📅 **Select a Year:**", options=["2024", "2025", "2026", "2027"])
+    col1, col2 = st.columns(2)
+    meetings = store.meetings()
+    selected_meeting = col1.selectbox(
+        "🗓️ **Select an SEP Meeting:**",
+        options=meetings,
+        format_func=lambda m: pd.Timestamp(m).strftime("%B %d, %Y"),
+    )
+    horizons = store.horizons(selected_meeting)
+    selected_horizon = col2.selectbox("📅 **Select a Year:**", options=horizons, format_func=horizon_label)
+    selected_year = horizon_label(selected_horizon)
 
-    # Filter data for the selected year
-    filtered_data = df_melted[(df_melted["Year"] == selected_year) & (df_melted["Count"] > 0)]
+    filtered_data = store.histogram(selected_meeting, selected_horizon)
 
     # Show a warning if no data is available
     if filtered_data.empty:
@@ -76,6 +82,16 @@ def render_projections():
     )
     st.plotly_chart(fig, use_container_width=True)
 
+    # Dispersion of the dots for every horizon of the selected meeting
+    summary = store.summary(selected_meeting)
+    row = summary[summary["Horizon"] == selected_year].iloc[0]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Median Dot", f"{row['Median']:.3f}%")
+    col2.metric("Interquartile Range", f"{row['75th Pct'] - row['25th Pct']:.2f} pp")
+    col3.metric("Participants", int(row["Participants"]))
+    with st.expander("Median and dispersion by year"):
+        st.dataframe(summary, use_container_width=True, hide_index=True)
+
     # Insights Section
     st.subheader("📌 Key Takeaways")
     st.markdown(f"""
@@ -96,25 +112,20 @@ def render_library():
     These files are essential for understanding the Fed's approach to inflation, employment, and overall economic stability.
     """)
 
-    # FOMC meeting dates and corresponding SEP file names
-    fomc_meetings = [
-        {"Date": "January 31, 2023", "File Name": "fomcprojtabl20230131.pdf"},
-        {"Date": "March 22, 2023", "File Name": "fomcprojtabl20230322.pdf"},
-        {"Date": "June 14, 2023", "File Name": "fomcprojtabl20230614.pdf"},
-        {"Date": "September 20, 2023", "File Name": "fomcprojtabl20230920.pdf"},
-        {"Date": "December 13, 2023", "File Name": "fomcprojtabl20231213.pdf"},
-        {"Date": "March 20, 2024", "File Name": "fomcprojtabl20240320.pdf"},
-        {"Date": "June 19, 2024", "File Name": "fomcprojtabl20240619.pdf"},
-        {"Date": "September 18, 2024", "File Name": "fomcprojtabl20240918.pdf"},
-        {"Date": "December 11, 2024", "File Name": "fomcprojtabl20241211.pdf"},
-    ]
-
-    # Base URL for SEP files
-    base_url = "https://www.federalreserve.gov/monetarypolicy/files/"
+    # Local mirror: verifies and fills in missing PDFs in the background, serves them with range support
+    mirror = get_mirror()
+    progress = mirror.start_prefetch()
+    st.caption(
+        f"📦 Local mirror: {progress['done']} of {progress['total'] or '…'} SEP, minutes and statement files cached"
+        + (f", {len(progress['failed'])} unavailable" if progress["failed"] else "")
+        + (" (downloading…)" if progress["running"] else "")
+    )
 
     # Create a DataFrame
-    df = pd.DataFrame(fomc_meetings)
-    df["Download Link"] = df["File Name"].apply(lambda x: base_url + x)
+    df = pd.DataFrame(SEP_LIBRARY)
+    df["Download Link"] = df["File Name"].apply(lambda x: SEP_BASE_URL + x)
+    df["Local Copy"] = df["File Name"].apply(lambda x: mirror.url("sep", x))
+    df["Cached"] = df["File Name"].apply(lambda x: mirror.local_path("sep", x) is not None)
 
     # Selection Box
     st.subheader("📥 Download SEP Files by Meeting Date")
@@ -125,19 +136,39 @@ def render_library():
         selected_row = df[df["Date"] == selected_date]
         selected_file = selected_row["File Name"].values[0]
         selected_link = selected_row["Download Link"].values[0]
+        local_link = selected_row["Local Copy"].values[0]
+        local_path = mirror.local_path("sep", selected_file)
 
         # Show the selected file details
         st.write(f"**Selected Meeting Date:** {selected_date}")
         st.write(f"**File Name:** {selected_file}")
-        st.markdown(f"[Click here to download the file]({selected_link})", unsafe_allow_html=True)
+        if local_link:
+            # Side file server opted in (FOMC_FILE_BASE_URL): byte-range links
+            st.markdown(f"[Open the local copy]({local_link}) · [Fed original]({selected_link})", unsafe_allow_html=True)
+        elif local_path:
+            # Served by Streamlit itself, so it works wherever the dashboard does
+            with open(local_path, "rb") as f:
+                st.download_button("⬇️ Download the local copy", f.read(), file_name=selected_file, mime="application/pdf")
+            st.markdown(f"[Fed original]({selected_link})", unsafe_allow_html=True)
+        else:
+            st.markdown(f"[Click here to download the file]({selected_link})", unsafe_allow_html=True)
 
         # Display the full table
         st.subheader("📋 Full List of Available SEP Files")
-        st.dataframe(df[["Date", "File Name", "Download Link"]], use_container_width=True)
+        columns = ["Date", "File Name", "Download Link", "Local Copy" if df["Local Copy"].any() else "Cached"]
+        st.dataframe(
+            df[columns],
+            use_container_width=True,
+            column_config={
+                "Download Link": st.column_config.LinkColumn(),
+                "Local Copy": st.column_config.LinkColumn(),
+            },
+        )
     else:
         st.info("Please select a date to view details and access the full table.")
 
 # Render the combined app
+@profiled("sep_projections")
 def main():
     st.sidebar.title("📋 Navigation")
     option = st.sidebar.radio(
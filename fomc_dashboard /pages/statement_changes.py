@@ -0,0 +1,82 @@
+import pandas as pd
+import streamlit as st
+import os
+import sys
+
+# Dynamically add the project root to Python's path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+
+from fomc_dashboard.modules.profiling import profiled
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.statement_diff import DOCUMENT_KINDS, highlight_changes, summarize
+
+
+def _escape(text):
+    # Keep dollar amounts from being rendered as LaTeX
+    return text.replace("$", "\\$")
+
+
+def _meeting_label(meeting):
+    return pd.Timestamp(meeting).strftime("%B %d, %Y")
+
+
+def render_row(row):
+    """Render one aligned sentence of a diff."""
+    if row["change"] == "added":
+        st.markdown(f":green[**+** {_escape(row['text'])}]")
+    elif row["change"] == "removed":
+        st.markdown(f":red[**−** ~~{_escape(row['previous'])}~~]")
+    elif row["change"] == "modified":
+        st.markdown(f":orange[**~**] {_escape(highlight_changes(row['previous'], row['text']))}")
+        st.caption(f"Similarity {row['similarity']:.2f}")
+    else:
+        st.markdown(f":gray[{_escape(row['text'])}]")
+
+
+@profiled("statement_changes")
+def main():
+    """Render the statement diff page."""
+    st.set_page_config(page_title="What Changed", page_icon="🔍", layout="wide")
+    st.title("🔍 What Changed Since the Last Meeting")
+    st.markdown("""
+    Compare the **policy statement** (or the full **minutes**) of any two FOMC meetings sentence by sentence.
+    Sentences are aligned by meaning, so a reworded sentence shows up as **modified** with the changed words marked,
+    rather than as one sentence removed and another added.
+    The statement is the press release issued on the meeting day when it has been mirrored, otherwise the text quoted in the minutes.
+    """)
+
+    # Sentence embeddings and consecutive-meeting diffs are precomputed offline (modules/statement_diff.py)
+    store = get_resource("diff_store")
+    kind = st.radio("Document:", list(DOCUMENT_KINDS), format_func=DOCUMENT_KINDS.get, horizontal=True)
+    meetings = store.meetings(kind)
+    if len(meetings) < 2:
+        st.info(
+            "No diffs yet. Mirror the minutes and statements (SEP Library page) and run "
+            "`python -m fomc_dashboard.modules.statement_diff` to precompute them."
+        )
+        return
+
+    col1, col2 = st.columns(2)
+    current = col1.selectbox("🗓️ **Meeting:**", meetings[1:][::-1], format_func=_meeting_label)
+    earlier = [meeting for meeting in meetings if meeting < current][::-1]
+    previous = col2.selectbox("↔️ **Compared with:**", earlier, format_func=_meeting_label)
+
+    rows = store.diff(previous, current, kind)
+    counts = summarize(rows)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Added", counts["added"])
+    col2.metric("Removed", counts["removed"])
+    col3.metric("Modified", counts["modified"])
+    col4.metric("Unchanged", counts["unchanged"])
+
+    show_unchanged = st.checkbox("Show unchanged sentences", value=kind == "statement")
+    st.markdown("---")
+    for row in rows:
+        if show_unchanged or row["change"] != "unchanged":
+            render_row(row)
+    if not any(row["change"] != "unchanged" for row in rows):
+        st.success("No changes between the two documents.")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,21 @@ import sys
 # Dynamically add the project root to Python's path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
-from fomc_dashboard.modules.ai_responder import AzureOpenAIHelper
-from fomc_dashboard.modules.sentence_transformer import query_faiss
-
+from fomc_dashboard.modules.assets import asset_path
+from fomc_dashboard.modules.profiling import profiled
+from fomc_dashboard.modules.qa_pipeline import answer_question
+from fomc_dashboard.modules.resources import get_resource
+from fomc_dashboard.modules.tracing import trace_frame
+from fomc_dashboard.modules.warmup import get_warmup
+
+@profiled("app")
 def main():
     # Page Configuration
     st.set_page_config(page_title="RateRadar: FOMC Insights", page_icon="📡", layout="wide")
 
+    # Start preloading the encoder, index and client in the background (once per server process)
+    warmup = get_warmup()
+
     # Custom Styling for UX Enhancements
     st.markdown("""
         <style>
@@ -60,11 +68,10 @@ def main():
 
     st.markdown("---")
 
-    # Absolute Path for Image
-    absolute_image_path = "D:/PythonProject2/fomc_dashboard/assets/powell.jpg"  # Full path to the image
+    # Powell photo from the package assets, resized once and served by Streamlit itself
     try:
         st.image(
-            absolute_image_path,
+            asset_path("powell.jpg"),
             caption="Chairman Jerome Powell, Federal Reserve",
             width=500  # Resize the image
         )
@@ -81,11 +88,18 @@ def main():
         st.warning("⚠️ Please enter your API key to start using the assistant.")
         return
 
-    # Initialize AI Responder
-    ai_helper = AzureOpenAIHelper(api_key=api_key)
+    # Shared AI Responder for this API key (one client per key across reruns and sessions)
+    ai_helper = get_resource("llm_client", api_key)
 
     # Main Chat Assistant Section
     st.subheader("🤖 Your Personalized FOMC Assistant")
+    if not warmup.finished:
+        st.info("⏳ The assistant is still warming up; your first answer may take a little longer.")
+    elif not warmup.ready:
+        status = warmup.status()
+        failed = {name: step["error"] for name, step in status["steps"].items() if step["error"]}
+        retry = f" Retrying in {status['retry_in_s']:.0f}s." if status["retry_in_s"] is not None else ""
+        st.warning(f"⚠️ Warm-up did not complete: {failed}.{retry}")
     st.markdown("""
     - Ask questions about **FOMC meetings**, interest rates, or economic trends.  
     - Get real-time insights tailored for **traders**, **investors**, and **economy enthusiasts**.  
@@ -110,30 +124,28 @@ def main():
     if user_question:
         with st.spinner("⏳ Gathering insights for you..."):
             try:
-                # Query FAISS for context
-                faiss_results = query_faiss(user_question)
-                if not faiss_results:
-                    response_placeholder.error("No relevant data found for your query.")
-                    return
+                # Query FAISS for context and get the AI response
+                result = answer_question(user_question, ai_helper)
 
-                # Combine FAISS results into context
-                context = "\n".join([result['text'] for result in faiss_results])
+                # Per-stage timing breakdown, shown when the page is opened with ?debug=1
+                if result["trace"] and st.query_params.get("debug") == "1":
+                    with col2.expander("⏱️ Timing Breakdown"):
+                        st.dataframe(trace_frame(result["trace"]), hide_index=True, use_container_width=True)
 
-                # Combine context and question into a prompt
-                combined_prompt = f"Context: {context}\n\nQuestion: {user_question}\n\nAnswer concisely as a personal assistant."
-
-                # Get AI Response
-                ai_response = ai_helper.get_response(
-                    message=combined_prompt,
-                    instruction="You are an assistant providing insights on FOMC meetings, interest rates, and economic policy.",
-                    temperature=0.7
-                )
+                if not result["sources"] and not result["digest_meeting"]:
+                    response_placeholder.error("No relevant data found for your query.")
+                    return
+                ai_response = result["answer"]
 
                 # Display AI Response
                 if ai_response:
                     response_placeholder.markdown(f"""
                     <div class="response-box">{ai_response}</div>
                     """, unsafe_allow_html=True)
+                    if result["digest_meeting"]:
+                        col2.caption(f"📒 Answered from the precomputed digest of the {result['digest_meeting']} meeting.")
+                    if result["cached_question"]:
+                        col2.caption(f"⚡ Reused the answer to a similar question: \"{result['cached_question']}\"")
                 else:
                     response_placeholder.error("Sorry, I could not retrieve a response. Please try again.")
 
@@ -1,24 +1,29 @@
 import streamlit as st
-import base64
+
+from fomc_dashboard.modules.assets import BACKGROUND_WIDTH, asset_url
 
 
 def set_background(image_path):
     """
     Set a background image for the Streamlit app.
 
+    The image is resized and recompressed once, then referenced from the
+    dashboard's own origin: through Streamlit's static serving when it is
+    enabled (a content-hashed URL the browser caches), otherwise as a data
+    URI of the optimized copy.
+
     Args:
-        image_path (str): Absolute path to the local image file.
+        image_path (str): Image file name in the assets folder (e.g. "FOMC.png") or an absolute path.
     """
-    # Read and encode the image file
-    with open(image_path, "rb") as image_file:
-        encoded_image = base64.b64encode(image_file.read()).decode()
+    # Cacheable URL of the optimized image
+    image_url = asset_url(image_path, max_width=BACKGROUND_WIDTH)
 
     # Inject CSS into the Streamlit app
     st.markdown(
         f"""
         <style>
             .stApp {{
-                background-image: url("data:image/png;base64,{encoded_image}");
+                background-image: url("{image_url}");
                 background-size: cover;
                 background-repeat: no-repeat;
                 background-attachment: fixed;